@@ -0,0 +1,49 @@
+"""Comparison of benchmark suite results with baseline results."""
+from dataclasses import dataclass
+from typing import Iterator
+
+_Metrics = dict[str, float]
+# Measurements: dataset size -> endpoint -> metric -> measured value.
+Measurements = dict[str, dict[str, _Metrics]]
+
+# Greater values of these metrics are better, greater values of other metrics are worse.
+_HIGHER_IS_BETTER = frozenset(('throughput_rps',))
+
+
+@dataclass(frozen=True)
+class Change(object):
+    """Change of metric of endpoint on dataset from baseline to current results."""
+
+    size: str
+    endpoint: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Return relative change of current value to baseline value."""
+        if not self.baseline:
+            return 0
+        return self.current / self.baseline - 1
+
+    def is_regression(self, threshold: float) -> bool:
+        """Check that metric became worse by more than threshold share of baseline value."""
+        if self.metric in _HIGHER_IS_BETTER:
+            return self.ratio < -threshold
+        return self.ratio > threshold
+
+
+def changes(baseline: Measurements, current: Measurements) -> Iterator[Change]:
+    """Yield changes of metrics measured in both baseline and current measurements."""
+    for size, endpoints in current.items():
+        baseline_endpoints = baseline.get(size, {})
+        for endpoint, metrics in endpoints.items():
+            yield from _endpoint_changes(size, endpoint, baseline_endpoints.get(endpoint, {}), metrics)
+
+
+def _endpoint_changes(size: str, endpoint: str, baseline: _Metrics, current: _Metrics) -> Iterator[Change]:
+    for metric, current_value in current.items():
+        baseline_value = baseline.get(metric)
+        if baseline_value is not None:
+            yield Change(size, endpoint, metric, baseline_value, current_value)
@@ -0,0 +1,83 @@
+"""Database with dictionaries for benchmarks."""
+import datetime
+import os
+
+import django
+
+_BATCH_SIZE = 10000
+DAYS_IN_YEAR = 365
+
+
+def setup(database_url: str) -> None:
+    """Set up Django with production settings and migrate database."""
+    os.environ['DATABASE_URL'] = database_url
+    os.environ['DJANGO_ENV'] = 'production'
+    os.environ.setdefault('DJANGO_SECRET_KEY', 'benchmark')
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+    django.setup()
+    from django.core.management import call_command  # noqa: WPS433
+
+    call_command('migrate', verbosity=0)
+
+
+def seed(database_url: str, elements: int) -> int:
+    """Set up Django with production settings, create one dictionary with current version of elements.
+
+    Returns identifier of dictionary, database should be empty.
+    """
+    setup(database_url)
+    from server.apps.dictionaries import services  # noqa: WPS433
+    from server.apps.dictionaries.models import Dictionary  # noqa: WPS433
+
+    dictionary = Dictionary.objects.create(code='benchmark', name='Benchmark')
+    version = services.dictionary_version_import_prepare(
+        dictionary=dictionary,
+        version='1',
+        date=datetime.date.today(),
+    )
+    services.dictionary_version_import(
+        version_id=version.id,
+        elements=(
+            ('code_{0}'.format(index), 'value_{0}'.format(index))
+            for index in range(elements)
+        ),
+    )
+    return dictionary.id
+
+
+def seed_versions(database_url: str, dictionaries: int, versions: int) -> datetime.date:
+    """Set up Django with production settings, create dictionaries with weekly versions.
+
+    First versions of dictionaries start on different days of a year. Returns start date
+    of the first version, database should be empty.
+    """
+    setup(database_url)
+    from django.db import transaction  # noqa: WPS433
+
+    from server.apps.dictionaries import services  # noqa: WPS433
+    from server.apps.dictionaries.models import Dictionary, DictionaryVersion  # noqa: WPS433
+
+    start_date = datetime.date.today() - datetime.timedelta(weeks=versions, days=DAYS_IN_YEAR)
+    with transaction.atomic():
+        Dictionary.objects.bulk_create(
+            [
+                Dictionary(code='code_{0}'.format(index), name='Dictionary {0}'.format(index))
+                for index in range(dictionaries)
+            ],
+            batch_size=_BATCH_SIZE,
+        )
+        dictionary_ids = list(Dictionary.objects.values_list('id', flat=True))
+        # Versions are created by batches of dictionaries, so instances of all versions are not kept in memory.
+        batch_size = max(1, _BATCH_SIZE // versions)
+        for batch_start in range(0, len(dictionary_ids), batch_size):
+            DictionaryVersion.objects.bulk_create([
+                DictionaryVersion(
+                    dictionary_id=dictionary_id,
+                    version=str(index),
+                    date=start_date + datetime.timedelta(days=dictionary_id % DAYS_IN_YEAR, weeks=index),
+                )
+                for dictionary_id in dictionary_ids[batch_start:batch_start + batch_size]
+                for index in range(versions)
+            ])
+        services.dictionary_current_version_refresh()
+    return start_date
@@ -0,0 +1,92 @@
+"""Seeded datasets and endpoints of benchmark suite."""
+from types import MappingProxyType
+from typing import NamedTuple
+from urllib.parse import urlencode
+
+# Dataset sizes: dictionaries, max versions of a dictionary, elements of all versions.
+SIZES = MappingProxyType({
+    'small': (100, 5, 100000),
+    'medium': (1000, 10, 1000000),
+    'large': (5000, 10, 10000000),
+})
+
+
+class Endpoint(NamedTuple):
+    """Path of request, cookie and whether caches are cleared before every request."""
+
+    path: str
+    cookie: str = ''
+    cold: bool = False
+
+
+_CODE_PREFIX = 'benchmark'
+_ADMIN_USERNAME = 'benchmark'
+_ADMIN_DICTIONARIES_PATH = '/admin/dictionaries/dictionary/'
+_ADMIN_VERSIONS_PATH = '/admin/dictionaries/dictionaryversion/'
+
+
+def reseed(size: str, *, seed: int) -> None:
+    """Replace data of database by synthetic dictionaries of seed_dictionaries command of size."""
+    from django.core.management import call_command  # noqa: WPS433
+
+    from server.apps.dictionaries import seeding  # noqa: WPS433
+
+    call_command('flush', interactive=False, verbosity=0)
+    dictionaries, versions, elements = SIZES[size]
+    seeding.seed_dictionaries(seeding.SeedConfig(
+        dictionaries=dictionaries,
+        versions=versions,
+        elements=elements,
+        seed=seed,
+        code_prefix=_CODE_PREFIX,
+    ))
+
+
+def admin_session_cookie() -> str:
+    """Create superuser and return session cookie of logged in superuser."""
+    from django.conf import settings  # noqa: WPS433
+    from django.contrib.auth import get_user_model  # noqa: WPS433
+    from django.test import Client  # noqa: WPS433
+
+    user = get_user_model().objects.create_superuser(_ADMIN_USERNAME, password=None)
+    client = Client()
+    client.force_login(user)
+    session = client.cookies[settings.SESSION_COOKIE_NAME].value
+    return '{0}={1}'.format(settings.SESSION_COOKIE_NAME, session)
+
+
+def clear_caches() -> None:
+    """Clear caches of responses and snapshots of versions of the application."""
+    from django.core.cache import caches  # noqa: WPS433
+
+    from server.apps.dictionaries.snapshots import snapshot_registry  # noqa: WPS433
+
+    for cache in caches.all():
+        cache.clear()
+    snapshot_registry.clear()
+
+
+def endpoints(admin_cookie: str) -> dict[str, Endpoint]:
+    """Return benchmarked endpoints by names, admin pages are requested with cookie of admin session.
+
+    Api is requested anonymously, session authentication would add queries of session and user.
+    Elements of the biggest dictionary are requested.
+    """
+    from server.apps.dictionaries.models import Dictionary  # noqa: WPS433
+
+    dictionary = Dictionary.objects.select_related('current_version').get(code='{0}_0'.format(_CODE_PREFIX))
+    version = dictionary.current_version
+    elements_path = '/refbooks/{0}/elements'.format(dictionary.id)
+    query = urlencode(version.dictionaryelement_set.values('code', 'value').first())
+    admin_elements_path = '/admin/dictionaries/dictionaryelement/?version__id__exact={0}'.format(version.id)
+    return {
+        'dictionary_list': Endpoint('/refbooks/', cold=True),
+        'dictionary_list_by_date': Endpoint('/refbooks/?date={0}'.format(version.date), cold=True),
+        'element_list': Endpoint(elements_path, cold=True),
+        'element_list_cached': Endpoint(elements_path),
+        'element_list_cursor': Endpoint('{0}?pagination=cursor'.format(elements_path), cold=True),
+        'check_element': Endpoint('/refbooks/{0}/check_element?{1}'.format(dictionary.id, query)),
+        'admin_dictionaries': Endpoint(_ADMIN_DICTIONARIES_PATH, cookie=admin_cookie),
+        'admin_versions': Endpoint(_ADMIN_VERSIONS_PATH, cookie=admin_cookie),
+        'admin_elements': Endpoint(admin_elements_path, cookie=admin_cookie),
+    }
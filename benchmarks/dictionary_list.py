@@ -0,0 +1,93 @@
+"""Compare queries of dictionary list as of date on dictionaries with many versions.
+
+Dictionaries are filtered by join of versions with DISTINCT, by EXISTS semi-join of versions
+and by precomputed start date of the first version (the query of dictionary list api).
+Dates are chosen so that about a quarter, a half and all of dictionaries are selected.
+
+Run with: python -m benchmarks.dictionary_list --dictionaries 10000 --versions 100
+"""
+import argparse
+import datetime
+import functools
+import os
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks import database
+
+_REPEATS = 5
+_DICTIONARIES = 10000
+_VERSIONS = 100
+_SELECTED_PARTS = (4, 2, 1)
+_LINE = '{0:>12} {1:>20} {2:>12} {3:>10}\n'
+
+
+def main() -> None:
+    """Print count of selected dictionaries and best query time of every query and date."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--dictionaries', type=int, default=_DICTIONARIES)
+    parser.add_argument('--versions', type=int, default=_VERSIONS)
+    parser.add_argument('--repeats', type=int, default=_REPEATS)
+    parser.add_argument('--database-url')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        start_date = database.seed_versions(
+            args.database_url or 'sqlite:///{0}'.format(os.path.join(directory, 'benchmark.sqlite3')),
+            args.dictionaries,
+            args.versions,
+        )
+        sys.stdout.write(_LINE.format('date', 'query', 'dictionaries', 'query, s'))
+        for date in _dates(start_date):
+            _measure_date(date, args.repeats)
+
+
+def _dates(start_date: datetime.date) -> list[datetime.date]:
+    """Dates, by which about a quarter, a half and all of dictionaries have started versions."""
+    return [
+        start_date + datetime.timedelta(days=database.DAYS_IN_YEAR // part)
+        for part in _SELECTED_PARTS
+    ]
+
+
+def _measure_date(date: datetime.date, repeats: int) -> None:
+    from django.db.models import Exists, OuterRef  # noqa: WPS433
+
+    from server.apps.dictionaries import selectors  # noqa: WPS433
+    from server.apps.dictionaries.models import Dictionary, DictionaryVersion  # noqa: WPS433
+
+    querysets = {
+        'join + distinct': Dictionary.objects.filter(dictionaryversion__date__lte=date).distinct(),
+        'exists': Dictionary.objects.filter(Exists(
+            DictionaryVersion.objects.filter(dictionary_id=OuterRef('pk'), date__lte=date),
+        )),
+        'first version date': selectors.dictionary_list(filters={'date': date}),
+    }
+    for query, queryset in querysets.items():
+        fetch = functools.partial(_fetch, queryset)
+        sys.stdout.write(_LINE.format(
+            date.isoformat(),
+            query,
+            len(fetch()),
+            '{0:.4f}'.format(_best_time(fetch, repeats)),
+        ))
+
+
+def _fetch(queryset) -> list[tuple[int, str, str]]:
+    # Queryset is cloned, so rows are fetched from database every time.
+    return list(queryset.all().values_list('id', 'code', 'name'))
+
+
+def _best_time(function: Callable[[], object], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+if __name__ == '__main__':
+    main()
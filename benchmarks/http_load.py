@@ -0,0 +1,63 @@
+"""Load of HTTP server by concurrent clients, every request is made by a new connection."""
+import asyncio
+import socket
+import statistics
+import time
+from typing import Iterator
+
+_Address = tuple[str, int]
+
+_REQUEST = '\r\n'.join((
+    'GET {0} HTTP/1.1',
+    'Host: localhost',
+    'X-Forwarded-Proto: https',
+    'Connection: close',
+    '\r\n',
+))
+_PERCENTILES = 100
+_P50 = 49
+_P99 = 98
+
+
+def accepts_connections(address: _Address) -> bool:
+    """Check that server listens on address."""
+    try:
+        socket.create_connection(address).close()
+    except OSError:
+        return False
+    return True
+
+
+def measure(address: _Address, path: str, requests: int, concurrency: int) -> tuple[float, float, float]:
+    """Return requests per second and 50th and 99th percentiles of latency in seconds."""
+    started_at = time.perf_counter()
+    latencies = asyncio.run(_load(address, path, requests, concurrency))
+    elapsed = time.perf_counter() - started_at
+    percentiles = statistics.quantiles(latencies, n=_PERCENTILES)
+    return requests / elapsed, percentiles[_P50], percentiles[_P99]
+
+
+async def _load(address: _Address, path: str, requests: int, concurrency: int) -> list[float]:
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+    await asyncio.gather(*(
+        _client(address, path, remaining, latencies)
+        for _ in range(concurrency)
+    ))
+    return latencies
+
+
+async def _client(address: _Address, path: str, remaining: Iterator[int], latencies: list[float]) -> None:
+    for _ in remaining:
+        latencies.append(await _request(address, path))
+
+
+async def _request(address: _Address, path: str) -> float:
+    started_at = time.perf_counter()
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(_REQUEST.format(path).encode())
+    response = await reader.read()
+    writer.close()
+    if not response.startswith(b'HTTP/1.1 2'):
+        raise RuntimeError(response.split(b'\r\n', 1)[0].decode())
+    return time.perf_counter() - started_at
@@ -0,0 +1,102 @@
+"""Requests to the WSGI application in the benchmark process and measurement of their cost."""
+import platform
+import statistics
+import time
+import tracemalloc
+from contextlib import closing
+from typing import Callable, Iterable
+from wsgiref.util import setup_testing_defaults
+
+_PERCENTILES = (50, 90, 99)
+_MS_IN_SECOND = 1000
+_BYTES_IN_MIB = 1024 * 1024
+
+
+class ResponseError(Exception):
+    """Response of benchmarked request is not successful."""
+
+
+def get(path: str, *, cookie: str = '') -> int:
+    """Make GET request to the WSGI application, read response and return its size in bytes."""
+    from server.wsgi import application  # noqa: WPS433
+
+    statuses: list[str] = []
+    size = _read(application(
+        _environ(path, cookie),
+        lambda status, headers, exc_info=None: statuses.append(status),
+    ))
+    if not statuses[0].startswith('2'):
+        raise ResponseError('{0} {1}'.format(path, statuses[0]))
+    return size
+
+
+def measure(
+    request: Callable[[], object],
+    *,
+    requests: int,
+    warmup: int,
+    prepare: Callable[[], object],
+) -> dict[str, float]:
+    """Measure latency percentiles, throughput and peak memory of sequential requests.
+
+    Prepare is called before every request out of measured time, for example to clear caches.
+    Peak memory of Python allocations is traced by separate request, tracing slows down requests.
+    """
+    for _ in range(warmup):
+        prepare()
+        request()
+    latencies = []
+    for _ in range(requests):
+        prepare()
+        started_at = time.perf_counter()
+        request()
+        latencies.append(time.perf_counter() - started_at)
+
+    quantiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    measurement = {
+        'p{0}_ms'.format(percentile): quantiles[percentile - 1] * _MS_IN_SECOND
+        for percentile in _PERCENTILES
+    }
+    measurement['throughput_rps'] = len(latencies) / sum(latencies)
+    measurement['peak_memory_mib'] = _peak_memory(request, prepare) / _BYTES_IN_MIB
+    return measurement
+
+
+def environment() -> dict[str, str]:
+    """Return versions of Python and Django and vendor of database, which results depend on."""
+    import django  # noqa: WPS433
+    from django.db import connection  # noqa: WPS433
+
+    return {
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+    }
+
+
+def _environ(path: str, cookie: str) -> dict[str, object]:
+    """Return WSGI environment of request, production settings redirect requests not forwarded by HTTPS proxy."""
+    path_info, _, query_string = path.partition('?')
+    environ: dict[str, object] = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path_info,
+        'QUERY_STRING': query_string,
+        'HTTP_COOKIE': cookie,
+        'HTTP_X_FORWARDED_PROTO': 'https',
+    }
+    setup_testing_defaults(environ)
+    return environ
+
+
+def _read(response: Iterable[bytes]) -> int:
+    with closing(response):  # type: ignore[type-var]
+        return sum(len(chunk) for chunk in response)
+
+
+def _peak_memory(request: Callable[[], object], prepare: Callable[[], object]) -> int:
+    prepare()
+    tracemalloc.start()
+    request()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_memory
@@ -0,0 +1,65 @@
+"""Compare encode time and size of elements list in JSON and MessagePack.
+
+Run with: python -m benchmarks.renderers --elements 100000 1000000
+"""
+import argparse
+import functools
+import os
+import sys
+import time
+from typing import Callable
+
+import django
+
+_REPEATS = 3
+_LINE = '{0:>10} {1:>10} {2:>12} {3:>10}\n'
+
+_Elements = list[dict[str, str]]
+
+
+def main() -> None:
+    """Print encode time and size for every count of elements."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--elements', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--repeats', type=int, default=_REPEATS)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+    django.setup()
+    from rest_framework.renderers import JSONRenderer  # noqa: WPS433
+
+    from server.apps.core.renderers import MessagePackRenderer  # noqa: WPS433
+
+    sys.stdout.write(_LINE.format('elements', 'format', 'bytes', 'encode, s'))
+    for count in args.elements:
+        output = _elements_output(count)
+        for renderer in (JSONRenderer(), MessagePackRenderer()):
+            sys.stdout.write(_LINE.format(
+                count,
+                renderer.format,
+                len(renderer.render(output)),
+                '{0:.3f}'.format(_best_time(functools.partial(renderer.render, output), args.repeats)),
+            ))
+
+
+def _elements_output(count: int) -> dict[str, _Elements]:
+    """The same data as elements list response of version with count elements."""
+    return {
+        'elements': [
+            {'code': 'code_{0}'.format(index), 'value': 'Значение элемента {0}'.format(index)}
+            for index in range(count)
+        ],
+    }
+
+
+def _best_time(function: Callable[[], object], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+if __name__ == '__main__':
+    main()
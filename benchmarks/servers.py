@@ -0,0 +1,125 @@
+"""Compare throughput of ASGI and WSGI production servers at high concurrency.
+
+Both servers are started by gunicorn with the same number of workers, on the same seeded
+database with production settings, by default a temporary SQLite database. Async workers gain
+when requests wait for database, so compare them on PostgreSQL by network too: --database-url
+of an empty database. Client is one process, so at high rate it can become a bottleneck itself.
+
+Run with: python -m benchmarks.servers --concurrency 1 16 64 256
+"""
+import argparse
+import contextlib
+import os
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from types import MappingProxyType
+from typing import Iterator
+
+from benchmarks import database, http_load
+
+_SERVERS = MappingProxyType({
+    'wsgi': ('server.wsgi', '--worker-class', 'sync'),
+    'asgi': ('server.asgi', '--worker-class', 'uvicorn.workers.UvicornWorker'),
+})
+_ADDRESS = ('127.0.0.1', 8765)
+_STARTUP_TIMEOUT = 30
+_STARTUP_POLL_INTERVAL = 0.1
+_LINE = '{0:>6} {1:>10} {2:>12} {3:>10} {4:>10} {5:>10}\n'
+_RATE = '{0:.0f}'
+_MILLISECONDS = '{0:.1f}'
+
+_Endpoints = dict[str, str]
+_Measurement = tuple[float, float, float]
+
+
+def main() -> None:
+    """Print throughput and latency of every server, endpoint and concurrency."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--servers',
+        nargs='+',
+        choices=list(_SERVERS),
+        default=list(_SERVERS),
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        nargs='+',
+        default=[1, 16, 64, 256],
+    )
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--elements', type=int, default=100)
+    parser.add_argument('--database-url')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        endpoints = _endpoints(database.seed(
+            args.database_url or 'sqlite:///{0}'.format(os.path.join(directory, 'benchmark.sqlite3')),
+            args.elements,
+        ))
+        sys.stdout.write(_LINE.format('server', 'endpoint', 'concurrency', 'req/s', 'p50, ms', 'p99, ms'))
+        for server in args.servers:
+            with _server(server, args.workers):
+                _measure_server(server, endpoints, args)
+
+
+def _endpoints(dictionary_id: int) -> _Endpoints:
+    return {
+        'list': '/refbooks/',
+        'elements': '/refbooks/{0}/elements'.format(dictionary_id),
+        'check': '/refbooks/{0}/check_element?code=code_0&value=value_0'.format(dictionary_id),
+    }
+
+
+@contextlib.contextmanager
+def _server(server: str, workers: int) -> Iterator[None]:
+    process = subprocess.Popen([  # noqa: S603
+        sys.executable,
+        '-m',
+        'gunicorn',
+        *_SERVERS[server],
+        '--workers',
+        str(workers),
+        '--bind',
+        '{0}:{1}'.format(*_ADDRESS),
+        '--log-level',
+        'warning',
+    ])
+    _wait_for_server(process)
+    try:
+        yield
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def _wait_for_server(process: subprocess.Popen[bytes]) -> None:
+    deadline = time.monotonic() + _STARTUP_TIMEOUT
+    while not http_load.accepts_connections(_ADDRESS):
+        if time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError('Server is not started in {0} seconds'.format(_STARTUP_TIMEOUT))
+        time.sleep(_STARTUP_POLL_INTERVAL)
+
+
+def _measure_server(server: str, endpoints: _Endpoints, args: argparse.Namespace) -> None:
+    for endpoint, path in endpoints.items():
+        for concurrency in args.concurrency:
+            measurement = _formatted(http_load.measure(_ADDRESS, path, args.requests, concurrency))
+            sys.stdout.write(_LINE.format(server, endpoint, concurrency, *measurement))
+
+
+def _formatted(measurement: _Measurement) -> tuple[str, str, str]:
+    rate, p50, p99 = measurement
+    return (
+        _RATE.format(rate),
+        _MILLISECONDS.format(p50 * 1000),
+        _MILLISECONDS.format(p99 * 1000),
+    )
+
+
+if __name__ == '__main__':
+    main()
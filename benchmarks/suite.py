@@ -0,0 +1,123 @@
+"""Benchmark suite of refbooks api and admin changelists on seeded datasets of several sizes.
+
+Requests are made sequentially to the WSGI application in the benchmark process, with production
+settings. For every dataset size database is filled by seed_dictionaries with the same seed,
+so results are reproducible on the same machine and database. Latency percentiles, throughput
+and peak memory of Python allocations are measured for every endpoint. Lists of dictionaries
+and elements are measured cold (caches of responses and versions are cleared before every request),
+elements list is also measured cached.
+
+Run with: python -m benchmarks.suite run --sizes small medium --output current.json
+Compare with: python -m benchmarks.suite compare baseline.json current.json --threshold 0.2
+"""
+import argparse
+import datetime
+import functools
+import json
+import os
+import sys
+import tempfile
+
+from benchmarks import comparison, database, datasets, inprocess
+
+_DEFAULT_SIZES = ('small', 'medium')
+_REQUESTS = 50
+_WARMUP = 3
+_THRESHOLD = 0.2
+_SEED = 0
+_HEADER = ('size', 'endpoint', 'metric', 'baseline', 'current', 'change', '')
+_LINE = '{0:>8} {1:>24} {2:>16} {3:>12} {4:>12} {5:>8} {6}\n'
+
+
+def main() -> None:
+    """Run benchmarks and write results to JSON file or compare results with baseline."""
+    args = _parser().parse_args()
+    if args.command == 'compare':
+        sys.exit(_compare(args))
+    json.dump(_run(args), args.output, indent=2)
+    args.output.write('\n')
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run benchmarks on seeded datasets')
+    run_parser.add_argument('--sizes', nargs='+', choices=tuple(datasets.SIZES), default=_DEFAULT_SIZES)
+    run_parser.add_argument('--requests', type=int, default=_REQUESTS)
+    run_parser.add_argument('--warmup', type=int, default=_WARMUP)
+    run_parser.add_argument('--seed', type=int, default=_SEED)
+    run_parser.add_argument('--database-url')
+    run_parser.add_argument('--output', type=argparse.FileType('w'), default=sys.stdout)
+    compare_parser = commands.add_parser('compare', help='fail on regressions of results')
+    compare_parser.add_argument('baseline', type=argparse.FileType())
+    compare_parser.add_argument('current', type=argparse.FileType())
+    compare_parser.add_argument('--threshold', type=float, default=_THRESHOLD)
+    return parser
+
+
+def _run(args: argparse.Namespace) -> dict[str, object]:
+    from django.test.utils import override_settings  # noqa: WPS433
+
+    measurements = {}
+    with tempfile.TemporaryDirectory() as directory:
+        default_url = 'sqlite:///{0}'.format(os.path.join(directory, 'benchmark.sqlite3'))
+        database.setup(args.database_url or default_url)
+        # Admin pages link static files, manifest of production storage is created only by collectstatic.
+        with override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage'):
+            for size in args.sizes:
+                sys.stderr.write('Seeding {0} dataset\n'.format(size))
+                datasets.reseed(size, seed=args.seed)
+                measurements[size] = _measure_dataset(size, args)
+        environment = inprocess.environment()
+    return {
+        'meta': {
+            **environment,
+            'requests': args.requests,
+            'seed': args.seed,
+            'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        'results': measurements,
+    }
+
+
+def _measure_dataset(size: str, args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    measurements = {}
+    for name, endpoint in datasets.endpoints(datasets.admin_session_cookie()).items():
+        sys.stderr.write('Measuring {0} {1}\n'.format(size, name))
+        measurements[name] = inprocess.measure(
+            functools.partial(inprocess.get, endpoint.path, cookie=endpoint.cookie),
+            requests=args.requests,
+            warmup=args.warmup,
+            prepare=datasets.clear_caches if endpoint.cold else _keep_caches,
+        )
+    return measurements
+
+
+def _keep_caches() -> None:
+    """Keep caches filled by warmup requests."""
+
+
+def _compare(args: argparse.Namespace) -> int:
+    """Print changes of metrics, return exit status 1 if any metric regressed by more than threshold."""
+    baseline = json.load(args.baseline)['results']
+    current = json.load(args.current)['results']
+    sys.stdout.write(_LINE.format(*_HEADER))
+    regressions = 0
+    for change in comparison.changes(baseline, current):
+        regressed = change.is_regression(args.threshold)
+        regressions += regressed
+        sys.stdout.write(_LINE.format(
+            change.size,
+            change.endpoint,
+            change.metric,
+            '{0:.2f}'.format(change.baseline),
+            '{0:.2f}'.format(change.current),
+            '{0:+.0%}'.format(change.ratio),
+            'REGRESSION' if regressed else '',
+        ))
+    sys.stdout.write('{0} regressions by more than {1:.0%}\n'.format(regressions, args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Production server settings: WSGI application served by sync workers of gunicorn.
+
+ASGI application served by uvicorn workers is opt-in with SERVER_INTERFACE=asgi, it gains
+when requests wait for database by network. Async worker serves many requests at once,
+so the default number of async workers is the number of CPUs. Settings can be changed by
+environment, for example WEB_CONCURRENCY and PORT, see: https://docs.gunicorn.org/en/stable/settings.html
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+_is_asgi = os.environ.get('SERVER_INTERFACE', 'wsgi') == 'asgi'
+_default_workers = multiprocessing.cpu_count() if _is_asgi else multiprocessing.cpu_count() * 2 + 1
+
+wsgi_app = 'server.asgi:application' if _is_asgi else 'server.wsgi:application'
+worker_class = 'uvicorn.workers.UvicornWorker' if _is_asgi else 'sync'
+workers = int(os.environ.get('WEB_CONCURRENCY', _default_workers))
+keepalive = 5
+# Django checks that caches are shared by workers.
+os.environ['WEB_CONCURRENCY'] = str(workers)
+
+
+def on_starting(server) -> None:
+    """Metrics of workers are written to files of directory shared by workers, the directory is emptied on start."""
+    metrics_directory = os.environ.setdefault(
+        'PROMETHEUS_MULTIPROC_DIR',
+        os.path.join(tempfile.gettempdir(), 'dictionary_service_metrics'),
+    )
+    shutil.rmtree(metrics_directory, ignore_errors=True)
+    os.makedirs(metrics_directory)
+    _check_django()
+
+
+def _check_django() -> None:
+    """Fail start with system check errors, such as cache of markers local for a worker."""
+    import django  # noqa: WPS433
+    from django.core import management  # noqa: WPS433
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+    django.setup(set_prefix=False)
+    management.call_command('check')
@@ -30,7 +30,7 @@ def proposed_exception_handler(exc, ctx):  # noqa: C901
         message = _VALIDATION_ERROR_MESSAGE
         extra = {'fields': response.data.pop('detail')}
     else:
-        message = response.pop('detail')
+        message = response.data.pop('detail')
         extra = {}
 
     response.data.update({'message': message, 'extra': extra})
@@ -0,0 +1,51 @@
+from typing import Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers import asgi
+from django.http import HttpResponseBase
+
+# Marks the end of streaming content.
+_END = object()
+
+
+class ASGIHandler(asgi.ASGIHandler):
+    """ASGI handler, which produces parts of streaming responses in thread of request.
+
+    Django 4.1 iterates streaming content in event loop, so streamed querysets can not be
+    fetched there. Parts are produced by the same thread as other synchronous code of request,
+    server-side cursor stays in one connection.
+    """
+
+    async def send_response(self, response: HttpResponseBase, send) -> None:
+        """Encode and send a response out over ASGI."""
+        if not response.streaming:
+            await super().send_response(response, send)
+            return
+
+        await send({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': self._headers(response),
+        })
+        await self._send_parts(iter(response), send)
+        await send({'type': 'http.response.body'})
+        await sync_to_async(response.close, thread_sensitive=True)()
+
+    async def _send_parts(self, parts: Iterator[bytes], send) -> None:
+        next_part = sync_to_async(next, thread_sensitive=True)
+        part = await next_part(parts, _END)
+        while part is not _END:
+            for chunk, _ in self.chunk_bytes(part):
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            part = await next_part(parts, _END)
+
+    def _headers(self, response: HttpResponseBase) -> list[tuple[bytes, bytes]]:
+        headers = [
+            (header.encode('ascii'), header_value.encode('latin1'))
+            for header, header_value in response.items()
+        ]
+        headers.extend(
+            (b'Set-Cookie', cookie.output(header='').encode('ascii').strip())
+            for cookie in response.cookies.values()
+        )
+        return headers
@@ -0,0 +1,58 @@
+"""Prometheus metrics of requests, database queries and caches.
+
+Under gunicorn metrics of worker processes are written by prometheus_client to files
+of PROMETHEUS_MULTIPROC_DIR (see config/gunicorn.py) and are merged by metrics view.
+"""
+from prometheus_client import Counter, Histogram
+
+CACHE_HIT = 'hit'
+CACHE_MISS = 'miss'
+
+# Bucket +Inf is added by prometheus_client.
+_QUERIES_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+_SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000, 100000000)
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Duration of HTTP requests till response is returned by view.',
+    ['view', 'method'],
+)
+REQUEST_DB_QUERIES = Histogram(
+    'http_request_db_queries',
+    'Database queries made by HTTP request.',
+    ['view'],
+    buckets=_QUERIES_BUCKETS,
+)
+REQUEST_DB_DURATION = Histogram(
+    'http_request_db_duration_seconds',
+    'Duration of database queries made by HTTP request.',
+    ['view'],
+)
+RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes',
+    'Size of HTTP responses, streaming responses without Content-Length are not counted.',
+    ['view'],
+    buckets=_SIZE_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    'cache_requests',
+    'Lookups of caches by result.',
+    ['cache', 'result'],
+)
+CHECKED_ELEMENTS = Counter(
+    'dictionaries_checked_elements',
+    'Elements checked by check element api by result, hit when element is present in version.',
+    ['result'],
+)
+
+
+def record_cache_lookup(cache: str, *, hit: bool) -> None:
+    """Count lookup of cache."""
+    CACHE_REQUESTS.labels(cache, CACHE_HIT if hit else CACHE_MISS).inc()
+
+
+def record_checked_elements(exists: list[bool]) -> None:
+    """Count checked elements, which are present and missing in version."""
+    hits = sum(exists)
+    CHECKED_ELEMENTS.labels(CACHE_HIT).inc(hits)
+    CHECKED_ELEMENTS.labels(CACHE_MISS).inc(len(exists) - hits)
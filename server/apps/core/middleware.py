@@ -0,0 +1,364 @@
+import functools
+import hmac
+import random
+import time
+from typing import Optional
+
+import structlog
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.urls import reverse
+from whitenoise import middleware
+
+from server.apps.core import metrics, profiling, queries, routers
+
+logger = structlog.get_logger(__name__)
+
+# View label of requests, which are not resolved to a view, such as static files.
+_UNMATCHED_VIEW = '<unmatched>'
+# Header of requests to profile, its value is compared with PROFILING_TOKEN setting.
+_PROFILE_HEADER = 'X-Profile'
+# Cookie with time till which reads of client go to the primary database.
+_PRIMARY_PIN_COOKIE = 'primary_pinned_until'
+# Statements logged with slow requests, requests with N+1 queries could execute thousands of them.
+_MAX_LOGGED_STATEMENTS = 100
+
+
+class AsyncCapableMiddleware(object):
+    """Base of middlewares, which handle requests in the same mode as the next handler.
+
+    Under ASGI the middleware does not take a thread for async views, subclasses
+    implement both _call and _acall.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        """Mark middleware as coroutine function, when the next handler is async."""
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        """Handle request in the same mode as the next handler."""
+        if iscoroutinefunction(self):
+            return self._acall(request)
+        return self._call(request)
+
+    def _call(self, request: HttpRequest) -> HttpResponseBase:
+        raise NotImplementedError
+
+    async def _acall(self, request: HttpRequest) -> HttpResponseBase:
+        raise NotImplementedError
+
+
+class WhiteNoiseMiddleware(AsyncCapableMiddleware):
+    """WhiteNoise middleware, which is asynchronous under ASGI.
+
+    Middleware of WhiteNoise is synchronous only, so under ASGI every request would take
+    a thread for the whole time of async view. Static files are served in thread of request,
+    other requests are passed to the next handler as is.
+    """
+
+    def __init__(self, get_response) -> None:
+        """Load static files by middleware of WhiteNoise."""
+        super().__init__(get_response)
+        self.whitenoise = middleware.WhiteNoiseMiddleware(get_response)
+
+    def _call(self, request: HttpRequest) -> HttpResponseBase:
+        return self.whitenoise(request)
+
+    async def _acall(self, request: HttpRequest) -> HttpResponseBase:
+        whitenoise = self.whitenoise
+        if whitenoise.autorefresh:
+            static_file = await sync_to_async(functools.partial(whitenoise.find_file, request.path_info))()
+        else:
+            static_file = whitenoise.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(functools.partial(whitenoise.serve, static_file, request))()
+        return await self.get_response(request)
+
+
+class PrimaryDatabaseMiddleware(AsyncCapableMiddleware):
+    """Routes reads of a client to the primary database for a while after its writes, and all reads of admin requests.
+
+    Time of the pin is kept by client in a cookie, so other clients keep reading replicas.
+    Admin sees its own changes at once.
+    """
+
+    def __init__(self, get_response) -> None:
+        """Read settings of middleware."""
+        super().__init__(get_response)
+        self.admin_prefix = reverse('admin:index')
+
+    def _call(self, request: HttpRequest) -> HttpResponseBase:
+        pinned_until = self._pinned_until(request)
+        with routers.client_pin(pinned_until) as pin:
+            if request.path.startswith(self.admin_prefix):
+                with routers.use_primary():
+                    response = self.get_response(request)
+            else:
+                response = self.get_response(request)
+            return self._with_pin_cookie(response, pin, pinned_until)
+
+    async def _acall(self, request: HttpRequest) -> HttpResponseBase:
+        pinned_until = self._pinned_until(request)
+        with routers.client_pin(pinned_until) as pin:
+            if request.path.startswith(self.admin_prefix):
+                with routers.use_primary():
+                    response = await self.get_response(request)
+            else:
+                response = await self.get_response(request)
+            return self._with_pin_cookie(response, pin, pinned_until)
+
+    def _pinned_until(self, request: HttpRequest) -> float:
+        """Return time of pin kept by client, time is limited, so client cannot pin itself forever."""
+        try:
+            pinned_until = float(request.COOKIES.get(_PRIMARY_PIN_COOKIE, 0))
+        except ValueError:
+            return 0
+        return min(pinned_until, time.time() + settings.DATABASE_REPLICA_PIN_SECONDS)  # type: ignore[misc]
+
+    def _with_pin_cookie(
+        self,
+        response: HttpResponseBase,
+        pin: routers.PrimaryPin,
+        pinned_until: float,
+    ) -> HttpResponseBase:
+        """Return time of pin prolonged by writes of request to client."""
+        if pin.until > pinned_until:
+            response.set_cookie(
+                _PRIMARY_PIN_COOKIE,
+                str(pin.until),
+                max_age=settings.DATABASE_REPLICA_PIN_SECONDS,  # type: ignore[misc]
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """Collects metrics of requests: duration, database queries and size of response by view.
+
+    Queries made while streaming response are not counted, duration is measured till response is returned.
+    """
+
+    def _call(self, request: HttpRequest) -> HttpResponseBase:
+        started_at = time.perf_counter()
+        with queries.request_queries() as query_stats:
+            response = self.get_response(request)
+            self._observe(request, response, query_stats, started_at)
+        return response
+
+    async def _acall(self, request: HttpRequest) -> HttpResponseBase:
+        started_at = time.perf_counter()
+        with queries.request_queries() as query_stats:
+            response = await self.get_response(request)
+            self._observe(request, response, query_stats, started_at)
+        return response
+
+    def _observe(
+        self,
+        request: HttpRequest,
+        response: HttpResponseBase,
+        query_stats: queries.QueryStats,
+        started_at: float,
+    ) -> None:
+        duration = time.perf_counter() - started_at
+        view = _UNMATCHED_VIEW
+        if request.resolver_match is not None:
+            view = request.resolver_match.view_name
+        metrics.REQUEST_DURATION.labels(view, request.method).observe(duration)
+        metrics.REQUEST_DB_QUERIES.labels(view).observe(query_stats.count)
+        metrics.REQUEST_DB_DURATION.labels(view).observe(query_stats.duration)
+        response_bytes = _response_bytes(response)
+        if response_bytes is not None:
+            metrics.RESPONSE_SIZE.labels(view).observe(response_bytes)
+
+
+class QueryBudgetMiddleware(AsyncCapableMiddleware):
+    """Logs warning about requests, which exceed budget of database queries or repeat similar queries.
+
+    Repeated queries usually mean N+1 queries of related objects. Budgets are set
+    by QUERY_BUDGET_MAX_QUERIES and QUERY_BUDGET_MAX_REPEATS settings, the middleware
+    is intended for development. Queries made while streaming response are not counted.
+    """
+
+    def __init__(self, get_response) -> None:
+        """Read settings of middleware."""
+        super().__init__(get_response)
+        self.max_queries = settings.QUERY_BUDGET_MAX_QUERIES  # type: ignore[misc]
+        self.max_repeats = settings.QUERY_BUDGET_MAX_REPEATS  # type: ignore[misc]
+
+    def _call(self, request: HttpRequest) -> HttpResponseBase:
+        with queries.request_queries() as query_stats:
+            response = self.get_response(request)
+            self._check(request, query_stats)
+        return response
+
+    async def _acall(self, request: HttpRequest) -> HttpResponseBase:
+        with queries.request_queries() as query_stats:
+            response = await self.get_response(request)
+            self._check(request, query_stats)
+        return response
+
+    def _check(self, request: HttpRequest, query_stats: queries.QueryStats) -> None:
+        violations = query_stats.budget_violations(max_queries=self.max_queries, max_repeats=self.max_repeats)
+        if violations:
+            logger.warning(
+                'query_budget_exceeded',
+                path=request.path,
+                queries=query_stats.count,
+                violations=violations,
+            )
+
+
+class ProfilingMiddleware(AsyncCapableMiddleware):
+    """Profiles sampled requests and requests with X-Profile header equal to PROFILING_TOKEN setting.
+
+    Share of sampled requests is PROFILING_SAMPLE_RATE. Wall and CPU time of query, serialization
+    and rendering phases and stacks sampled every PROFILING_SAMPLE_INTERVAL seconds are written
+    to PROFILING_DIRECTORY, which keeps the last PROFILING_MAX_FILES profiles. Logs of profiled
+    request are bound to profile_id till LoggingContextVarsMiddleware resets them. The middleware
+    is not used when both sampling and token are off.
+    Phases of streaming responses after response is returned are not profiled.
+    """
+
+    def __init__(self, get_response) -> None:
+        """Read settings of middleware."""
+        super().__init__(get_response)
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE  # type: ignore[misc]
+        self.token = settings.PROFILING_TOKEN  # type: ignore[misc]
+        if not self.sample_rate and not self.token:
+            raise MiddlewareNotUsed
+        self.sample_interval = settings.PROFILING_SAMPLE_INTERVAL  # type: ignore[misc]
+        self.directory = settings.PROFILING_DIRECTORY  # type: ignore[misc]
+        self.max_files = settings.PROFILING_MAX_FILES  # type: ignore[misc]
+
+    def process_template_response(self, request: HttpRequest, response):
+        """Time rendering of template responses, such as responses of rest framework views."""
+        profiling.time_rendering(response)
+        return response
+
+    def _call(self, request: HttpRequest) -> HttpResponseBase:
+        if not self._is_profiled(request):
+            return self.get_response(request)
+        profile = profiling.Profile(sample_interval=self.sample_interval)
+        structlog.contextvars.bind_contextvars(profile_id=profile.profile_id)
+        with profiling.timed(profile):
+            response = self.get_response(request)
+        self._save(request, response, profile)
+        return response
+
+    async def _acall(self, request: HttpRequest) -> HttpResponseBase:
+        if not self._is_profiled(request):
+            return await self.get_response(request)
+        profile = profiling.Profile(sample_interval=self.sample_interval)
+        structlog.contextvars.bind_contextvars(profile_id=profile.profile_id)
+        with profiling.timed(profile):
+            response = await self.get_response(request)
+        await sync_to_async(self._save)(request, response, profile)
+        return response
+
+    def _is_profiled(self, request: HttpRequest) -> bool:
+        token = request.headers.get(_PROFILE_HEADER)
+        if token and self.token and hmac.compare_digest(token, self.token):
+            return True
+        return random.random() < self.sample_rate  # noqa: S311
+
+    def _save(
+        self,
+        request: HttpRequest,
+        response: HttpResponseBase,
+        profile: profiling.Profile,
+    ) -> None:
+        details: dict[str, object] = {
+            'method': request.method,
+            'path': request.get_full_path(),
+            'status': response.status_code,
+        }
+        profile_path = profile.save(self.directory, max_files=self.max_files, details=details)
+        logger.info('request_profiled', profile=profile_path, **details, **profile.summary())
+
+
+class LoggingContextVarsMiddleware(AsyncCapableMiddleware):
+    """Logs every request with its timings and resets ContextVars of structlog before and after request.
+
+    ContextVars are reset before request too, so a thread does not keep them from a failed request.
+    Logs of request are bound to arguments of its view, such as dictionary_id, selectors bind
+    resolved version_id. The request_finished record has total time, time and count of database
+    queries, size of response and time of serialization (excluding queries) of api views.
+    Requests slower than REQUEST_LOGGING_SLOW_SECONDS are logged as warnings with their SQL,
+    slower than REQUEST_LOGGING_VERY_SLOW_SECONDS as errors. Streaming responses are logged
+    when they are returned.
+    """
+
+    def __init__(self, get_response) -> None:
+        """Read settings of middleware."""
+        super().__init__(get_response)
+        self.slow_seconds = settings.REQUEST_LOGGING_SLOW_SECONDS  # type: ignore[misc]
+        self.very_slow_seconds = settings.REQUEST_LOGGING_VERY_SLOW_SECONDS  # type: ignore[misc]
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs) -> None:
+        """Bind logs of request to arguments of view."""
+        structlog.contextvars.bind_contextvars(**view_kwargs)
+
+    def _call(self, request: HttpRequest) -> HttpResponseBase:
+        structlog.contextvars.clear_contextvars()
+        timings = profiling.Timings()
+        with queries.request_queries() as query_stats:
+            with profiling.timed(timings):
+                response = self.get_response(request)
+            self._log(request, response, query_stats, timings)
+        return response
+
+    async def _acall(self, request: HttpRequest) -> HttpResponseBase:
+        structlog.contextvars.clear_contextvars()
+        timings = profiling.Timings()
+        with queries.request_queries() as query_stats:
+            with profiling.timed(timings):
+                response = await self.get_response(request)
+            self._log(request, response, query_stats, timings)
+        return response
+
+    def _log(
+        self,
+        request: HttpRequest,
+        response: HttpResponseBase,
+        query_stats: queries.QueryStats,
+        timings: profiling.Timings,
+    ) -> None:
+        log = logger.info
+        details: dict[str, object] = {}
+        if timings.total.wall >= self.slow_seconds:
+            log = logger.warning
+            details['sql'] = query_stats.statements[:_MAX_LOGGED_STATEMENTS]
+        if timings.total.wall >= self.very_slow_seconds:
+            log = logger.error
+        serialization = timings.phases[profiling.SERIALIZATION]
+        # Serialization is timed by api views only, it is not logged as zero for the others.
+        if serialization.count:
+            details['serialization_duration'] = serialization.wall
+        log(
+            'request_finished',
+            method=request.method,
+            path=request.get_full_path(),
+            status=response.status_code,
+            duration=timings.total.wall,
+            db_queries=query_stats.count,
+            db_duration=query_stats.duration,
+            response_bytes=_response_bytes(response),
+            **details,
+        )
+        structlog.contextvars.clear_contextvars()
+
+
+def _response_bytes(response: HttpResponseBase) -> Optional[int]:
+    """Return size of response, content of streaming responses is not read, their size is taken from Content-Length."""
+    if not response.streaming and isinstance(response, HttpResponse):
+        return len(response.content)
+    content_length = response.get('Content-Length')
+    return int(content_length) if content_length else None
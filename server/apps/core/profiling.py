@@ -0,0 +1,221 @@
+"""Profiling of requests: wall and CPU time of phases and sampled stacks of threads of request.
+
+Phases are timed by blocks of code, which are wrapped by phase(), for every block timed by timed().
+Time of nested phases is excluded from the enclosing phase, time out of phases is other. CPU time
+is time of the process, it is exact when worker handles one request at a time. Out of timed blocks
+phase() only reads context variable.
+"""
+import contextlib
+import datetime
+import json
+import os
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import ContextManager, Iterator
+
+from django.template.response import SimpleTemplateResponse
+
+from server.apps.core import sampling
+
+QUERY = 'query'
+SERIALIZATION = 'serialization'
+RENDERING = 'rendering'
+OTHER = 'other'
+_PHASES = (QUERY, SERIALIZATION, RENDERING)
+# Files of profile: summary and sampled stacks.
+_SUMMARY_SUFFIX = '.json'
+_STACKS_SUFFIX = '.folded'
+# Names of files are sorted by time of creation.
+_NAME_FORMAT = '%Y%m%dT%H%M%S%f'  # noqa: WPS323
+
+
+@dataclass(frozen=True)
+class PhaseTime(object):
+    """Wall and CPU time in seconds and count of runs of phase."""
+
+    wall: float = 0
+    cpu: float = 0
+    count: int = 0
+
+    def __add__(self, other: 'PhaseTime') -> 'PhaseTime':
+        """Return sum of time and counts."""
+        return PhaseTime(
+            wall=self.wall + other.wall,
+            cpu=self.cpu + other.cpu,
+            count=self.count + other.count,
+        )
+
+    def __sub__(self, other: 'PhaseTime') -> 'PhaseTime':
+        """Return time excluding time of other phase, count is not changed."""
+        return PhaseTime(
+            wall=self.wall - other.wall,
+            cpu=self.cpu - other.cpu,
+            count=self.count,
+        )
+
+    @classmethod
+    def started(cls) -> 'PhaseTime':
+        """Return current readings of clocks."""
+        return cls(wall=time.perf_counter(), cpu=time.process_time())
+
+    def elapsed(self) -> 'PhaseTime':
+        """Return time elapsed since readings of clocks, counted as one run."""
+        return PhaseTime.started() - self + _RUN
+
+
+_RUN = PhaseTime(count=1)
+
+
+class Timings(object):
+    """Wall and CPU time of timed block and its phases."""
+
+    def __init__(self) -> None:
+        """Create timings of block, which is not started yet."""
+        self.total = PhaseTime()
+        self.phases = {name: PhaseTime() for name in _PHASES}
+        # Running phases with readings of clocks at start and time of nested phases.
+        self._running: list[tuple[str, PhaseTime]] = []
+        self._nested: list[PhaseTime] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start clocks."""
+        self.total = PhaseTime.started()
+
+    def stop(self) -> None:
+        """Stop clocks."""
+        self.total = self.total.elapsed()
+
+    def enter(self, name: str) -> None:
+        """Start phase."""
+        with self._lock:
+            self._running.append((name, PhaseTime.started()))
+            self._nested.append(PhaseTime())
+
+    def exit(self) -> None:
+        """Stop the last started phase."""
+        with self._lock:
+            name, started = self._running.pop()
+            elapsed = started.elapsed()
+            self.phases[name] += elapsed - self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def summary(self) -> dict[str, object]:
+        """Return total time and time of phases, time out of phases is other."""
+        other = PhaseTime(wall=self.total.wall, cpu=self.total.cpu)
+        for phase_time in self.phases.values():
+            other -= phase_time
+        phases = {name: asdict(self.phases[name]) for name in _PHASES}
+        return {
+            'wall': self.total.wall,
+            'cpu': self.total.cpu,
+            'phases': {**phases, OTHER: asdict(other)},
+        }
+
+
+class Profile(Timings):
+    """Time of phases and sampled stacks of threads, which run code of request."""
+
+    def __init__(self, *, sample_interval: float) -> None:
+        """Create profile, stacks are sampled every interval in seconds."""
+        super().__init__()
+        self.profile_id = uuid.uuid4().hex
+        self.sampler = sampling.StackSampler(interval=sample_interval)
+
+    def start(self) -> None:
+        """Start clocks and sampling of current thread."""
+        self.sampler.add_current_thread()
+        self.sampler.start()
+        super().start()
+
+    def stop(self) -> None:
+        """Stop clocks and sampling."""
+        super().stop()
+        self.sampler.stop()
+
+    def enter(self, name: str) -> None:
+        """Start phase in current thread, which is sampled from now on."""
+        self.sampler.add_current_thread()
+        super().enter(name)
+
+    def summary(self) -> dict[str, object]:
+        """Return total time, time of phases and count of sampled stacks."""
+        timings = super().summary()
+        return {
+            'profile_id': self.profile_id,
+            **timings,
+            'samples': sum(self.sampler.stacks.values()),
+        }
+
+    def save(self, directory: str, *, max_files: int, details: dict[str, object]) -> str:
+        """Write summary with details to JSON file and sampled stacks in folded format, return path of summary.
+
+        Profiles except the last max_files ones are removed from directory.
+        """
+        os.makedirs(directory, exist_ok=True)
+        created_at = datetime.datetime.now(datetime.timezone.utc).strftime(_NAME_FORMAT)
+        path = os.path.join(directory, '{0}-{1}'.format(created_at, self.profile_id))
+        with open(path + _STACKS_SUFFIX, 'w') as stacks_file:
+            self.sampler.write(stacks_file)
+        # Summary is written the last, so profiles with summary are complete.
+        with open(path + _SUMMARY_SUFFIX, 'w') as summary_file:
+            json.dump({**details, **self.summary()}, summary_file, indent=2)
+        self._remove_old_profiles(directory, max_files)
+        return path + _SUMMARY_SUFFIX
+
+    def _remove_old_profiles(self, directory: str, max_files: int) -> None:
+        summary_names = (name for name in os.listdir(directory) if name.endswith(_SUMMARY_SUFFIX))
+        for summary_name in sorted(summary_names)[:-max_files]:
+            path = os.path.join(directory, summary_name.removesuffix(_SUMMARY_SUFFIX))
+            for suffix in (_SUMMARY_SUFFIX, _STACKS_SUFFIX):
+                # Profiles could be removed by another worker.
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path + suffix)
+
+
+# Timings of all timed blocks of current context, from outer to inner one. Context is copied to threads of request.
+_active_timings: ContextVar[tuple[Timings, ...]] = ContextVar('active_timings', default=())
+
+
+def phase(name: str) -> ContextManager[object]:
+    """Return block timed as phase by all timed blocks, out of timed blocks the block is not timed."""
+    active_timings = _active_timings.get()
+    if not active_timings:
+        return contextlib.nullcontext()
+    return _phase(active_timings, name)
+
+
+def time_rendering(response: SimpleTemplateResponse) -> None:
+    """Time rendering of template response as phase of all timed blocks, the phase ends after rendering."""
+    if not _active_timings.get():
+        return
+    rendering = contextlib.ExitStack()
+    rendering.enter_context(phase(RENDERING))
+    response.add_post_render_callback(lambda rendered: rendering.close())
+
+
+@contextlib.contextmanager
+def timed(timings: Timings) -> Iterator[Timings]:
+    """Time the block and its phases, including threads of request."""
+    token = _active_timings.set((*_active_timings.get(), timings))
+    timings.start()
+    try:
+        yield timings
+    finally:
+        timings.stop()
+        _active_timings.reset(token)
+
+
+@contextlib.contextmanager
+def _phase(active_timings: tuple[Timings, ...], name: str) -> Iterator[None]:
+    for timings in active_timings:
+        timings.enter(name)
+    try:  # noqa: WPS501
+        yield
+    finally:
+        for started_timings in reversed(active_timings):
+            started_timings.exit()
@@ -0,0 +1,132 @@
+"""Recording of database queries made by a block of code and checks of query budgets.
+
+Queries are recorded by execute wrapper of every database connection to stats of all
+blocks of current context. The context is copied to threads of request, so queries
+of async views are recorded too.
+"""
+import contextlib
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from server.apps.core import profiling
+
+# Parameters of queries are compared as placeholders, lists of placeholders of any length are equal.
+_PLACEHOLDERS_LIST = re.compile(r'\((?:%s|\?)(?:, (?:%s|\?))*\)')  # noqa: WPS323
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Block of code made more queries than its budget or repeated similar queries."""
+
+
+@dataclass
+class QueryStats(object):
+    """Count, total duration and SQL of database queries."""
+
+    count: int = 0
+    duration: float = 0
+    statements: list[str] = field(default_factory=list)
+
+    def repeated(self, max_repeats: int) -> dict[str, int]:
+        """Return similar statements executed more than max_repeats times, with their counts."""
+        similar = Counter(similar_statement(statement) for statement in self.statements)
+        return {statement: count for statement, count in similar.items() if count > max_repeats}
+
+    def budget_violations(self, *, max_queries: Optional[int] = None, max_repeats: Optional[int] = None) -> list[str]:
+        """Return descriptions of exceeded budgets, empty when queries are within budgets."""
+        violations = []
+        if max_queries is not None and self.count > max_queries:
+            violations.append('{0} queries, budget is {1}.'.format(self.count, max_queries))
+        if max_repeats is not None:
+            violations.extend(
+                '{0} similar queries, budget is {1}: {2}'.format(count, max_repeats, statement)
+                for statement, count in self.repeated(max_repeats).items()
+            )
+        return violations
+
+
+# Stats of all blocks recording queries in current context, from outer to inner one.
+_recorded_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar('recorded_stats', default=())
+# Stats of queries of current request, shared by middlewares.
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar('request_stats', default=None)
+
+
+def similar_statement(sql: str) -> str:
+    """Return SQL with literals and lists of parameters replaced, statements of N+1 queries are equal."""
+    return _PLACEHOLDERS_LIST.sub('(...)', _LITERAL.sub('?', sql))
+
+
+@contextlib.contextmanager
+def recorded_queries() -> Iterator[QueryStats]:
+    """Record database queries made in the block, including threads of request."""
+    # Connections opened before this module is loaded do not get the recorder from signal.
+    for connection in connections.all(initialized_only=True):  # type: ignore[call-arg]
+        install_query_recorder(sender=None, connection=connection)
+    query_stats = QueryStats()
+    token = _recorded_stats.set((*_recorded_stats.get(), query_stats))
+    try:
+        yield query_stats
+    finally:
+        _recorded_stats.reset(token)
+
+
+@contextlib.contextmanager
+def request_queries() -> Iterator[QueryStats]:
+    """Record database queries of request once, nested blocks of middlewares get stats of the outer one."""
+    request_stats = _request_stats.get()
+    if request_stats is not None:
+        yield request_stats
+        return
+    with recorded_queries() as query_stats:
+        token = _request_stats.set(query_stats)
+        try:
+            yield query_stats
+        finally:
+            _request_stats.reset(token)
+
+
+@contextlib.contextmanager
+def query_budget(*, max_queries: Optional[int] = None, max_repeats: Optional[int] = None) -> Iterator[QueryStats]:
+    """Raise QueryBudgetExceeded when the block makes more queries than budget or repeats similar queries.
+
+    >>> with query_budget(max_queries=0):
+    ...     pass
+    """
+    with recorded_queries() as query_stats:
+        yield query_stats
+        violations = query_stats.budget_violations(max_queries=max_queries, max_repeats=max_repeats)
+        if violations:
+            raise QueryBudgetExceeded('\n'.join(violations))
+
+
+def query_recorder(execute, sql, params, many, context):  # noqa: WPS110
+    """Database execute wrapper, which adds executed queries to stats of current context."""
+    recorded_stats = _recorded_stats.get()
+    with profiling.phase(profiling.QUERY):
+        if not recorded_stats:
+            return execute(sql, params, many, context)
+
+        started_at = time.perf_counter()
+        try:  # noqa: WPS501
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started_at
+            for query_stats in recorded_stats:
+                query_stats.count += 1
+                query_stats.duration += duration
+                query_stats.statements.append(sql)
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs) -> None:
+    """Record queries of every new database connection."""
+    if query_recorder not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_recorder)
@@ -0,0 +1,26 @@
+import msgpack
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+# Converts dates, decimals, lazy strings and so on as they are rendered to JSON.
+_fallback_encoder = JSONEncoder()
+
+
+def packb(instance: object) -> bytes:
+    """Return MessagePack representation of JSON-compatible object."""
+    return msgpack.packb(instance, default=_fallback_encoder.default)
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """Renderer of MessagePack, a compact binary representation of the same data as JSON."""
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'  # noqa: WPS125
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:  # noqa: WPS110
+        """Render data to MessagePack."""
+        if data is None:
+            return b''
+        return packb(data)
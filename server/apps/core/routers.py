@@ -0,0 +1,94 @@
+import contextlib
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Users, sessions and admin log are read where they are written.
+_PRIMARY_APPS = frozenset(('admin', 'auth', 'sessions'))
+
+_primary_pinned: ContextVar[bool] = ContextVar('primary_pinned', default=False)
+
+
+@dataclass
+class PrimaryPin(object):
+    """Timestamp till which reads of a client go to the primary database, and replica read by client otherwise."""
+
+    until: float
+    replica: Optional[str] = None
+
+
+_client_pin: ContextVar[Optional[PrimaryPin]] = ContextVar('client_pin', default=None)
+
+
+@contextlib.contextmanager
+def use_primary() -> Iterator[None]:
+    """Route reads made inside the block to the primary database."""
+    token = _primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+@contextlib.contextmanager
+def client_pin(pinned_until: float) -> Iterator[PrimaryPin]:
+    """Route reads made inside the block to the primary database till timestamp kept by client between requests.
+
+    Writes made inside the block prolong the pin, which is yielded to be returned to the client.
+    Reads from replicas made inside the block go to one replica, so they do not mix states of replicas.
+    """
+    pin = PrimaryPin(until=pinned_until)
+    token = _client_pin.set(pin)
+    try:
+        yield pin
+    finally:
+        _client_pin.reset(token)
+
+
+class ReplicaRouter(object):
+    """Router of reads to read-only replicas and of writes to the primary database.
+
+    Reads go to the primary database inside transactions and use_primary blocks, and for
+    DATABASE_REPLICA_PIN_SECONDS after a write of the client, so the client reads back its own
+    changes. Otherwise reads of a client go to one random replica, so a request does not mix
+    replicas lagging differently. Client is pinned by client_pin block, outside of them the process
+    is the client, for example in management commands.
+    """
+
+    def __init__(self) -> None:
+        """Create router without recent writes."""
+        self._process_pin = PrimaryPin(until=0)
+
+    def db_for_read(self, model, **hints) -> str:
+        """Return replica of client, or the primary database when reads should see the latest writes."""
+        replicas = settings.DATABASE_REPLICAS  # type: ignore[misc]
+        if not replicas or model._meta.app_label in _PRIMARY_APPS or self._primary_required():  # noqa: WPS437
+            return DEFAULT_DB_ALIAS
+        pin = self._pin()
+        replica = pin.replica if pin.replica in replicas else random.choice(replicas)  # noqa: S311
+        pin.replica = replica
+        return replica
+
+    def db_for_write(self, model, **hints) -> str:
+        """Return the primary database and pin reads of the client to it for a while."""
+        self._pin().until = time.time() + settings.DATABASE_REPLICA_PIN_SECONDS  # type: ignore[misc]
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        """Replicas have the same data as the primary database."""
+        return True
+
+    def _primary_required(self) -> bool:
+        return (
+            _primary_pinned.get() or
+            self._pin().until > time.time() or
+            connections[DEFAULT_DB_ALIAS].in_atomic_block
+        )
+
+    def _pin(self) -> PrimaryPin:
+        return _client_pin.get() or self._process_pin
@@ -0,0 +1,55 @@
+"""Sampling of stacks of threads in folded format of flame graphs."""
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Optional, TextIO
+
+
+class StackSampler(object):
+    """Counts stacks of sampled threads, which are taken by background thread every interval."""
+
+    def __init__(self, *, interval: float) -> None:
+        """Create sampler of stacks every interval in seconds."""
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.thread_ids: set[int] = set()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name='stack-sampler', daemon=True)
+
+    def add_current_thread(self) -> None:
+        """Sample stacks of current thread."""
+        self.thread_ids.add(threading.get_ident())
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stopped.set()
+        self._thread.join()
+
+    def write(self, stacks_file: TextIO) -> None:
+        """Write counted stacks in folded format: stack and count on every line."""
+        for stack, count in self.stacks.items():
+            stacks_file.write('{0} {1}\n'.format(stack, count))
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frames = sys._current_frames()  # noqa: WPS437
+            # Threads are added by other threads, copy of set is made by one operation.
+            for thread_id in tuple(self.thread_ids):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.stacks[folded_stack(frame)] += 1
+
+
+def folded_stack(frame: Optional[FrameType]) -> str:
+    """Return calls of stack of frame from the outermost one, separated by semicolons."""
+    calls = []
+    while frame is not None:
+        module = frame.f_globals.get('__name__')
+        calls.append('{0}:{1}'.format(module, frame.f_code.co_name))
+        frame = frame.f_back
+    return ';'.join(reversed(calls))
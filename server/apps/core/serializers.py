@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+
+class UnsavedSerializer(serializers.Serializer):
+    """Base of serializers of input and output, which are never saved."""
+
+    def update(self, instance, validated_data):
+        """Not in use."""
+
+    def create(self, validated_data):
+        """Not in use."""
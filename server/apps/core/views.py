@@ -0,0 +1,114 @@
+import asyncio
+import functools
+import hmac
+import os
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseBase, HttpResponseForbidden
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+from rest_framework import views
+
+from server.apps.core import profiling
+
+
+class APIView(views.APIView):
+    """API view, which times its handler as serialization phase of profiled and logged requests."""
+
+    def dispatch(self, request, *args, **kwargs) -> HttpResponseBase:
+        """The same as APIView.dispatch, but handler is timed."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            response = self._call_handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def _call_handler(self, request, *args, **kwargs) -> HttpResponseBase:
+        self.initial(request, *args, **kwargs)
+        # View builds output of queried rows, time of queries and rendering of cached responses is excluded.
+        with profiling.phase(profiling.SERIALIZATION):
+            return self._method_handler(request.method)(request, *args, **kwargs)
+
+    def _method_handler(self, method: str):
+        if method.lower() in self.http_method_names:
+            return getattr(self, method.lower(), self.http_method_not_allowed)
+        return self.http_method_not_allowed
+
+
+class AsyncAPIView(APIView):
+    """API view with coroutine handlers, named as handlers of methods with prefix a, such as aget.
+
+    Under ASGI a request waiting for database does not take a worker thread. Authentication,
+    permissions and throttling are synchronous in rest framework, they are run in thread of request.
+    Handlers without coroutine version, such as options, are called as is. Async view is a subclass
+    of sync view, which keeps its handlers and schema, sync view is served under WSGI without event loop.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs) -> HttpResponseBase:  # type: ignore[override]
+        """The same as APIView.dispatch, but handler is awaited."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            response = await self._acall_handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def _method_handler(self, method: str):
+        sync_handler = super()._method_handler(method)
+        if sync_handler == self.http_method_not_allowed:
+            return sync_handler
+        return getattr(self, 'a{0}'.format(method.lower()), sync_handler)
+
+    async def _acall_handler(self, request, *args, **kwargs) -> HttpResponseBase:
+        initial = functools.partial(self.initial, request, *args, **kwargs)
+        await sync_to_async(initial)()
+        with profiling.phase(profiling.SERIALIZATION):
+            response = self._method_handler(request.method)(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                return await response
+            return response
+
+
+# Scheme of Authorization header of metrics scraper, its credentials are compared with METRICS_TOKEN setting.
+_BEARER_SCHEME = 'Bearer '
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Metrics in Prometheus text format, under gunicorn metrics of all worker processes are merged.
+
+    Metrics are shown to staff users and to scraper with METRICS_TOKEN in Authorization header.
+    """
+    if not _is_metrics_allowed(request):
+        return HttpResponseForbidden()
+    registry = REGISTRY
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+
+def _is_metrics_allowed(request: HttpRequest) -> bool:
+    if request.user.is_staff:
+        return True
+    token = settings.METRICS_TOKEN  # type: ignore[misc]
+    authorization = request.headers.get('Authorization', '')
+    if not token or not authorization.startswith(_BEARER_SCHEME):
+        return False
+    return hmac.compare_digest(authorization[len(_BEARER_SCHEME):], token)
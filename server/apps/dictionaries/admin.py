@@ -1,22 +1,30 @@
 import datetime
-from typing import Union
-
-from django.contrib import admin
-from django.db.models import F, FilteredRelation, OuterRef, Q, Subquery  # noqa: WPS347
-from django.utils.html import format_html_join
-from django.utils.timezone import now
+from typing import Optional, Union
+
+from django import forms as django_forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.core.exceptions import ValidationError
+from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
 from django.utils.translation import gettext_lazy as _
 
-from server.apps.dictionaries import models
+from server.apps.dictionaries import forms, models, pagination, selectors, services
 
 _HTML_LIST_TEMPLATE = '<li>{}</li>'  # noqa: P103
+_ACTION_TEMPLATE = 'admin/dictionaries/action.html'
+_VERSION_FILTER = 'version__id__exact'
+_VERSION_ELEMENTS_URL = '{0}?version__id__exact={1}'
 
 
 @admin.register(models.Dictionary)
 class DictionaryAdmin(admin.ModelAdmin[models.Dictionary]):
     """Register dictionary model editor with additional information about current version."""
 
-    list_display = ('dictionary_id', 'code', 'name', 'current_version', 'start_date')
+    list_display = ('dictionary_id', 'code', 'name', 'active_version', 'start_date')
+    search_fields = ('code', 'name')
     readonly_fields = ('show_versions',)
 
     @admin.display(description=_('Identifier'))
@@ -35,48 +43,35 @@ class DictionaryAdmin(admin.ModelAdmin[models.Dictionary]):
         )
 
     @admin.display(description=_('Current version'))
-    def current_version(self, dictionary) -> Union[str, None]:
-        """Return current version."""
-        return dictionary.version
+    def active_version(self, dictionary: models.Dictionary) -> Optional[str]:
+        """Return current version annotated by queryset of list."""
+        return getattr(dictionary, 'current_version_name', None)
 
     @admin.display(description=_('Version start date'))
-    def start_date(self, dictionary) -> Union[datetime.date, None]:
-        """Return start date of current version."""
-        return dictionary.date
+    def start_date(self, dictionary: models.Dictionary) -> Union[datetime.date, None]:
+        """Return start date of current version annotated by queryset of list."""
+        return getattr(dictionary, 'current_version_date', None)
 
     def get_queryset(self, request):
         """Override method for additional information about current version."""
-        current_versions_sq = Subquery(
-            (
-                models.DictionaryVersion.objects.filter(
-                    dictionary_id=OuterRef('pk'),
-                    date__lte=now(),
-                ).order_by('-date').values('id')[:1]
-            ),
-        )
-
-        return super().get_queryset(request).annotate(
-            currentversion=FilteredRelation(
-                'dictionaryversion',
-                condition=Q(dictionaryversion=current_versions_sq),
-            ),
-            version=F('currentversion__version'),
-            date=F('currentversion__date'),
-        )
-
-
-class DictionaryElementInlines(admin.StackedInline):  # type: ignore[type-arg]
-    """Forms for add elements on dictionary version admin edit form."""
-
-    model = models.DictionaryElement
+        return selectors.dictionary_list_with_current_version(dictionaries=super().get_queryset(request))
 
 
 @admin.register(models.DictionaryVersion)
 class DictionaryVersionAdmin(admin.ModelAdmin[models.DictionaryVersion]):
-    """Register dictionary version model editor with dictionary elements inlines."""
+    """Register dictionary version model editor with link to elements of version.
+
+    Elements are edited in list of elements filtered by version, which is paginated for versions of any size.
+    """
 
-    list_display = ('version', 'dictionary_identifier', 'dictionary_name', 'date')
-    inlines = [DictionaryElementInlines]
+    list_display = ('version', 'dictionary_identifier', 'dictionary_name', 'date', 'base_version')
+    list_select_related = ('dictionary', 'base_version')
+    # Unique order keeps pages of the list stable.
+    ordering = ('-date', 'id')
+    search_fields = ('version', 'dictionary__code', 'dictionary__name')
+    autocomplete_fields = ('dictionary',)
+    readonly_fields = ('elements',)
+    actions = ['clone_version', 'upload_elements']
 
     @admin.display(description=_('Dictionary identifier'))
     def dictionary_identifier(self, version: models.DictionaryVersion) -> int:
@@ -88,13 +83,154 @@ class DictionaryVersionAdmin(admin.ModelAdmin[models.DictionaryVersion]):
         """Return dictionary name."""
         return version.dictionary.name
 
+    @admin.display(description=_("Dictionary element's"))
+    def elements(self, version: models.DictionaryVersion) -> str:
+        """Return link to list of elements of version."""
+        if not version.pk:
+            return '-'
+        title = _('Elements of version {0}').format(version)
+        if version.base_version_id is not None:
+            title = _('Changes of version {0} from base version {1}').format(version, version.base_version)
+        return format_html(
+            '<a href="{0}">{1}</a>',
+            _VERSION_ELEMENTS_URL.format(reverse('admin:dictionaries_dictionaryelement_changelist'), version.id),
+            title,
+        )
+
+    @admin.action(description=_('Clone version with changes of elements'), permissions=['add'])
+    def clone_version(self, request, queryset) -> Optional[HttpResponse]:
+        """Create new version with elements of selected version, the form of new version is shown first."""
+        source = _selected_version(self, request, queryset)
+        if source is None:
+            return None
+
+        form_data = request.POST if 'apply' in request.POST else None
+        form = forms.CloneVersionForm(form_data, request.FILES or None)
+        if form.is_valid():
+            try:
+                clone = services.dictionary_version_clone(version_id=source.id, **form.cleaned_data)
+            except ValidationError as exc:
+                form.add_error(None, exc)
+            else:
+                self.message_user(request, _('Version {0} is created.').format(clone), messages.SUCCESS)
+                return HttpResponseRedirect(reverse('admin:dictionaries_dictionaryversion_change', args=[clone.id]))
+
+        title = _('Clone version {0}').format(source)
+        return _action_form(self, request, action='clone_version', form=form, title=title)
+
+    @admin.action(description=_('Upload elements'), permissions=['change'])
+    def upload_elements(self, request, queryset) -> Optional[HttpResponse]:
+        """Add or change elements of selected version by uploaded file, elements are written by batches."""
+        version = _selected_version(self, request, queryset)
+        if version is None:
+            return None
+
+        form_data = request.POST if 'apply' in request.POST else None
+        form = forms.UploadElementsForm(form_data, request.FILES or None)
+        if form.is_valid():
+            try:
+                uploaded = services.dictionary_version_upload(version_id=version.id, **form.cleaned_data)
+            except ValidationError as exc:
+                form.add_error(None, exc)
+            else:
+                self.message_user(request, _('{0} elements are uploaded.').format(uploaded), messages.SUCCESS)
+                return None
+
+        title = _('Upload elements to version {0}').format(version)
+        return _action_form(self, request, action='upload_elements', form=form, title=title)
+
 
 @admin.register(models.DictionaryElement)
 class DictionaryElementAdmin(admin.ModelAdmin[models.DictionaryElement]):
-    """Register dictionary element model."""
+    """Register dictionary element model, elements are changed by bulk actions in batches.
+
+    Elements of a version are listed by link from the version, the list is not counted beyond max count.
+    Version stored as changes from base version lists and changes only its stored rows, which is told on the list.
+    """
 
     list_display = (
         'version',
         'code',
         'value',
+        'is_removed',
     )
+    list_select_related = ('version',)
+    search_fields = ('code', 'value')
+    autocomplete_fields = ('version',)
+    paginator = pagination.BoundedCountPaginator
+    show_full_result_count = False
+    actions = ['set_value', 'delete_selected']
+
+    def changelist_view(self, request: HttpRequest, extra_context=None) -> HttpResponse:
+        """Warn that list of delta version has only its changes from base version."""
+        version_id = request.GET.get(_VERSION_FILTER, '')
+        version = None
+        if version_id.isdigit():
+            version = models.DictionaryVersion.objects.filter(
+                pk=version_id,
+                base_version__isnull=False,
+            ).select_related('base_version').first()
+        if version is not None:
+            warning = _(
+                'Version {0} is stored as changes from base version {1}: only changed, added and removed'
+                ' elements are listed and changed by actions.',  # noqa: WPS326
+            )
+            self.message_user(request, warning.format(version, version.base_version), messages.WARNING)
+        return super().changelist_view(request, extra_context)
+
+    @admin.action(description=_('Set value of selected elements'), permissions=['change'])
+    def set_value(self, request, queryset) -> Optional[HttpResponse]:
+        """Set value of selected elements, the form of value is shown first."""
+        form = forms.ElementValueForm(request.POST if 'apply' in request.POST else None)
+        if form.is_valid():
+            updated = services.dictionary_elements_update(elements=queryset, **form.cleaned_data)
+            self.message_user(request, _('{0} elements are changed.').format(updated), messages.SUCCESS)
+            return None
+        title = _('Set value of {0} selected elements').format(queryset.count())
+        return _action_form(self, request, action='set_value', form=form, title=title)
+
+    def delete_model(self, request: HttpRequest, element: models.DictionaryElement) -> None:
+        """Delete element by service, element of delta version overriding element of base version is marked removed."""
+        services.dictionary_elements_delete(elements=models.DictionaryElement.objects.filter(pk=element.pk))
+
+    @admin.action(description=_('Delete selected elements'), permissions=['delete'])
+    def delete_selected(self, request, queryset) -> Optional[HttpResponse]:
+        """Delete selected elements by batches, replaces default action, which loads all elements to confirm."""
+        if 'apply' in request.POST:
+            deleted = services.dictionary_elements_delete(elements=queryset)
+            self.message_user(request, _('{0} elements are deleted.').format(deleted), messages.SUCCESS)
+            return None
+        title = _('Delete {0} selected elements').format(queryset.count())
+        return _action_form(self, request, action='delete_selected', form=django_forms.Form(), title=title)
+
+
+def _selected_version(
+    model_admin: admin.ModelAdmin[models.DictionaryVersion],
+    request: HttpRequest,
+    queryset,
+) -> Optional[models.DictionaryVersion]:
+    if queryset.count() != 1:
+        model_admin.message_user(request, _('Select one version.'), messages.WARNING)
+        return None
+    return queryset.get()
+
+
+def _action_form(
+    model_admin: admin.ModelAdmin,  # type: ignore[type-arg]
+    request: HttpRequest,
+    *,
+    action: str,
+    form: django_forms.Form,
+    title: str,
+) -> TemplateResponse:
+    """Return page with form of action, which is posted to changelist with selected objects."""
+    return TemplateResponse(request, _ACTION_TEMPLATE, {
+        **model_admin.admin_site.each_context(request),
+        'title': title,
+        'opts': model_admin.model._meta,  # noqa: WPS437
+        'action': action,
+        'action_checkbox_name': ACTION_CHECKBOX_NAME,
+        'selected': request.POST.getlist(ACTION_CHECKBOX_NAME),
+        'select_across': request.POST.get('select_across', '0'),
+        'form': form,
+    })
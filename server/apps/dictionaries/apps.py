@@ -7,3 +7,7 @@ class DictionariesConfig(AppConfig):
 
     name = 'server.apps.dictionaries'
     verbose_name = _('Dictionaries')
+
+    def ready(self) -> None:
+        """Connect signal handlers and register checks."""
+        from server.apps.dictionaries import checks, signals  # noqa: F401, WPS433
@@ -0,0 +1,163 @@
+"""Async versions of dictionary views, urls register them in place of sync views under ASGI."""
+import functools
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponseBase
+from rest_framework import status
+from rest_framework.response import Response
+
+from server.apps.core import routers
+from server.apps.core.views import AsyncAPIView
+from server.apps.dictionaries import caches, conditional, selectors, snapshots, streaming, views
+from server.apps.dictionaries.pagination import PAGINATION_CURSOR, PAGINATION_STREAM
+from server.apps.dictionaries.serializers import (
+    DictionaryElementCheckBatchInputSerializer,
+    DictionaryElementCheckBatchOutputSerializer,
+)
+
+
+class AsyncDictionaryListAPI(AsyncAPIView, views.DictionaryListAPI):
+    """Dictionary list api with coroutine handler, served under ASGI."""
+
+    async def aget(self, request):
+        """Obtaining a list of dictionaries."""
+        filters_serializer = self.DictionaryListFilterSerializer(
+            data=request.query_params,
+        )
+        filters_serializer.is_valid(raise_exception=True)
+
+        cache_headers = await sync_to_async(conditional.dictionary_list_headers)(request)
+        not_modified = cache_headers.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        output = functools.partial(self._adictionary_list_output, filters_serializer.validated_data)
+        if caches.response_cache.is_cacheable(request):
+            return cache_headers.apply(await caches.acached_response(
+                request,
+                key=caches.dictionary_list_key(etag=cache_headers.etag),
+                output=output,
+                renderer_context=self.get_renderer_context(),
+            ))
+        return cache_headers.apply(Response(await output()))
+
+    async def _adictionary_list_output(self, filters) -> dict[str, object]:
+        dictionaries = selectors.dictionary_list(filters=filters).values_list('id', 'code', 'name')
+        with routers.use_primary():
+            return {
+                'refbooks': [
+                    {'id': str(dictionary_id), 'code': code, 'name': name}
+                    async for dictionary_id, code, name in dictionaries
+                ],
+            }
+
+
+class AsyncDictionaryElementListAPI(AsyncAPIView, views.DictionaryElementListAPI):
+    """Dictionary elements list api with coroutine handler, served under ASGI."""
+
+    async def aget(self, request, dictionary_id: int):
+        """Retrieving items from a given dictionaries."""
+        filters_serializer = self.DictionaryElementListFilterSerializer(
+            data=request.query_params,
+        )
+        filters_serializer.is_valid(raise_exception=True)
+
+        version, cache_headers = await sync_to_async(self._cache_headers)(
+            request,
+            dictionary_id,
+            filters_serializer.validated_data.get('version'),
+        )
+        return await self._acached_response(request, cache_headers, version, filters_serializer.validated_data)
+
+    async def _acached_response(self, request, cache_headers, version, filters) -> HttpResponseBase:
+        not_modified = cache_headers.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        return cache_headers.apply(await self._aresponse(request, version, filters.get('pagination')))
+
+    async def _aresponse(self, request, version, pagination) -> HttpResponseBase:
+        version_id, revision = version
+        # Selector of elements looks up base of version, elements are selected in thread of request.
+        element_list_output = sync_to_async(self._element_list_output)
+
+        if pagination == PAGINATION_STREAM:
+            elements = await sync_to_async(selectors.dictionary_version_element_list)(version_id=version_id)
+            # Parts of streaming response are produced in thread of request by core.handlers.ASGIHandler.
+            return streaming.elements_streaming_response(elements, request.accepted_renderer)
+        if pagination == PAGINATION_CURSOR:
+            return await sync_to_async(self._paginated_response)(request, version_id)
+        if version_id is not None and revision is not None and caches.response_cache.is_cacheable(request):
+            return await caches.acached_response(
+                request,
+                key=self._element_list_key(request, version_id, revision),
+                output=functools.partial(element_list_output, version_id),
+                renderer_context=self.get_renderer_context(),
+                # Revision and elements are read from replica of request, it could apply a change between the reads.
+                is_current=functools.partial(snapshots.is_current_revision, version_id=version_id, revision=revision),
+            )
+
+        return Response(await element_list_output(version_id))
+
+
+class AsyncDictionaryVersionElementListAPI(AsyncDictionaryElementListAPI, views.DictionaryVersionElementListAPI):
+    """Elements list api of a version by content-addressed url with coroutine handler, served under ASGI."""
+
+    async def aget(self, request, dictionary_id: int, version: str, revision: str):  # type: ignore[override]
+        """Retrieving items from a given revision of dictionary version."""
+        filters_serializer = self.DictionaryElementListFilterSerializer(
+            data=request.query_params,
+        )
+        filters_serializer.is_valid(raise_exception=True)
+
+        resolved_version, cache_headers = await sync_to_async(self._cache_headers)(
+            request,
+            dictionary_id,
+            version,
+            expected_revision=revision,
+        )
+        return await self._acached_response(
+            request,
+            cache_headers,
+            resolved_version,
+            filters_serializer.validated_data,
+        )
+
+
+class AsyncDictionaryCheckElementAPI(AsyncAPIView, views.DictionaryCheckElementAPI):
+    """Check element api with coroutine handlers, served under ASGI.
+
+    Element is checked inside event loop, when its version is resolved and snapshot is loaded.
+    """
+
+    async def aget(self, request, dictionary_id: int):
+        """Validation an element."""
+        filters_serializer = self.DictionaryCheckElementFilterSerializer(
+            data=request.query_params,
+        )
+        filters_serializer.is_valid(raise_exception=True)
+
+        element_exists = await snapshots.aelement_exists(
+            dictionary_id=dictionary_id,
+            **filters_serializer.validated_data,
+        )
+
+        if not element_exists:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    async def apost(self, request, dictionary_id: int):
+        """Validation of elements batch."""
+        input_serializer = DictionaryElementCheckBatchInputSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        validated_data = input_serializer.validated_data
+
+        output = {
+            'elements': await snapshots.acheck_elements(
+                dictionary_id=dictionary_id,
+                elements=validated_data['elements'],
+                version=validated_data.get('version'),
+            ),
+        }
+        return Response(DictionaryElementCheckBatchOutputSerializer(output).data)
@@ -0,0 +1,301 @@
+import asyncio
+import functools
+import time
+from typing import Awaitable, Callable, Iterable, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.http import HttpResponse
+from rest_framework.request import Request
+
+from server.apps.core import metrics, profiling, routers
+from server.apps.dictionaries import selectors
+from server.apps.dictionaries.models import new_revision
+
+_ELEMENT_LIST_KEY = 'dictionaries:elements:{0}:{1}:{2}'
+_DICTIONARY_LIST_KEY = 'dictionaries:list:{0}'
+# Markers of changes: token of dictionary list, token of versions of dictionary and revision of version.
+_LIST_MARKER_KEY = 'dictionaries:list'
+_VERSIONS_MARKER_KEY = 'dictionaries:versions:{0}'
+_REVISION_MARKER_KEY = 'dictionaries:revision:{0}'
+_FILL_KEY = '{0}:fill'
+_FILL_POLL_INTERVAL = 0.05
+# Stored instead of content greater than max size, such responses are rendered by every request.
+_OVERSIZED = False
+# Name of cache in metrics.
+_RESPONSES_CACHE = 'responses'
+
+_Fill = Callable[[], bytes]
+_AsyncFill = Callable[[], Awaitable[bytes]]
+_Output = Callable[[], object]
+_AsyncOutput = Callable[[], Awaitable[object]]
+_IsCurrent = Callable[[], bool]
+
+
+class ChangeMarkers(object):
+    """Markers of changes of dictionary versions in shared cache, local caches of every process are checked by them.
+
+    Token of dictionary list is changed on any change of dictionaries and their versions, token of versions
+    of dictionary is changed on any change of its versions, revision of version is changed on changes of its
+    elements. Markers are published after commit, so a process, which sees a new marker, reads committed
+    changes. Missing markers are restored.
+    """
+
+    def __init__(self, *, alias: str, ttl: int) -> None:
+        """Create markers stored in Django cache with alias, they expire after ttl."""
+        self.alias = alias
+        self.ttl = ttl
+
+    def list_token(self) -> str:
+        """Return token of dictionary list, missing token is replaced by a new one."""
+        return _token(self.alias, _LIST_MARKER_KEY, self.ttl)
+
+    def versions_token(self, dictionary_id: int) -> str:
+        """Return token of versions of dictionary, missing token is replaced by a new one."""
+        return _token(self.alias, _VERSIONS_MARKER_KEY.format(dictionary_id), self.ttl)
+
+    def revision(self, version_id: int) -> Optional[str]:
+        """Return revision of version, missing revision is read from database. None for missing version."""
+        cache = caches[self.alias]
+        key = _REVISION_MARKER_KEY.format(version_id)
+        revision = cache.get(key)
+        if revision is None:
+            with routers.use_primary():
+                version_revision = selectors.dictionary_version_revision(version_id=version_id)
+            if version_revision is None:
+                return None
+            revision = version_revision[1]
+            # Revision published by concurrent commit is newer than the read one.
+            if not cache.add(key, revision, self.ttl):
+                revision = cache.get(key, revision)
+        return revision
+
+    async def ais_current(
+        self,
+        *,
+        dictionary_id: int,
+        token: str,
+        version_id: int,
+        revision: Optional[str],
+    ) -> bool:
+        """Check by one read of cache that token of versions of dictionary and revision of version are current."""
+        token_key = _VERSIONS_MARKER_KEY.format(dictionary_id)
+        revision_key = _REVISION_MARKER_KEY.format(version_id)
+        markers = await caches[self.alias].aget_many([token_key, revision_key])
+        return markers.get(token_key) == token and markers.get(revision_key) == revision
+
+    def publish(self, *, dictionary_ids: Iterable[int] = (), version_ids: Iterable[int] = ()) -> None:
+        """Change tokens of versions of dictionaries and of dictionary list, publish revisions of versions.
+
+        Call it after commit.
+        """
+        tokens = {_VERSIONS_MARKER_KEY.format(dictionary_id): new_revision() for dictionary_id in dictionary_ids}
+        if tokens:
+            tokens[_LIST_MARKER_KEY] = new_revision()
+        caches[self.alias].set_many(tokens, self.ttl)
+        self._publish_revisions(list(version_ids))
+
+    def _publish_revisions(self, version_ids: list[int]) -> None:
+        """Publish revisions of versions, revisions of deleted versions are dropped."""
+        revisions = selectors.dictionary_version_revisions(version_ids=version_ids)
+        cache = caches[self.alias]
+        for version_id in version_ids:
+            key = _REVISION_MARKER_KEY.format(version_id)
+            revision = revisions.get(version_id)
+            if revision is None:
+                cache.delete(key)
+            else:
+                cache.set(key, revision, self.ttl)
+
+
+class ResponseCache(object):  # noqa: WPS214
+    """Read-through cache of encoded list responses, shared by workers through Django cache.
+
+    Entries of elements lists are keyed by version (which belongs to one dictionary), its revision
+    and format of response, so entries of changed versions are not reachable, even when they are
+    filled by requests racing with changes. Entries of dictionary lists are keyed by ETag.
+    Cold entry is filled by one request, concurrent requests wait for it not longer than fill timeout.
+    Filled content is not stored, when it is read from a replica lagging behind the key.
+    Entries expire after ttl.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        *,
+        alias: str,
+        ttl: int,
+        fill_timeout: int,
+        max_size: int,
+        formats: Iterable[str],
+    ) -> None:
+        """Create cache of responses in the given formats stored in Django cache with alias."""
+        self.alias = alias
+        self.ttl = ttl
+        self.fill_timeout = fill_timeout
+        self.max_size = max_size
+        self.formats = tuple(formats)
+
+    def is_cacheable(self, request: Request) -> bool:
+        """Check that response in format negotiated for request is cached."""
+        renderer = request.accepted_renderer
+        # Media type parameters, such as indent of JSON, change content of response.
+        return renderer.format in self.formats and request.accepted_media_type == renderer.media_type
+
+    def get_or_fill(self, key: str, fill: _Fill, is_current: Optional[_IsCurrent] = None) -> bytes:
+        """Return cached content of response, fill is called on miss by one of concurrent requests.
+
+        Filled content is stored, when is_current confirms after fill that it has state of key.
+        """
+        cache = caches[self.alias]
+        body = cache.get(key)
+        metrics.record_cache_lookup(_RESPONSES_CACHE, hit=isinstance(body, bytes))
+        if body is None:
+            body = self._wait_or_fill(cache, key, fill, is_current)
+        if isinstance(body, bytes):
+            return body
+        # Content is too big to be cached or it is not filled in time.
+        return fill()
+
+    async def aget_or_fill(self, key: str, fill: _AsyncFill, is_current: Optional[_IsCurrent] = None) -> bytes:
+        """Async version of get_or_fill."""
+        cache = caches[self.alias]
+        body = await cache.aget(key)
+        metrics.record_cache_lookup(_RESPONSES_CACHE, hit=isinstance(body, bytes))
+        if body is None:
+            body = await self._await_or_fill(cache, key, fill, is_current)
+        if isinstance(body, bytes):
+            return body
+        return await fill()
+
+    def _wait_or_fill(self, cache: BaseCache, key: str, fill: _Fill, is_current: Optional[_IsCurrent]) -> object:
+        deadline = time.monotonic() + self.fill_timeout
+        fill_key = _FILL_KEY.format(key)
+        while not cache.add(fill_key, value=True, timeout=self.fill_timeout):
+            time.sleep(_FILL_POLL_INTERVAL)
+            body = cache.get(key)
+            if body is not None or time.monotonic() > deadline:
+                return body
+        try:  # noqa: WPS501
+            return self._fill(cache, key, fill, is_current)
+        finally:
+            cache.delete(fill_key)
+
+    async def _await_or_fill(
+        self,
+        cache: BaseCache,
+        key: str,
+        fill: _AsyncFill,
+        is_current: Optional[_IsCurrent],
+    ) -> object:
+        deadline = time.monotonic() + self.fill_timeout
+        fill_key = _FILL_KEY.format(key)
+        while not await cache.aadd(fill_key, value=True, timeout=self.fill_timeout):
+            await asyncio.sleep(_FILL_POLL_INTERVAL)
+            body = await cache.aget(key)
+            if body is not None or time.monotonic() > deadline:
+                return body
+        try:  # noqa: WPS501
+            return await self._afill(cache, key, fill, is_current)
+        finally:
+            await cache.adelete(fill_key)
+
+    def _fill(self, cache: BaseCache, key: str, fill: _Fill, is_current: Optional[_IsCurrent]) -> object:
+        # Entry could be filled by another request between miss and start of fill.
+        body = cache.get(key)
+        if body is None:
+            body = fill()
+            if is_current is None or is_current():
+                cache.set(key, self._stored(body), self.ttl)
+        return body
+
+    async def _afill(self, cache: BaseCache, key: str, fill: _AsyncFill, is_current: Optional[_IsCurrent]) -> object:
+        body = await cache.aget(key)
+        if body is None:
+            body = await fill()
+            if is_current is None or await sync_to_async(is_current)():
+                await cache.aset(key, self._stored(body), self.ttl)
+        return body
+
+    def _stored(self, body: bytes) -> object:
+        return body if len(body) <= self.max_size else _OVERSIZED
+
+
+response_cache = ResponseCache(
+    alias=settings.DICTIONARIES_RESPONSE_CACHE_ALIAS,  # type: ignore[misc]
+    ttl=settings.DICTIONARIES_RESPONSE_CACHE_TTL,  # type: ignore[misc]
+    fill_timeout=settings.DICTIONARIES_RESPONSE_CACHE_FILL_TIMEOUT,  # type: ignore[misc]
+    max_size=settings.DICTIONARIES_RESPONSE_CACHE_MAX_SIZE,  # type: ignore[misc]
+    formats=settings.DICTIONARIES_RESPONSE_CACHE_FORMATS,  # type: ignore[misc]
+)
+
+
+def element_list_key(*, version_id: int, revision: str, response_format: str) -> str:
+    """Return key of elements list response of revision of version in format."""
+    return _ELEMENT_LIST_KEY.format(version_id, revision, response_format)
+
+
+def dictionary_list_key(*, etag: str) -> str:
+    """Return key of dictionary list response, ETag changes with date filter, format and dictionaries."""
+    return _DICTIONARY_LIST_KEY.format(etag.strip('"'))
+
+
+def cached_response(
+    request: Request,
+    *,
+    key: str,
+    output: _Output,
+    renderer_context: dict[str, object],
+    is_current: Optional[_IsCurrent] = None,
+) -> HttpResponse:
+    """Return response with content from response cache, output is called and rendered on miss."""
+    body = response_cache.get_or_fill(
+        key,
+        lambda: _render(request, output(), renderer_context),
+        is_current,
+    )
+    return _response(request, body)
+
+
+async def acached_response(
+    request: Request,
+    *,
+    key: str,
+    output: _AsyncOutput,
+    renderer_context: dict[str, object],
+    is_current: Optional[_IsCurrent] = None,
+) -> HttpResponse:
+    """Async version of cached_response, output is awaited on miss."""
+    body = await response_cache.aget_or_fill(
+        key,
+        functools.partial(_arender, request, output, renderer_context),
+        is_current,
+    )
+    return _response(request, body)
+
+
+def _token(alias: str, key: str, ttl: int) -> str:
+    cache = caches[alias]
+    token = cache.get(key)
+    if token is None:
+        token = new_revision()
+        if not cache.add(key, token, ttl):
+            token = cache.get(key, token)
+    return token
+
+
+def _response(request: Request, body: bytes) -> HttpResponse:
+    renderer = request.accepted_renderer
+    content_type = renderer.media_type
+    if renderer.charset:
+        content_type = '{0}; charset={1}'.format(content_type, renderer.charset)
+    return HttpResponse(body, content_type=content_type)
+
+
+def _render(request: Request, rendered_output: object, renderer_context: dict[str, object]) -> bytes:
+    with profiling.phase(profiling.RENDERING):
+        return request.accepted_renderer.render(rendered_output, request.accepted_media_type, renderer_context)
+
+
+async def _arender(request: Request, output: _AsyncOutput, renderer_context: dict[str, object]) -> bytes:
+    return _render(request, await output(), renderer_context)
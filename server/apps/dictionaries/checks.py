@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core import checks
+
+_LOCAL_MEMORY_CACHE = 'django.core.cache.backends.locmem.LocMemCache'
+
+
+@checks.register(checks.Tags.caches)
+def check_markers_cache(app_configs, **kwargs) -> list[checks.CheckMessage]:
+    """Check that markers of changes are published to all worker processes.
+
+    Local memory cache is separate in every process, so with many workers snapshots and resolved
+    versions of other workers would not see changes till they expire.
+    """
+    alias = settings.DICTIONARIES_SNAPSHOT_CACHE_ALIAS  # type: ignore[misc]
+    backend = settings.CACHES[alias]['BACKEND']
+    if backend != _LOCAL_MEMORY_CACHE or settings.WEB_CONCURRENCY <= 1:  # type: ignore[misc]
+        return []
+    return [
+        checks.Error(
+            'Cache "{0}" of markers of changes is local for a process, but there are {1} worker processes.'.format(
+                alias,
+                settings.WEB_CONCURRENCY,  # type: ignore[misc]
+            ),
+            hint='Set DJANGO_CACHE_BACKEND and DJANGO_CACHE_LOCATION to a cache shared by workers.',
+            id='dictionaries.E001',
+        ),
+    ]
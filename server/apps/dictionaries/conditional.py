@@ -0,0 +1,163 @@
+import datetime
+import hashlib
+from typing import Optional
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponseBase
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django.utils.timezone import get_default_timezone, now
+
+from server.apps.dictionaries import selectors, snapshots
+
+_ETAG_DIGEST_SIZE = 16
+# Responses of lists are rendered in format negotiated by Accept header.
+_VARY = 'Accept'
+
+
+class CacheHeaders(object):
+    """Caching headers of a response: strong ETag, Last-Modified, Cache-Control, Content-Location and Vary."""
+
+    def __init__(  # noqa: WPS211
+        self,
+        *parts: object,
+        last_modified: Optional[datetime.datetime] = None,
+        cache_control: Optional[dict[str, object]] = None,
+        content_location: Optional[str] = None,
+        vary: Optional[str] = None,
+    ) -> None:
+        """Build ETag by parts, which should change together with content of response."""
+        digest = hashlib.blake2b(digest_size=_ETAG_DIGEST_SIZE)
+        for part in parts:
+            digest.update(str(part).encode())
+            digest.update(b'\x00')
+        self.etag = quote_etag(digest.hexdigest())
+        self.last_modified = last_modified
+        self.cache_control = cache_control or {}
+        self.content_location = content_location
+        self.vary = vary
+
+    def not_modified(self, request: HttpRequest) -> Optional[HttpResponseBase]:
+        """Return 304 (or 412) response when client already has actual content, otherwise None."""
+        response = get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=self._timestamp(),
+        )
+        if response is not None:
+            self.apply(response)
+        return response
+
+    def apply(self, response: HttpResponseBase) -> HttpResponseBase:
+        """Set caching headers of response."""
+        response.headers['ETag'] = self.etag
+        if self.last_modified is not None:
+            response.headers['Last-Modified'] = http_date(self._timestamp())
+        if self.content_location is not None:
+            response.headers['Content-Location'] = self.content_location
+        if self.cache_control:
+            patch_cache_control(response, **self.cache_control)
+        if self.vary is not None:
+            patch_vary_headers(response, (self.vary,))
+        return response
+
+    def _timestamp(self) -> Optional[int]:
+        if self.last_modified is None:
+            return None
+        return int(self.last_modified.timestamp())
+
+
+def dictionary_list_headers(request: HttpRequest) -> CacheHeaders:
+    """Return caching headers of dictionary list response by published token of dictionary list.
+
+    Token is read from cache without queries, list should be read from the primary database.
+    """
+    return CacheHeaders(
+        request.get_full_path(),
+        _media_type(request),
+        snapshots.snapshot_registry.markers.list_token(),
+        vary=_VARY,
+    )
+
+
+def element_list_headers(
+    request: HttpRequest,
+    *,
+    dictionary_id: int,
+    version_revision: Optional[tuple[str, str, datetime.datetime]],
+    current: bool = False,
+    expected_revision: Optional[str] = None,
+) -> CacheHeaders:
+    """Return caching headers of elements list response by revision of version.
+
+    Response of content-addressed url (with expected revision) is immutable, response
+    of current version is cached not longer than till start of the next version. Response
+    of current version has no Last-Modified, the next version could be modified earlier
+    than the previous one, so it is validated by ETag only.
+    """
+    if expected_revision is not None and (version_revision is None or version_revision[1] != expected_revision):
+        raise Http404
+    if version_revision is None:
+        return CacheHeaders(
+            request.get_full_path(),
+            _media_type(request),
+            cache_control=_max_age_cache_control(dictionary_id, current),
+            vary=_VARY,
+        )
+    version, revision, last_modified = version_revision
+
+    if expected_revision is not None:
+        cache_control = {
+            'public': True,
+            'max_age': settings.DICTIONARIES_ELEMENTS_IMMUTABLE_MAX_AGE,  # type: ignore[misc]
+            'immutable': True,
+        }
+    else:
+        cache_control = _max_age_cache_control(dictionary_id, current)
+
+    return CacheHeaders(
+        request.get_full_path(),
+        _media_type(request),
+        revision,
+        last_modified=None if current else last_modified,
+        cache_control=cache_control,
+        content_location=_content_location(request, dictionary_id, version, revision),
+        vary=_VARY,
+    )
+
+
+def _media_type(request: HttpRequest) -> str:
+    """Media type of negotiated renderer, representations in different formats have different ETags."""
+    return getattr(request, 'accepted_media_type', '')
+
+
+def _content_location(request: HttpRequest, dictionary_id: int, version: str, revision: str) -> str:
+    content_location = reverse(
+        'dictionary-version-elements',
+        kwargs={
+            'dictionary_id': dictionary_id,
+            'version': version,
+            'revision': revision,
+        },
+    )
+    query_string = request.META.get('QUERY_STRING')
+    if query_string:
+        content_location = '{0}?{1}'.format(content_location, query_string)
+
+    return content_location
+
+
+def _max_age_cache_control(dictionary_id: int, current: bool) -> dict[str, object]:
+    max_age = settings.DICTIONARIES_ELEMENTS_MAX_AGE  # type: ignore[misc]
+    if current:
+        next_version_date = selectors.dictionary_next_version_date(dictionary_id=dictionary_id)
+        if next_version_date is not None:
+            next_version_start = datetime.datetime.combine(
+                next_version_date,
+                datetime.time.min,
+                tzinfo=get_default_timezone(),
+            )
+            seconds_to_next_version = int((next_version_start - now()).total_seconds())
+            max_age = max(0, min(max_age, seconds_to_next_version))
+    return {'public': True, 'max_age': max_age}
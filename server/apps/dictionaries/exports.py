@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+import zlib
+from itertools import islice
+from typing import Iterable, Iterator
+
+from django.conf import settings
+
+from server.apps.dictionaries import formats, selectors
+
+# Window bits of zlib to write gzip header and trailer.
+_GZIP_WBITS = 31
+
+
+def stream_version_export(
+    version_id: int,
+    file_format: str,
+    *,
+    compress: bool = True,
+    chunk_size: int = settings.DICTIONARIES_ELEMENTS_STREAM_CHUNK_SIZE,  # type: ignore[misc]
+) -> Iterator[bytes]:
+    """Yield all elements of version in CSV or JSON lines, gzip-compressed by default.
+
+    Memory does not depend on count of elements, rows are fetched as in streaming.stream_elements.
+    """
+    pairs = selectors.dictionary_version_element_pairs(
+        version_id=version_id,
+    ).order_by('id').iterator(chunk_size=chunk_size)
+    parts = write_elements(pairs, file_format, chunk_size=chunk_size)
+    if compress:
+        return gzip_compress(parts)
+    return (part.encode() for part in parts)
+
+
+def write_elements(elements: Iterable[formats.ElementRow], file_format: str, *, chunk_size: int) -> Iterator[str]:
+    """Yield CSV with header or JSON lines by parts of up to chunk_size elements."""
+    encode_chunk = _csv_chunk if file_format == formats.FORMAT_CSV else _jsonl_chunk
+    if file_format == formats.FORMAT_CSV:
+        yield _csv_chunk([formats.ELEMENT_FIELDS])
+    elements = iter(elements)
+    chunk = list(islice(elements, chunk_size))
+    while chunk:
+        yield encode_chunk(chunk)
+        chunk = list(islice(elements, chunk_size))
+
+
+def gzip_compress(parts: Iterable[str]) -> Iterator[bytes]:
+    """Yield gzip-compressed parts, compression state is kept between parts."""
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+    for part in parts:
+        compressed = compressor.compress(part.encode())
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _csv_chunk(chunk: list[formats.ElementRow]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(chunk)
+    return buffer.getvalue()
+
+
+def _jsonl_chunk(chunk: list[formats.ElementRow]) -> str:
+    return ''.join(
+        '{0}\n'.format(json.dumps({'code': code, 'value': element_value}, ensure_ascii=False))
+        for code, element_value in chunk
+    )
@@ -0,0 +1,49 @@
+import gzip
+import io
+import sys
+from typing import BinaryIO, TextIO
+
+from django.core.exceptions import ValidationError
+
+from server.apps.dictionaries.formats import FORMATS
+
+_GZIP_SUFFIX = '.gz'
+_STDIO_PATH = '-'
+
+
+def format_from_path(path: str) -> str:
+    """Return format of elements file by its extension, compressed files are supported."""
+    extension = path.removesuffix(_GZIP_SUFFIX).rpartition('.')[2].lower()
+    if extension not in FORMATS:
+        raise ValidationError(
+            'Unknown format of file {0}, expected one of: {1}.'.format(path, ', '.join(FORMATS)),
+        )
+    return extension
+
+
+def is_gzip_path(path: str) -> bool:
+    """Check that elements file is gzip-compressed by its extension."""
+    return path.endswith(_GZIP_SUFFIX)
+
+
+def open_elements_file(path: str) -> TextIO:
+    """Open elements file for reading as text, '-' is standard input."""
+    if path == _STDIO_PATH:
+        return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8-sig', newline='')
+    if is_gzip_path(path):
+        return gzip.open(path, 'rt', encoding='utf-8-sig', newline='')
+    return open(path, encoding='utf-8-sig', newline='')  # noqa: WPS515
+
+
+def open_elements_upload(uploaded: BinaryIO, name: str) -> TextIO:
+    """Open uploaded elements file for reading as text, gzip-compressed by extension of name."""
+    if is_gzip_path(name):
+        uploaded = gzip.GzipFile(fileobj=uploaded)  # type: ignore[assignment]
+    return io.TextIOWrapper(uploaded, encoding='utf-8-sig', newline='')
+
+
+def open_elements_output(path: str) -> BinaryIO:
+    """Open elements file for writing as bytes, '-' is standard output."""
+    if path == _STDIO_PATH:
+        return open(sys.stdout.fileno(), 'wb', closefd=False)  # noqa: WPS515
+    return open(path, 'wb')  # noqa: WPS515
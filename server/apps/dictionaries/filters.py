@@ -4,8 +4,9 @@ import django_filters
 class DictionaryFilter(django_filters.FilterSet):
     """Dictionary filter class."""
 
+    # Dictionaries with a version started by date, without join of versions.
     date = django_filters.DateFilter(
-        field_name='dictionaryversion__date',
+        field_name='first_version_date',
         lookup_expr='lte',
     )
 
@@ -0,0 +1,76 @@
+import csv
+import json
+from typing import Iterator, TextIO
+
+from django.core.exceptions import ValidationError
+
+from server.apps.dictionaries.models import DICTIONARY_ELEMENT_CODE_MAX_LENGTH, DICTIONARY_ELEMENT_VALUE_MAX_LENGTH
+
+FORMAT_CSV = 'csv'
+FORMAT_JSONL = 'jsonl'
+FORMATS = (FORMAT_CSV, FORMAT_JSONL)
+
+ELEMENT_FIELDS = ('code', 'value')
+_ELEMENT_FIELDS_MAX_LENGTH = (DICTIONARY_ELEMENT_CODE_MAX_LENGTH, DICTIONARY_ELEMENT_VALUE_MAX_LENGTH)
+
+ElementRow = tuple[str, str]
+# Line number and raw pair (code, value).
+_NumberedRow = tuple[int, tuple[object, object]]
+
+
+def read_elements(stream: TextIO, file_format: str) -> Iterator[ElementRow]:
+    """Yield validated pairs (code, value) from CSV with header or JSON lines.
+
+    Rows are read one by one, so memory does not depend on size of file, except
+    for codes kept to reject duplicates.
+    """
+    rows = _read_csv(stream) if file_format == FORMAT_CSV else _read_jsonl(stream)
+    codes: set[str] = set()
+    for line_number, row in rows:
+        element = _validated_element(line_number, row)
+        if element[0] in codes:
+            raise ValidationError('Line {0}: duplicate code {1!r}.'.format(line_number, element[0]))
+        codes.add(element[0])
+        yield element
+
+
+def _read_csv(stream: TextIO) -> Iterator[_NumberedRow]:
+    reader = csv.reader(stream)
+    header: list[str] = next(reader, [])
+    if any(field not in header for field in ELEMENT_FIELDS):
+        raise ValidationError('Line 1: header with columns code and value is expected.')
+    code_index, value_index = (header.index(field) for field in ELEMENT_FIELDS)
+    for row in reader:
+        if not row:
+            continue
+        if len(row) != len(header):
+            raise ValidationError('Line {0}: expected {1} columns.'.format(reader.line_num, len(header)))
+        yield reader.line_num, (row[code_index], row[value_index])
+
+
+def _read_jsonl(stream: TextIO) -> Iterator[_NumberedRow]:
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield line_number, _parse_json_line(line_number, line)
+
+
+def _parse_json_line(line_number: int, line: str) -> tuple[object, object]:
+    try:
+        element = json.loads(line)
+    except ValueError as exc:
+        raise ValidationError('Line {0}: invalid JSON: {1}.'.format(line_number, exc))
+    if not isinstance(element, dict):
+        raise ValidationError('Line {0}: object with code and value is expected.'.format(line_number))
+    return element.get('code'), element.get('value')
+
+
+def _validated_element(line_number: int, row: tuple[object, object]) -> ElementRow:
+    code, element_value = row
+    if not isinstance(code, str) or not isinstance(element_value, str):
+        raise ValidationError('Line {0}: code and value should be strings.'.format(line_number))
+    for field, field_value, max_length in zip(ELEMENT_FIELDS, (code, element_value), _ELEMENT_FIELDS_MAX_LENGTH):
+        if not field_value or len(field_value) > max_length:
+            raise ValidationError(
+                'Line {0}: {1} should be from 1 to {2} characters.'.format(line_number, field, max_length),
+            )
+    return code, element_value
@@ -0,0 +1,74 @@
+from typing import Iterator
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from server.apps.dictionaries import files, formats
+from server.apps.dictionaries.models import DICTIONARY_ELEMENT_VALUE_MAX_LENGTH, DICTIONARY_VERSION_VERSION_MAX_LENGTH
+
+_ELEMENTS_HELP_TEXT = _('CSV with header code,value or JSON lines, optionally gzip-compressed.')
+
+
+class CloneVersionForm(forms.Form):
+    """Form of new version and changes of its elements for clone of dictionary version."""
+
+    version = forms.CharField(max_length=DICTIONARY_VERSION_VERSION_MAX_LENGTH, label=_('Version'))
+    date = forms.DateField(label=_('Date'))
+    elements = forms.FileField(
+        required=False,
+        label=_('Added and changed elements'),
+        help_text=_ELEMENTS_HELP_TEXT,
+    )
+    removed_codes = forms.CharField(
+        required=False,
+        widget=forms.Textarea,
+        label=_('Codes of removed elements'),
+        help_text=_('One code per line.'),
+    )
+
+    def clean_elements(self) -> Iterator[formats.ElementRow]:
+        """Return pairs (code, value) of uploaded file, they are read and validated while they are written."""
+        return _read_elements(self.cleaned_data['elements'])
+
+    def clean_removed_codes(self) -> list[str]:
+        """Return not empty codes, one per line."""
+        codes = (code.strip() for code in self.cleaned_data['removed_codes'].splitlines())
+        return [code for code in codes if code]
+
+
+class UploadElementsForm(forms.Form):
+    """Form of elements uploaded to dictionary version."""
+
+    elements = forms.FileField(label=_('Added and changed elements'), help_text=_ELEMENTS_HELP_TEXT)
+    replace = forms.BooleanField(
+        required=False,
+        label=_('Replace elements'),
+        help_text=_('Elements missing in the file are deleted.'),
+    )
+
+    def clean_elements(self) -> Iterator[formats.ElementRow]:
+        """Return pairs (code, value) of uploaded file, they are read and validated while they are written."""
+        return _read_elements(self.cleaned_data['elements'])
+
+
+class ElementValueForm(forms.Form):
+    """Form of value set to dictionary elements."""
+
+    element_value = forms.CharField(max_length=DICTIONARY_ELEMENT_VALUE_MAX_LENGTH, label=_('Element value'))
+
+
+def _read_elements(uploaded) -> Iterator[formats.ElementRow]:
+    if not uploaded:
+        return iter(())
+    # Format is checked by form, rows are checked by service in transaction of writes.
+    return _stream_elements(uploaded, files.format_from_path(uploaded.name))
+
+
+def _stream_elements(uploaded, file_format: str) -> Iterator[formats.ElementRow]:
+    """Yield rows of uploaded file, errors of rows are errors of elements field."""
+    with files.open_elements_upload(uploaded.file, uploaded.name) as stream:
+        try:
+            yield from formats.read_elements(stream, file_format)
+        except ValidationError as exc:
+            raise ValidationError({'elements': exc.error_list}) from exc
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from server.apps.dictionaries import services
+from server.apps.dictionaries.models import Dictionary, DictionaryVersion
+
+# Version is kept as a full one when it differs from the last full version by more than half of its elements.
+_DEFAULT_MAX_RATIO = 0.5
+
+
+class Command(BaseCommand):
+    """Store versions of dictionary as differences from earlier versions."""
+
+    help = 'Store versions of dictionary as differences from earlier ones, or back as full versions.'  # noqa: WPS125
+
+    def add_arguments(self, parser) -> None:
+        """Add command arguments."""
+        parser.add_argument('dictionary', help='Code of dictionary.')
+        parser.add_argument(
+            '--max-ratio',
+            type=float,
+            default=_DEFAULT_MAX_RATIO,
+            help='Max count of differences relative to count of elements of compacted version.',
+        )
+        parser.add_argument(
+            '--expand',
+            action='store_true',
+            help='Store all versions as full versions, it is required before delete of a base version.',
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: WPS110
+        """Run command."""
+        dictionary = Dictionary.objects.filter(code=options['dictionary']).first()
+        if dictionary is None:
+            raise CommandError('Dictionary {0} does not exist.'.format(options['dictionary']))
+
+        if options['expand']:
+            self._expand(dictionary)
+            return
+
+        compacted = services.dictionary_compact(dictionary_id=dictionary.id, max_ratio=options['max_ratio'])
+        self.stdout.write(self.style.SUCCESS('Compacted {0} versions.'.format(compacted)))
+
+    def _expand(self, dictionary: Dictionary) -> None:
+        version_ids = DictionaryVersion.objects.filter(
+            dictionary=dictionary,
+            base_version__isnull=False,
+        ).values_list('id', flat=True)
+        expanded = 0
+        for version_id in list(version_ids):
+            services.dictionary_version_expand(version_id=version_id)
+            expanded += 1
+        self.stdout.write(self.style.SUCCESS('Expanded {0} versions.'.format(expanded)))
@@ -0,0 +1,57 @@
+from typing import Optional
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from server.apps.dictionaries import exports, files, formats, selectors
+from server.apps.dictionaries.models import Dictionary
+
+
+class Command(BaseCommand):
+    """Write elements of dictionary version to CSV or JSON lines file."""
+
+    help = 'Write elements of dictionary version to CSV (with header code,value) or JSON lines file.'  # noqa: WPS125
+
+    def add_arguments(self, parser) -> None:
+        """Add command arguments."""
+        parser.add_argument('dictionary', help='Code of dictionary.')
+        parser.add_argument('path', help='Path of file, gzip-compressed with extension .gz; "-" is standard output.')
+        parser.add_argument(
+            '--dictionary-version',
+            help='Version of dictionary, by default the current one.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=formats.FORMATS,
+            help='Format of file, by default taken from extension of path.',
+        )
+        parser.add_argument(
+            '--gzip',
+            action='store_true',
+            help='Compress output regardless of extension of path.',
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: WPS110
+        """Run command."""
+        path = options['path']
+        try:
+            file_format = options['format'] or files.format_from_path(path)
+        except ValidationError as exc:
+            raise CommandError(exc.message)
+
+        parts = exports.stream_version_export(
+            self._version_id(options['dictionary'], options['dictionary_version']),
+            file_format,
+            compress=options['gzip'] or files.is_gzip_path(path),
+        )
+        with files.open_elements_output(path) as output:
+            output.writelines(parts)
+
+    def _version_id(self, dictionary_code: str, version: Optional[str]) -> int:
+        dictionary = Dictionary.objects.filter(code=dictionary_code).first()
+        if dictionary is None:
+            raise CommandError('Dictionary {0} does not exist.'.format(dictionary_code))
+        version_id = selectors.dictionary_version_id(dictionary_id=dictionary.id, version=version)
+        if version_id is None:
+            raise CommandError('Version of dictionary {0} does not exist.'.format(dictionary_code))
+        return version_id
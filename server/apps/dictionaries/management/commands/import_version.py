@@ -0,0 +1,83 @@
+import datetime
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from server.apps.dictionaries import files, formats, services
+from server.apps.dictionaries.models import Dictionary
+
+# Guards rate of progress against division by zero.
+_MIN_ELAPSED_SECONDS = 0.001
+
+
+class Command(BaseCommand):
+    """Load elements of dictionary version from CSV or JSON lines file."""
+
+    help = 'Load elements of dictionary version from CSV (with header code,value) or JSON lines file.'  # noqa: WPS125
+
+    def add_arguments(self, parser) -> None:
+        """Add command arguments."""
+        parser.add_argument('dictionary', help='Code of dictionary.')
+        parser.add_argument('version', help='Version of dictionary, created if missing.')
+        parser.add_argument('path', help='Path of file, optionally gzip-compressed; "-" reads standard input.')
+        parser.add_argument(
+            '--date',
+            type=datetime.date.fromisoformat,
+            help='Start date of created version in format YYYY-MM-DD.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=formats.FORMATS,
+            help='Format of file, by default taken from extension of path.',
+        )
+        parser.add_argument(
+            '--replace',
+            action='store_true',
+            help='Replace existing elements of version.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Count of elements written by one query.',
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: WPS110
+        """Run command."""
+        dictionary = Dictionary.objects.filter(code=options['dictionary']).first()
+        if dictionary is None:
+            raise CommandError('Dictionary {0} does not exist.'.format(options['dictionary']))
+
+        self._verbosity = options['verbosity']
+        self._started_at = time.monotonic()
+        try:
+            written = self._import(dictionary, options)
+        except (OSError, ValidationError) as exc:
+            raise CommandError('Import failed, nothing is changed: {0}'.format(exc))
+
+        self.stdout.write(self.style.SUCCESS(
+            'Imported {0} elements of version {1}.'.format(written, options['version']),
+        ))
+
+    def _import(self, dictionary: Dictionary, options) -> int:
+        file_format = options['format'] or files.format_from_path(options['path'])
+        with files.open_elements_file(options['path']) as stream:
+            with transaction.atomic():
+                dictionary_version = services.dictionary_version_import_prepare(
+                    dictionary=dictionary,
+                    version=options['version'],
+                    date=options['date'],
+                    replace=options['replace'],
+                )
+                return services.dictionary_version_import(
+                    version_id=dictionary_version.id,
+                    elements=formats.read_elements(stream, file_format),
+                    batch_size=options['batch_size'],
+                    progress=self._report_progress,
+                )
+
+    def _report_progress(self, written: int) -> None:
+        if self._verbosity >= 1:
+            elapsed = max(time.monotonic() - self._started_at, _MIN_ELAPSED_SECONDS)
+            self.stdout.write('{0} elements, {1:.0f} elements/s'.format(written, written / elapsed))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from server.apps.dictionaries import services
+
+
+class Command(BaseCommand):
+    """Recompute current versions of dictionaries. Should be run by scheduler right after midnight UTC."""
+
+    help = 'Recompute current versions of dictionaries whose next version has become active.'  # noqa: WPS125
+
+    def add_arguments(self, parser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recompute current versions of all dictionaries.',
+        )
+
+    def handle(self, *args, **options) -> None:  # noqa: WPS110
+        """Run command."""
+        updated = services.dictionary_current_version_refresh(only_stale=not options['all'])
+        self.stdout.write('Refreshed current versions of {0} dictionaries.'.format(updated))
@@ -0,0 +1,77 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from server.apps.dictionaries import seeding
+from server.apps.dictionaries.models import Dictionary
+
+_DEFAULT_DICTIONARIES = 1000
+_DEFAULT_VERSIONS = 10
+_DEFAULT_ELEMENTS = 1000000
+_DEFAULT_FUTURE_SHARE = 0.1
+
+# Guards rate of progress against division by zero.
+_MIN_ELAPSED_SECONDS = 0.001
+
+
+class Command(BaseCommand):
+    """Create synthetic dictionaries with versions and elements for load tests."""
+
+    help = 'Create synthetic dictionaries with skewed sizes, past and future versions for load tests.'  # noqa: WPS125
+
+    def add_arguments(self, parser) -> None:
+        """Add command arguments."""
+        parser.add_argument('--dictionaries', type=int, default=_DEFAULT_DICTIONARIES, help='Count of dictionaries.')
+        parser.add_argument(
+            '--versions',
+            type=int,
+            default=_DEFAULT_VERSIONS,
+            help='Max count of past versions of a dictionary.',
+        )
+        parser.add_argument(
+            '--elements',
+            type=int,
+            default=_DEFAULT_ELEMENTS,
+            help='Total count of elements of all versions.',
+        )
+        parser.add_argument(
+            '--skew',
+            type=float,
+            default=1,
+            help="Exponent of Zipf's law of dictionary sizes, 0 gives dictionaries of the same size.",
+        )
+        parser.add_argument(
+            '--future-share',
+            type=float,
+            default=_DEFAULT_FUTURE_SHARE,
+            help='Share of dictionaries with a version starting in the future.',
+        )
+        parser.add_argument('--seed', type=int, default=0, help='Seed of random generator, data is the same for it.')
+        parser.add_argument('--code-prefix', default='seed', help='Prefix of codes of dictionaries.')
+        parser.add_argument('--batch-size', type=int, help='Count of elements written by one query.')
+
+    def handle(self, *args, **options) -> None:  # noqa: WPS110
+        """Run command."""
+        config = seeding.SeedConfig(
+            dictionaries=options['dictionaries'],
+            versions=options['versions'],
+            elements=options['elements'],
+            skew=options['skew'],
+            future_share=options['future_share'],
+            seed=options['seed'],
+            code_prefix=options['code_prefix'],
+        )
+        if Dictionary.objects.filter(code__startswith='{0}_'.format(config.code_prefix)).exists():
+            raise CommandError('Dictionaries with prefix {0} already exist.'.format(config.code_prefix))
+
+        self._verbosity = options['verbosity']
+        self._started_at = time.monotonic()
+        written = seeding.seed_dictionaries(config, batch_size=options['batch_size'], progress=self._report_progress)
+        self.stdout.write(self.style.SUCCESS(
+            'Created {0} dictionaries with {1} elements.'.format(config.dictionaries, written),
+        ))
+
+    def _report_progress(self, written: int) -> None:
+        if self._verbosity >= 2:
+            elapsed = max(time.monotonic() - self._started_at, _MIN_ELAPSED_SECONDS)
+            self.stdout.write('{0} elements, {1:.0f} elements/s'.format(written, written / elapsed))
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.7 on 2026-10-18 11:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionaries', '0002_alter_dictionary_id_alter_dictionaryelement_id_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='dictionaryelement',
+            name='unique_code_version_id',
+        ),
+        migrations.AddIndex(
+            model_name='dictionaryelement',
+            index=models.Index(fields=['version', 'id'], name='element_version_id_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='dictionaryelement',
+            constraint=models.UniqueConstraint(fields=('version_id', 'code'), name='unique_code_version_id'),
+        ),
+    ]
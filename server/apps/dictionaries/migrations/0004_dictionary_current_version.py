@@ -0,0 +1,48 @@
+# Generated by Django 4.1.7 on 2026-10-18 11:38
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import OuterRef, Subquery
+from django.utils.timezone import localdate
+
+
+def refresh_current_versions(apps, schema_editor):
+    Dictionary = apps.get_model('dictionaries', 'Dictionary')
+    DictionaryVersion = apps.get_model('dictionaries', 'DictionaryVersion')
+    date = localdate()
+
+    Dictionary.objects.update(
+        current_version=Subquery(
+            DictionaryVersion.objects.filter(
+                dictionary_id=OuterRef('pk'),
+                date__lte=date,
+            ).order_by('-date').values('id')[:1],
+        ),
+        next_version_date=Subquery(
+            DictionaryVersion.objects.filter(
+                dictionary_id=OuterRef('pk'),
+                date__gt=date,
+            ).order_by('date').values('date')[:1],
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionaries', '0003_element_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dictionary',
+            name='current_version',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='dictionaries.dictionaryversion', verbose_name='Current version'),
+        ),
+        migrations.AddField(
+            model_name='dictionary',
+            name='next_version_date',
+            field=models.DateField(blank=True, db_index=True, editable=False, null=True, verbose_name='Next version start date'),
+        ),
+        migrations.RunPython(refresh_current_versions, migrations.RunPython.noop),
+    ]
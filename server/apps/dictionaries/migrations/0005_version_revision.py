@@ -0,0 +1,44 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:10
+
+import uuid
+
+from django.db import migrations, models
+import django.utils.timezone
+import server.apps.dictionaries.models
+
+
+def fill_revisions(apps, schema_editor):
+    """Default of added field is computed once, so every existing version gets its own revision here."""
+    DictionaryVersion = apps.get_model('dictionaries', 'DictionaryVersion')
+    versions = list(DictionaryVersion.objects.only('id'))
+    for version in versions:
+        version.revision = uuid.uuid4().hex
+    DictionaryVersion.objects.bulk_update(versions, ['revision'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionaries', '0004_dictionary_current_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dictionary',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Modified at'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='dictionaryversion',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Modified at'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='dictionaryversion',
+            name='revision',
+            field=models.CharField(default=server.apps.dictionaries.models.new_revision, editable=False, max_length=32, verbose_name='Revision'),
+        ),
+        migrations.RunPython(fill_revisions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionaries', '0005_version_revision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dictionaryelement',
+            name='is_removed',
+            field=models.BooleanField(default=False, verbose_name='Removed from base version'),
+        ),
+        migrations.AddField(
+            model_name='dictionaryversion',
+            name='base_version',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.RESTRICT, related_name='delta_versions', to='dictionaries.dictionaryversion', verbose_name='Base version'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.7 on 2026-10-18 13:04
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def refresh_first_version_dates(apps, schema_editor):
+    Dictionary = apps.get_model('dictionaries', 'Dictionary')
+    DictionaryVersion = apps.get_model('dictionaries', 'DictionaryVersion')
+
+    Dictionary.objects.update(
+        first_version_date=Subquery(
+            DictionaryVersion.objects.filter(
+                dictionary_id=OuterRef('pk'),
+            ).order_by('date').values('date')[:1],
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionaries', '0006_version_base_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dictionary',
+            name='first_version_date',
+            field=models.DateField(blank=True, db_index=True, editable=False, null=True, verbose_name='First version start date'),
+        ),
+        migrations.RunPython(refresh_first_version_dates, migrations.RunPython.noop),
+    ]
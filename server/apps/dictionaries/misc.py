@@ -16,8 +16,41 @@ ELEMENTS_CHECK_API_DESCRIPTION = _(
     ' and value is present in the specified version of the dictionary.',  # noqa: WPS326
 )
 
+VERSION_ELEMENTS_LIST_API_SUMMARY = _('Getting elements of a dictionary version revision')
+VERSION_ELEMENTS_LIST_API_DESCRIPTION = _(
+    'Content-addressed url of elements of a dictionary version. The url is returned in header'
+    ' Content-Location of elements list and changes with any change of the version elements,'  # noqa: WPS326
+    ' so responses are cached forever. Outdated revision is not found.',  # noqa: WPS326
+)
+
+ELEMENTS_EXPORT_API_SUMMARY = _('Downloading elements of a dictionary version')
+ELEMENTS_EXPORT_API_DESCRIPTION = _(
+    'All elements of a dictionary version in a gzip-compressed file CSV (with header code,value)'
+    ' or JSON Lines. The file is written by parts while elements are read.',  # noqa: WPS326
+)
+
+VERSION_DIFF_API_SUMMARY = _('Getting differences of dictionary versions')
+VERSION_DIFF_API_DESCRIPTION = _(
+    'Elements added, removed and changed (with previous value) in one version of a dictionary'
+    ' compared to another. Elements are matched by code and ordered by code.',  # noqa: WPS326
+)
+
+SYNC_API_SUMMARY = _('Synchronization of a dictionary copy')
+SYNC_API_DESCRIPTION = _(
+    'Changes of elements from a client copy to the current version with a token for the next request.',
+)
+
+ELEMENTS_BATCH_CHECK_API_SUMMARY = _('Validation of elements batch')
+ELEMENTS_BATCH_CHECK_API_DESCRIPTION = _(
+    'Validation of many dictionary elements by one request. The version is resolved once'
+    ' for all elements, the result is returned for each element in the order of the request.',  # noqa: WPS326
+)
+
 DICTIONARY_ID_PATH_PARAM_DESCRIPTION = _('Dictionary identifier')
 
+VERSION_PATH_PARAM_DESCRIPTION = _('Version of dictionary')
+REVISION_PATH_PARAM_DESCRIPTION = _('Revision of dictionary version elements')
+
 DATE_QUERY_PARAM_DESCRIPTION = _(
     'Start date in format YYYY-MM-DD. If not passed, all dictionaries are returned.',
 )
@@ -27,5 +60,21 @@ VERSION_QUERY_PARAM_DESCRIPTION = _(
     ' The current version is the one whose start date is later than all other versions of '  # noqa: WPS326
     ' the dictionary, but not later than the current date.',  # noqa: WPS326
 )
+PAGINATION_QUERY_PARAM_DESCRIPTION = _(
+    'Optional way to retrieve large versions. With "cursor" elements are returned by pages'
+    ' with links "next" and "previous". With "stream" all elements are written to response by parts.',  # noqa: WPS326
+)
+ORDERING_QUERY_PARAM_DESCRIPTION = _('Ordering of elements with cursor pagination.')
+PAGE_SIZE_QUERY_PARAM_DESCRIPTION = _('Count of elements on a page with cursor pagination.')
+CURSOR_QUERY_PARAM_DESCRIPTION = _('Cursor of a page, taken from links "next" and "previous".')
+FROM_QUERY_PARAM_DESCRIPTION = _('Version of dictionary to compare with.')
+TO_QUERY_PARAM_DESCRIPTION = _('Compared version of dictionary. If not passed, the current version is compared.')
+STREAM_QUERY_PARAM_DESCRIPTION = _('Write elements to response by parts, for large versions.')
+TOKEN_QUERY_PARAM_DESCRIPTION = _(
+    'Token returned by the previous synchronization. Without known state all elements are returned.',
+)
+SYNC_VERSION_QUERY_PARAM_DESCRIPTION = _('Version of the client copy, used without token.')
+SYNC_REVISION_QUERY_PARAM_DESCRIPTION = _('Revision of elements of the client copy version, required with version.')
+FORMAT_QUERY_PARAM_DESCRIPTION = _('Format of file, CSV by default.')
 CODE_QUERY_PARAM_DESCRIPTION = _('Code of a dictionary element')
 VALUE_QUERY_PARAM_DESCRIPTION = _('Value of a dictionary element')
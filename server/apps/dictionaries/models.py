@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -6,6 +8,12 @@ DICTIONARY_NAME_MAX_LENGTH = 300
 DICTIONARY_VERSION_VERSION_MAX_LENGTH = 50
 DICTIONARY_ELEMENT_CODE_MAX_LENGTH = 100
 DICTIONARY_ELEMENT_VALUE_MAX_LENGTH = 300
+DICTIONARY_VERSION_REVISION_MAX_LENGTH = 32
+
+
+def new_revision() -> str:
+    """Return new unique revision of dictionary version elements."""
+    return uuid.uuid4().hex
 
 
 class Dictionary(models.Model):
@@ -21,6 +29,32 @@ class Dictionary(models.Model):
         verbose_name=_('Name'),
     )
     description = models.TextField(blank=True, verbose_name=_('Description'))
+    # Current version, start dates of the first and the next versions are maintained
+    # by services.dictionary_current_version_refresh.
+    current_version = models.ForeignKey(
+        'DictionaryVersion',
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name=_('Current version'),
+    )
+    next_version_date = models.DateField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        verbose_name=_('Next version start date'),
+    )
+    first_version_date = models.DateField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        verbose_name=_('First version start date'),
+    )
+    modified_at = models.DateTimeField(auto_now=True, verbose_name=_('Modified at'))
 
     class Meta:
         verbose_name = _('Dictionary')
@@ -44,6 +78,24 @@ class DictionaryVersion(models.Model):
         verbose_name=_('Version'),
     )
     date = models.DateField(verbose_name=_('Date'))
+    # Revision is changed by services.dictionary_version_touch on every change of version elements.
+    revision = models.CharField(
+        max_length=DICTIONARY_VERSION_REVISION_MAX_LENGTH,
+        default=new_revision,
+        editable=False,
+        verbose_name=_('Revision'),
+    )
+    # Elements of version with base version are stored as differences from it, see services.dictionary_version_compact.
+    base_version = models.ForeignKey(
+        'self',
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.RESTRICT,
+        related_name='delta_versions',
+        verbose_name=_('Base version'),
+    )
+    modified_at = models.DateTimeField(auto_now=True, verbose_name=_('Modified at'))
 
     class Meta:
         verbose_name = _('Dictionary version')
@@ -80,16 +132,25 @@ class DictionaryElement(models.Model):
         max_length=DICTIONARY_ELEMENT_VALUE_MAX_LENGTH,
         verbose_name=_('Element value'),
     )
+    # Marks element of base version missing in delta version.
+    is_removed = models.BooleanField(default=False, verbose_name=_('Removed from base version'))
 
     class Meta:
         verbose_name = _('Dictionary element')
         verbose_name_plural = _("Dictionary element's")
         constraints = [
+            # Version goes first, so the index serves keyset pagination by code inside of a version.
             models.UniqueConstraint(
-                fields=['code', 'version_id'],
+                fields=['version_id', 'code'],
                 name='unique_code_version_id',
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=['version', 'id'],
+                name='element_version_id_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         """All django models should have this method."""
@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework import pagination
+from rest_framework.response import Response
+
+PAGINATION_CURSOR = 'cursor'
+PAGINATION_STREAM = 'stream'
+
+ELEMENTS_ORDERING_FIELDS = ('id', 'code')
+
+
+class DictionaryElementCursorPagination(pagination.CursorPagination):
+    """Keyset pagination of dictionary elements by id or code.
+
+    Code is unique inside of a version, so both orderings are stable.
+    """
+
+    ordering = 'id'
+    page_size_query_param = 'page_size'
+    max_page_size = settings.DICTIONARIES_ELEMENTS_MAX_PAGE_SIZE  # type: ignore[misc]
+
+    def get_ordering(self, request, queryset, view) -> tuple[str]:  # noqa: WPS615
+        """Return ordering passed by query param or default one."""
+        ordering = request.query_params.get('ordering')
+        if ordering in ELEMENTS_ORDERING_FIELDS:
+            return (ordering,)
+        return (self.ordering,)
+
+    def get_paginated_response(self, data) -> Response:  # noqa: WPS110
+        """Return page with links to previous and next pages."""
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'elements': data,
+        })
+
+
+class BoundedCountPaginator(Paginator):  # type: ignore[type-arg]
+    """Paginator of admin lists, which counts not more than DICTIONARIES_ADMIN_ELEMENTS_MAX_COUNT objects.
+
+    Count of all elements of a big version takes time proportional to its size,
+    pages after max count are not shown.
+    """
+
+    @cached_property
+    def count(self) -> int:  # type: ignore[override]
+        """Return count of objects, but not more than max count."""
+        max_count = settings.DICTIONARIES_ADMIN_ELEMENTS_MAX_COUNT  # type: ignore[misc]
+        return self.object_list[:max_count].count()  # type: ignore[attr-defined]
@@ -0,0 +1,160 @@
+"""Synthetic dictionaries for load tests and benchmarks.
+
+Data is generated deterministically by seed. Sizes of dictionaries follow Zipf's law:
+the dictionary of rank r has elements proportional to 1 / r ** skew, so a few popular
+dictionaries are big and the most of them are small. Successive versions of a dictionary
+share codes, a part of values is changed in every version.
+"""
+import datetime
+import operator
+import random
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+from django.db import transaction
+from django.utils.timezone import localdate
+
+from server.apps.dictionaries import services, snapshots
+from server.apps.dictionaries.models import Dictionary, DictionaryVersion
+
+# Share of values of a version, which differ from values of the first version.
+_CHANGED_SHARE = 0.05
+# Days between successive versions of a dictionary.
+_MIN_INTERVAL_DAYS = 7
+_MAX_INTERVAL_DAYS = 90
+# Future versions start not later than this amount of days.
+_MAX_FUTURE_DAYS = 180
+
+# Element of version: version_id, code, value.
+_Element = tuple[int, str, str]
+# Version and count of its elements.
+_SizedVersion = tuple[DictionaryVersion, int]
+
+
+@dataclass(frozen=True)
+class SeedConfig(object):
+    """Cardinalities and distributions of generated data."""
+
+    dictionaries: int
+    # Versions of a dictionary are chosen from 1 to this amount, future version is added to them.
+    versions: int
+    # Total amount of elements of all versions.
+    elements: int
+    # Exponent of Zipf's law of dictionary sizes, 0 gives dictionaries of the same size.
+    skew: float = 1
+    # Share of dictionaries with a version starting in the future.
+    future_share: float = 0.1
+    seed: int = 0
+    code_prefix: str = 'seed'
+
+    def popularity(self, rank: int) -> float:
+        """Return weight of size of dictionary of rank (from 0) by Zipf's law."""
+        return (rank + 1) ** -self.skew
+
+    def size_scale(self, version_counts: Iterable[int]) -> float:
+        """Return size of dictionary of weight 1, so all versions of dictionaries have the given amount of elements."""
+        popularity = map(self.popularity, range(self.dictionaries))
+        return self.elements / sum(map(operator.mul, popularity, version_counts))
+
+
+@dataclass(frozen=True)
+class DictionaryPlan(object):
+    """Generated dictionary: code, elements per version and start dates of versions."""
+
+    code: str
+    size: int
+    dates: tuple[datetime.date, ...]
+
+    def dictionary(self) -> Dictionary:
+        """Return unsaved dictionary."""
+        name = self.code.replace('_', ' ')
+        return Dictionary(code=self.code, name=name.capitalize())
+
+    def versions(self, dictionary_id: int) -> list[DictionaryVersion]:
+        """Return unsaved versions of dictionary numbered from 1 in order of dates."""
+        return [
+            DictionaryVersion(dictionary_id=dictionary_id, version=str(number), date=date)
+            for number, date in enumerate(self.dates, start=1)
+        ]
+
+
+def seed_plan(config: SeedConfig, *, today: Optional[datetime.date] = None) -> list[DictionaryPlan]:
+    """Return generated dictionaries, which are the same for the same config and date."""
+    version_dates = list(_version_dates(config, today or localdate()))
+    # Every version of a dictionary has the same size.
+    scale = config.size_scale(map(len, version_dates))
+    return [
+        DictionaryPlan(
+            code='{0}_{1}'.format(config.code_prefix, rank),
+            size=max(1, round(scale * config.popularity(rank))),
+            dates=dates,
+        )
+        for rank, dates in enumerate(version_dates)
+    ]
+
+
+def seed_dictionaries(
+    config: SeedConfig,
+    *,
+    batch_size: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Create generated dictionaries with versions and elements in one transaction.
+
+    Elements of all versions are written by batches (COPY on PostgreSQL). Progress is called
+    with count of written elements after every batch. Returns count of written elements.
+    """
+    with transaction.atomic():
+        sized_versions = _create_versions(seed_plan(config), batch_size)
+        written = services.dictionary_new_versions_fill(
+            elements=_elements(config, sized_versions),
+            batch_size=batch_size,
+            progress=progress,
+        )
+        dictionary_ids = {version.dictionary_id for version, _ in sized_versions}
+        services.dictionary_current_version_refresh(dictionary_ids=dictionary_ids)
+        # Bulk created dictionaries and versions do not send signals.
+        transaction.on_commit(lambda: snapshots.snapshot_registry.markers.publish(dictionary_ids=dictionary_ids))
+    return written
+
+
+def _version_dates(config: SeedConfig, today: datetime.date) -> Iterator[tuple[datetime.date, ...]]:
+    """Yield start dates of versions of dictionaries in ascending order.
+
+    The last past version starts not later than today, a part of dictionaries has a future version.
+    """
+    rng = random.Random(config.seed)
+    for _ in range(config.dictionaries):
+        date = today - datetime.timedelta(days=rng.randrange(_MAX_INTERVAL_DAYS))
+        dates = [date]
+        for _ in range(rng.randint(1, config.versions) - 1):
+            date -= datetime.timedelta(days=rng.randint(_MIN_INTERVAL_DAYS, _MAX_INTERVAL_DAYS))
+            dates.insert(0, date)
+        if rng.random() < config.future_share:
+            future_days = rng.randint(1, _MAX_FUTURE_DAYS)
+            dates.append(today + datetime.timedelta(days=future_days))
+        yield tuple(dates)
+
+
+def _create_versions(plans: list[DictionaryPlan], batch_size: Optional[int]) -> list[_SizedVersion]:
+    """Create dictionaries and their versions, return versions with sizes of dictionaries."""
+    # Identifiers of bulk created objects are set by PostgreSQL and SQLite, which are supported.
+    dictionaries = Dictionary.objects.bulk_create([plan.dictionary() for plan in plans], batch_size=batch_size)
+    sized_versions = [
+        (version, plan.size)
+        for plan, dictionary in zip(plans, dictionaries)
+        for version in plan.versions(dictionary.id)
+    ]
+    DictionaryVersion.objects.bulk_create([version for version, _ in sized_versions], batch_size=batch_size)
+    return sized_versions
+
+
+def _elements(config: SeedConfig, sized_versions: list[_SizedVersion]) -> Iterator[_Element]:
+    """Yield elements of versions, a part of values is changed in every version."""
+    for version, size in sized_versions:
+        rng = random.Random('{0}:{1}:{2}'.format(config.seed, version.dictionary_id, version.version))
+        for index in range(size):
+            element_value = 'Value {0}'.format(index)
+            if rng.random() < _CHANGED_SHARE:
+                element_value = '{0} ({1})'.format(element_value, version.version)
+            yield version.id, 'code_{0}'.format(index), element_value
@@ -1,9 +1,20 @@
-from django.db.models import QuerySet
-from django.utils.timezone import now
+import datetime
+from typing import Iterable, Mapping, Optional
+
+import structlog
+from django.db.models import Case, Exists, OuterRef, QuerySet, Subquery, When
+from django.utils.timezone import localdate, now
+from django_stubs_ext import ValuesQuerySet
 
 from server.apps.dictionaries import filters as filter_sets
 from server.apps.dictionaries.models import Dictionary, DictionaryElement, DictionaryVersion
 
+VERSION_DIFF_ADDED = 'added'
+VERSION_DIFF_REMOVED = 'removed'
+VERSION_DIFF_CHANGED = 'changed'
+
+_ElementValues = ValuesQuerySet[DictionaryElement, Mapping[str, object]]
+
 
 def dictionary_list(*, filters=None) -> QuerySet[Dictionary]:
     """Function for select dictionary list with filters."""
@@ -25,24 +36,167 @@ def dictionary_version_list(*, dictionary_id: int, version=None) -> QuerySet[Dic
     return filter_sets.DictionaryVersionFilter(filters, qs).qs
 
 
-def dictionary_element_list(*, dictionary_id: int, filters=None) -> QuerySet[DictionaryElement]:
-    """Function for select dictionary elements. With empty filters selected with filter by current version."""
-    filters = filters or {}
+def dictionary_current_version_id(*, dictionary_id: int) -> Optional[int]:
+    """Function for select identifier of current version of dictionary.
 
-    qs: QuerySet[DictionaryElement] = DictionaryElement.objects.all()
+    Current version is taken from dictionary by primary key. When the next version
+    has become active and dictionary is not refreshed yet, current version is computed by versions.
+    """
+    dictionary = Dictionary.objects.filter(
+        pk=dictionary_id,
+    ).values_list('current_version_id', 'next_version_date').first()
+    if dictionary is None:
+        return None
 
-    version = filters.get('version')
+    current_version_id, next_version_date = dictionary
+    if next_version_date is not None and next_version_date <= localdate():
+        return dictionary_version_list(dictionary_id=dictionary_id).values_list('id', flat=True).first()
+    return current_version_id
 
+
+def dictionary_list_with_current_version(*, dictionaries: QuerySet[Dictionary]) -> QuerySet[Dictionary]:
+    """Function for annotate dictionaries with version and start date of current version in the same query.
+
+    Materialized current version is used, versions are queried only for dictionaries, which are not refreshed
+    after start of the next version.
+    """
+    today = localdate()
+    started_versions = DictionaryVersion.objects.filter(
+        dictionary_id=OuterRef('pk'),
+        date__lte=today,
+    ).order_by('-date')
+    return dictionaries.annotate(
+        current_version_name=Case(
+            When(next_version_date__lte=today, then=Subquery(started_versions.values('version')[:1])),
+            default='current_version__version',
+        ),
+        current_version_date=Case(
+            When(next_version_date__lte=today, then=Subquery(started_versions.values('date')[:1])),
+            default='current_version__date',
+        ),
+    )
+
+
+def dictionary_version_id(*, dictionary_id: int, version=None) -> Optional[int]:
+    """Function for resolve identifier of dictionary version. With empty version resolved current version."""
     if version:
-        qs = qs.filter(
-            version__version=version,
-            version__dictionary_id=dictionary_id,
-        )
-    else:
-        current_version_qs = dictionary_version_list(
+        version_id = dictionary_version_list(
             dictionary_id=dictionary_id,
             version=version,
-        )
-        qs = qs.filter(version=current_version_qs[:1])
+        ).values_list('id', flat=True).first()
+    else:
+        version_id = dictionary_current_version_id(dictionary_id=dictionary_id)
+    # Logs of request are bound to resolved version.
+    structlog.contextvars.bind_contextvars(version_id=version_id)
+    return version_id
+
+
+def dictionary_version_element_pairs(*, version_id: int) -> ValuesQuerySet[DictionaryElement, tuple[str, str]]:
+    """Function for select (code, value) pairs of all elements of dictionary version."""
+    return _version_elements(version_id, _base_version_ids(version_id).get(version_id)).values_list('code', 'value')
+
+
+def dictionary_element_list(*, dictionary_id: int, filters=None) -> QuerySet[DictionaryElement]:
+    """Function for select dictionary elements. With empty filters selected with filter by current version."""
+    filters = filters or {}
+
+    version_id = dictionary_version_id(
+        dictionary_id=dictionary_id,
+        version=filters.get('version'),
+    )
+    qs = dictionary_version_element_list(version_id=version_id)
 
     return filter_sets.DictionaryElementFilter(filters, qs).qs
+
+
+def dictionary_version_element_list(*, version_id: Optional[int]) -> QuerySet[DictionaryElement]:
+    """Function for select elements of dictionary version in order of creation."""
+    if version_id is None:
+        return DictionaryElement.objects.none()
+    return _version_elements(version_id, _base_version_ids(version_id).get(version_id)).order_by('id')
+
+
+def dictionary_delta_version_ids(*, version_ids: Iterable[int]) -> list[int]:
+    """Function for select identifiers of versions stored as differences from dictionary versions."""
+    return list(DictionaryVersion.objects.filter(base_version_id__in=version_ids).values_list('id', flat=True))
+
+
+def dictionary_version_diff(*, from_version_id: int, to_version_id: int) -> dict[str, _ElementValues]:
+    """Function for select differences of elements of two dictionary versions.
+
+    Elements are matched by code with semi-joins by unique index of (version, code), so the
+    difference is computed by database. Returns querysets of added, removed and changed elements
+    ordered by code, changed elements have previous value.
+    """
+    base_version_ids = _base_version_ids(from_version_id, to_version_id)
+    from_version = _version_elements(from_version_id, base_version_ids.get(from_version_id))
+    to_version = _version_elements(to_version_id, base_version_ids.get(to_version_id))
+
+    changed = to_version.filter(
+        Exists(_same_code(from_version).exclude(value=OuterRef('value'))),
+    ).annotate(
+        previous_value=Subquery(_same_code(from_version).values('value')[:1]),
+    )
+    return {
+        VERSION_DIFF_ADDED: to_version.exclude(Exists(_same_code(from_version))).order_by('code').values(
+            'code',
+            'value',
+        ),
+        VERSION_DIFF_REMOVED: from_version.exclude(Exists(_same_code(to_version))).order_by('code').values(
+            'code',
+            'value',
+        ),
+        VERSION_DIFF_CHANGED: changed.order_by('code').values('code', 'value', 'previous_value'),
+    }
+
+
+def dictionary_version_revision(
+    *,
+    version_id: Optional[int],
+) -> Optional[tuple[str, str, datetime.datetime]]:
+    """Function for select version, revision and modification time of dictionary version."""
+    if version_id is None:
+        return None
+
+    return DictionaryVersion.objects.filter(
+        pk=version_id,
+    ).values_list('version', 'revision', 'modified_at').first()
+
+
+def dictionary_version_revisions(*, version_ids: Iterable[int]) -> dict[int, str]:
+    """Function for select revisions of existing dictionary versions by their identifiers."""
+    revisions = DictionaryVersion.objects.filter(pk__in=list(version_ids)).values_list('id', 'revision')
+    return dict(revisions)
+
+
+def dictionary_next_version_date(*, dictionary_id: int) -> Optional[datetime.date]:
+    """Function for select start date of the next version of dictionary."""
+    return Dictionary.objects.filter(
+        pk=dictionary_id,
+    ).values_list('next_version_date', flat=True).first()
+
+
+def _version_elements(version_id: int, base_version_id: Optional[int]) -> QuerySet[DictionaryElement]:
+    """Elements of version and, for delta version, elements of base version not overridden by it.
+
+    Elements of full version are selected by plain filter served by index of (version, id),
+    only delta version needs union with elements of its base.
+    """
+    elements = DictionaryElement.objects.filter(version_id=version_id)
+    if base_version_id is None:
+        return elements.filter(is_removed=False)
+
+    base_elements = DictionaryElement.objects.filter(version_id=base_version_id).exclude(
+        Exists(_same_code(elements)),
+    )
+    return (elements | base_elements).filter(is_removed=False)
+
+
+def _base_version_ids(*version_ids: int) -> dict[int, Optional[int]]:
+    """Base versions of versions, which are looked up before their elements are selected."""
+    return dict(DictionaryVersion.objects.filter(id__in=version_ids).values_list('id', 'base_version_id'))
+
+
+def _same_code(elements: QuerySet[DictionaryElement]) -> QuerySet[DictionaryElement]:
+    """Elements with code of element of outer query."""
+    return elements.filter(code=OuterRef('code'))
@@ -1,5 +1,7 @@
+from django.conf import settings
 from rest_framework import serializers
 
+from server.apps.core.serializers import UnsavedSerializer
 from server.apps.dictionaries.models import Dictionary, DictionaryElement
 
 
@@ -19,3 +21,61 @@ class DictionaryElementSerializer(serializers.ModelSerializer):
     class Meta:
         model = DictionaryElement
         fields = ('code', 'value')
+
+
+class DictionaryElementCheckSerializer(UnsavedSerializer):
+    """Dictionary element check serializers. Fields of checked element."""
+
+    code = serializers.CharField()
+    value = serializers.CharField()  # noqa: WPS110
+
+
+class DictionaryElementCheckResultSerializer(DictionaryElementCheckSerializer):
+    """Dictionary element check result serializers."""
+
+    exists = serializers.BooleanField()
+
+
+class DictionaryElementCheckBatchInputSerializer(UnsavedSerializer):
+    """Dictionary elements batch check input serializers."""
+
+    version = serializers.CharField(required=False)
+    elements = DictionaryElementCheckSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=settings.DICTIONARIES_CHECK_BATCH_MAX_SIZE,  # type: ignore[misc]
+    )
+
+
+class DictionaryElementCheckBatchOutputSerializer(UnsavedSerializer):
+    """Dictionary elements batch check output serializers."""
+
+    elements = DictionaryElementCheckResultSerializer(many=True)
+
+
+class DictionaryElementChangeSerializer(UnsavedSerializer):
+    """Dictionary element change serializers."""
+
+    code = serializers.CharField()
+    value = serializers.CharField()  # noqa: WPS110
+    previous_value = serializers.CharField()
+
+
+class DictionaryVersionDiffOutputSerializer(UnsavedSerializer):
+    """Dictionary versions diff output serializers."""
+
+    added = DictionaryElementSerializer(many=True)
+    removed = DictionaryElementSerializer(many=True)
+    changed = DictionaryElementChangeSerializer(many=True)
+
+
+class DictionarySyncOutputSerializer(UnsavedSerializer):
+    """Dictionary sync output serializers. Full sync has elements, otherwise changes."""
+
+    token = serializers.CharField()
+    version = serializers.CharField()
+    full = serializers.BooleanField()
+    elements = DictionaryElementSerializer(many=True, required=False)
+    added = DictionaryElementSerializer(many=True, required=False)
+    removed = DictionaryElementSerializer(many=True, required=False)
+    changed = DictionaryElementChangeSerializer(many=True, required=False)
@@ -0,0 +1,467 @@
+import csv
+import datetime
+import io
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, QuerySet, Subquery
+from django.utils.timezone import localdate, now
+
+from server.apps.dictionaries import selectors, snapshots
+from server.apps.dictionaries.models import Dictionary, DictionaryElement, DictionaryVersion, new_revision
+
+# Row of elements table: version_id, code, value, is_removed.
+_ElementRow = tuple[int, str, str, bool]
+
+
+def dictionary_current_version_refresh(
+    *,
+    dictionary_ids: Optional[Iterable[int]] = None,
+    date: Optional[datetime.date] = None,
+    only_stale: bool = False,
+) -> int:
+    """Function for recompute current version and start dates of the first and the next versions of dictionaries.
+
+    With empty dictionary_ids all dictionaries are recomputed, with only_stale only
+    those whose next version has become active. Returns count of updated dictionaries.
+    """
+    date = date or localdate()
+
+    qs = Dictionary.objects.all()
+    if dictionary_ids is not None:
+        qs = qs.filter(pk__in=dictionary_ids)
+    if only_stale:
+        qs = qs.filter(next_version_date__lte=date)
+
+    current_version_sq = DictionaryVersion.objects.filter(
+        dictionary_id=OuterRef('pk'),
+        date__lte=date,
+    ).order_by('-date').values('id')[:1]
+    next_version_date_sq = DictionaryVersion.objects.filter(
+        dictionary_id=OuterRef('pk'),
+        date__gt=date,
+    ).order_by('date').values('date')[:1]
+
+    first_version_date_sq = DictionaryVersion.objects.filter(
+        dictionary_id=OuterRef('pk'),
+    ).order_by('date').values('date')[:1]
+
+    return qs.update(
+        current_version=Subquery(current_version_sq),
+        next_version_date=Subquery(next_version_date_sq),
+        first_version_date=Subquery(first_version_date_sq),
+    )
+
+
+def dictionary_version_touch(*, version_ids: Iterable[int]) -> int:
+    """Function for mark elements of dictionary versions as changed. Should be called after every change of elements.
+
+    Delta versions of changed versions are marked too. Returns count of updated versions.
+    """
+    version_ids = list(version_ids)
+    versions = DictionaryVersion.objects.filter(pk__in=version_ids)
+    delta_versions = DictionaryVersion.objects.filter(base_version_id__in=version_ids)
+    return (versions | delta_versions).update(
+        revision=new_revision(),
+        modified_at=now(),
+    )
+
+
+def dictionary_version_import_prepare(
+    *,
+    dictionary: Dictionary,
+    version: str,
+    date: Optional[datetime.date] = None,
+    replace: bool = False,
+) -> DictionaryVersion:
+    """Function for select or create dictionary version to load elements into.
+
+    Missing version is created with the given date. Elements of existing version are
+    deleted with replace, and delta version becomes a full one, otherwise the version should have no elements.
+    """
+    dictionary_version = DictionaryVersion.objects.select_for_update().filter(
+        dictionary=dictionary,
+        version=version,
+    ).first()
+    if dictionary_version is None:
+        if date is None:
+            raise ValidationError('Date is required to create version {0}.'.format(version))
+        return DictionaryVersion.objects.create(dictionary=dictionary, version=version, date=date)
+
+    elements = DictionaryElement.objects.filter(version=dictionary_version)
+    if replace:
+        dictionary_delta_versions_expand(version_ids=[dictionary_version.id])
+        # Elements are deleted by one query without signals, version is touched after import.
+        elements._raw_delete(elements.db)  # type: ignore[attr-defined]  # noqa: WPS437
+        DictionaryVersion.objects.filter(pk=dictionary_version.id).update(base_version=None)
+    elif dictionary_version.base_version_id is not None or elements.exists():
+        raise ValidationError('Version {0} already has elements.'.format(version))
+    return dictionary_version
+
+
+def dictionary_version_import(
+    *,
+    version_id: int,
+    elements: Iterable[tuple[str, str]],
+    batch_size: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Function for load elements of dictionary version in one transaction.
+
+    Elements are written by batches, on PostgreSQL by COPY. Progress is called with
+    count of written elements after every batch. Returns count of written elements.
+    """
+    batch_size = batch_size or settings.DICTIONARIES_IMPORT_BATCH_SIZE  # type: ignore[misc]
+    written = 0
+    with transaction.atomic():
+        for batch in _element_batches(version_id, elements, batch_size):
+            _insert_elements(batch)
+            written += len(batch)
+            if progress is not None:
+                progress(written)
+
+        _elements_changed(version_ids=[version_id])
+    return written
+
+
+def dictionary_new_versions_fill(
+    *,
+    elements: Iterable[tuple[int, str, str]],
+    batch_size: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Function for load elements (version_id, code, value) of many dictionary versions by batches.
+
+    Batches span versions, versions are not touched and caches are not dropped, so the
+    versions should be created in the same transaction. Returns count of written elements.
+    """
+    batch_size = batch_size or settings.DICTIONARIES_IMPORT_BATCH_SIZE  # type: ignore[misc]
+    written = 0
+    for batch in _row_batches((_new_row(*element) for element in elements), batch_size):
+        _insert_elements(batch)
+        written += len(batch)
+        if progress is not None:
+            progress(written)
+    return written
+
+
+def dictionary_version_upload(
+    *,
+    version_id: int,
+    elements: Iterable[tuple[str, str]],
+    replace: bool = False,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Function for add or change elements of dictionary version by batches in one transaction.
+
+    Elements with codes missing in the version are added, values of the others are changed.
+    With replace the other elements of the version are deleted. Returns count of written elements.
+    """
+    batch_size = batch_size or settings.DICTIONARIES_IMPORT_BATCH_SIZE  # type: ignore[misc]
+    with transaction.atomic():
+        dictionary_version = DictionaryVersion.objects.select_related('dictionary').get(pk=version_id)
+        if replace:
+            dictionary_version_import_prepare(
+                dictionary=dictionary_version.dictionary,
+                version=dictionary_version.version,
+                replace=True,
+            )
+            return dictionary_version_import(version_id=version_id, elements=elements, batch_size=batch_size)
+
+        dictionary_delta_versions_expand(version_ids=[version_id])
+        written = 0
+        for batch in _element_batches(version_id, elements, batch_size):
+            # Changed element of delta version could be marked removed from base version.
+            DictionaryElement.objects.bulk_create(
+                [_element_from_row(row) for row in batch],
+                update_conflicts=True,
+                unique_fields=['version', 'code'],
+                update_fields=['value', 'is_removed'],
+            )
+            written += len(batch)
+        _elements_changed(version_ids=[version_id])
+    return written
+
+
+def dictionary_elements_update(
+    *,
+    elements: QuerySet[DictionaryElement],
+    element_value: str,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Function for set value of dictionary elements by batches in one transaction.
+
+    Elements are updated without signals, versions are touched once, delta versions of them are expanded before.
+    Elements of delta versions marked removed are skipped. Returns count of updated elements.
+    """
+    with transaction.atomic():
+        version_ids = _element_version_ids(elements)
+        dictionary_delta_versions_expand(version_ids=version_ids)
+        updated = sum(
+            DictionaryElement.objects.filter(pk__in=batch, is_removed=False).update(value=element_value)
+            for batch in _element_id_batches(elements, batch_size)
+        )
+        _elements_changed(version_ids=version_ids)
+    return updated
+
+
+def dictionary_elements_delete(*, elements: QuerySet[DictionaryElement], batch_size: Optional[int] = None) -> int:
+    """Function for delete dictionary elements by batches in one transaction.
+
+    Elements are deleted without signals, versions are touched once, delta versions of them are expanded before.
+    Elements of delta versions overriding elements of base versions are marked removed.
+    Returns count of deleted elements.
+    """
+    with transaction.atomic():
+        version_ids = _element_version_ids(elements)
+        dictionary_delta_versions_expand(version_ids=version_ids)
+        deleted = sum(_elements_delete(batch) for batch in _element_id_batches(elements, batch_size))
+        _elements_changed(version_ids=version_ids)
+    return deleted
+
+
+def dictionary_delta_versions_expand(*, version_ids: Iterable[int]) -> int:
+    """Function for expand delta versions of dictionary versions before changes of their elements.
+
+    Delta versions keep their elements, so their revisions are kept. Returns count of expanded versions.
+    """
+    delta_version_ids = selectors.dictionary_delta_version_ids(version_ids=version_ids)
+    for delta_version_id in delta_version_ids:
+        dictionary_version_expand(version_id=delta_version_id)
+    return len(delta_version_ids)
+
+
+def version_caches_invalidate(*, version_ids: Iterable[int]) -> None:
+    """Function for drop snapshots of dictionary versions."""
+    for version_id in version_ids:
+        snapshots.snapshot_registry.invalidate(version_id=version_id)
+
+
+def version_changes_publish(*, version_ids: Iterable[int]) -> None:
+    """Function for drop caches of dictionary versions and publish their revisions to all processes after commit."""
+    version_ids = list(version_ids)
+    version_caches_invalidate(version_ids=version_ids)
+    snapshots.snapshot_registry.markers.publish(version_ids=version_ids)
+
+
+def dictionary_version_clone(
+    *,
+    version_id: int,
+    version: str,
+    date: datetime.date,
+    elements: Iterable[tuple[str, str]] = (),
+    removed_codes: Iterable[str] = (),
+) -> DictionaryVersion:
+    """Function for create new version of dictionary with elements of dictionary version.
+
+    Elements are copied by one INSERT ... SELECT, then removed codes are deleted and
+    added or changed elements are written by batches. Returns created version.
+    """
+    with transaction.atomic():
+        source = DictionaryVersion.objects.get(pk=version_id)
+        clone = DictionaryVersion(dictionary_id=source.dictionary_id, version=version, date=date)
+        clone.full_clean()
+        clone.save()
+        _copy_elements(selectors.dictionary_version_element_list(version_id=source.id), version_id=clone.id)
+
+        removed = DictionaryElement.objects.filter(version_id=clone.id, code__in=list(removed_codes))
+        removed._raw_delete(removed.db)  # type: ignore[attr-defined]  # noqa: WPS437
+        batch_size = settings.DICTIONARIES_IMPORT_BATCH_SIZE  # type: ignore[misc]
+        for batch in _element_batches(clone.id, elements, batch_size):
+            DictionaryElement.objects.bulk_create(
+                [_element_from_row(row) for row in batch],
+                update_conflicts=True,
+                unique_fields=['version', 'code'],
+                update_fields=['value'],
+            )
+    return clone
+
+
+def dictionary_version_compact(*, version_id: int, base_version_id: int) -> int:
+    """Function for store elements of dictionary version as differences from base version.
+
+    Elements equal to elements of base version are deleted, codes missing in version are stored
+    as removed. Elements of version are not changed, so revision is kept. Returns count of stored elements.
+    """
+    with transaction.atomic():
+        dictionary_version = DictionaryVersion.objects.select_for_update().get(pk=version_id)
+        _validate_base_version(dictionary_version, base_version_id)
+
+        elements = DictionaryElement.objects.filter(version_id=version_id)
+        base_elements = DictionaryElement.objects.filter(version_id=base_version_id)
+        _copy_elements(
+            base_elements.exclude(Exists(elements.filter(code=OuterRef('code')))),
+            version_id=version_id,
+            is_removed=True,
+        )
+        unchanged = elements.filter(
+            Exists(base_elements.filter(code=OuterRef('code'), value=OuterRef('value'))),
+            is_removed=False,
+        )
+        unchanged._raw_delete(unchanged.db)  # type: ignore[attr-defined]  # noqa: WPS437
+        DictionaryVersion.objects.filter(pk=version_id).update(base_version_id=base_version_id)
+        return elements.count()
+
+
+def dictionary_version_expand(*, version_id: int) -> int:
+    """Function for store all elements of delta dictionary version, so it does not depend on base version.
+
+    Elements of version are not changed, so revision is kept. Returns count of stored elements.
+    """
+    with transaction.atomic():
+        dictionary_version = DictionaryVersion.objects.select_for_update().get(pk=version_id)
+        elements = DictionaryElement.objects.filter(version_id=version_id)
+        if dictionary_version.base_version_id is None:
+            return elements.count()
+
+        base_elements = DictionaryElement.objects.filter(version_id=dictionary_version.base_version_id)
+        _copy_elements(
+            base_elements.exclude(Exists(elements.filter(code=OuterRef('code')))),
+            version_id=version_id,
+        )
+        removed = elements.filter(is_removed=True)
+        removed._raw_delete(removed.db)  # type: ignore[attr-defined]  # noqa: WPS437
+        DictionaryVersion.objects.filter(pk=version_id).update(base_version=None)
+        return elements.count()
+
+
+def dictionary_compact(*, dictionary_id: int, max_ratio: float) -> int:
+    """Function for store versions of dictionary as differences from earlier versions.
+
+    Versions are walked by date, every version is compacted against the last full version, unless
+    count of differences exceeds max_ratio of count of its elements, then it is kept as a new full version.
+    Returns count of compacted versions.
+    """
+    compacted = 0
+    base_version_id: Optional[int] = None
+    for version_id, is_base in _compact_candidates(dictionary_id):
+        if base_version_id is None or is_base or not _is_small_delta(base_version_id, version_id, max_ratio):
+            base_version_id = version_id
+            continue
+        dictionary_version_compact(version_id=version_id, base_version_id=base_version_id)
+        compacted += 1
+    return compacted
+
+
+def _elements_changed(*, version_ids: list[int]) -> None:
+    """Touch versions with changed elements, publish changes of them and their delta versions after commit."""
+    dictionary_version_touch(version_ids=version_ids)
+    version_ids = [*version_ids, *selectors.dictionary_delta_version_ids(version_ids=version_ids)]
+    transaction.on_commit(lambda: version_changes_publish(version_ids=version_ids))
+
+
+def _elements_delete(element_ids: list[int]) -> int:
+    """Delete elements, elements overriding elements of base version are marked removed to keep them hidden."""
+    elements = DictionaryElement.objects.filter(pk__in=element_ids)
+    base_elements = DictionaryElement.objects.filter(
+        version_id=OuterRef('version__base_version_id'),
+        code=OuterRef('code'),
+    )
+    removed = elements.filter(Exists(base_elements)).update(value='', is_removed=True)
+    deleted = elements.exclude(Exists(base_elements))
+    return removed + deleted._raw_delete(deleted.db)  # type: ignore[attr-defined]  # noqa: WPS437
+
+
+def _element_version_ids(elements: QuerySet[DictionaryElement]) -> list[int]:
+    return list(elements.order_by().values_list('version_id', flat=True).distinct())
+
+
+def _element_id_batches(elements: QuerySet[DictionaryElement], batch_size: Optional[int]) -> Iterator[list[int]]:
+    """Yield identifiers of elements by batches in order of identifiers, elements could be changed between batches."""
+    batch_size = batch_size or settings.DICTIONARIES_IMPORT_BATCH_SIZE  # type: ignore[misc]
+    ids = elements.order_by('pk').values_list('pk', flat=True)
+    batch = list(ids[:batch_size])
+    while batch:
+        yield batch
+        next_ids = ids.filter(pk__gt=batch[-1])
+        batch = list(next_ids[:batch_size])
+
+
+def _element_from_row(row: _ElementRow) -> DictionaryElement:
+    version_id, code, element_value, is_removed = row
+    return DictionaryElement(version_id=version_id, code=code, value=element_value, is_removed=is_removed)
+
+
+def _element_batches(
+    version_id: int,
+    elements: Iterable[tuple[str, str]],
+    batch_size: int,
+) -> Iterator[list[_ElementRow]]:
+    return _row_batches(((version_id, code, element_value, False) for code, element_value in elements), batch_size)
+
+
+def _new_row(version_id: int, code: str, element_value: str) -> _ElementRow:
+    return version_id, code, element_value, False
+
+
+def _row_batches(rows: Iterable[_ElementRow], batch_size: int) -> Iterator[list[_ElementRow]]:
+    rows = iter(rows)
+    batch = list(islice(rows, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(rows, batch_size))
+
+
+def _insert_elements(batch: list[_ElementRow]) -> None:
+    table = connection.ops.quote_name(DictionaryElement._meta.db_table)  # noqa: WPS437
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(batch)
+            buffer.seek(0)
+            cursor.copy_expert(
+                'COPY {0} (version_id, code, value, is_removed) FROM STDIN WITH (FORMAT csv)'.format(table),
+                buffer,
+            )
+        else:
+            # Model instances are not created, it is the most of the bulk_create time.
+            cursor.executemany(
+                'INSERT INTO {0} (version_id, code, value, is_removed) VALUES (%s, %s, %s, %s)'.format(table),  # noqa: S608, WPS323, E501
+                batch,
+            )
+
+
+def _copy_elements(elements: QuerySet[DictionaryElement], *, version_id: int, is_removed: bool = False) -> None:
+    """Copy elements to version by one INSERT ... SELECT, rows are not transferred from database."""
+    table = connection.ops.quote_name(DictionaryElement._meta.db_table)  # noqa: WPS437
+    select_sql, select_params = elements.values('code', 'value').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'INSERT INTO {0} (version_id, code, value, is_removed) SELECT %s, source.code, {1}, %s FROM ({2}) source'.format(  # noqa: S608, E501, WPS323
+                table,
+                "''" if is_removed else 'source.value',
+                select_sql,
+            ),
+            (version_id, is_removed, *select_params),
+        )
+
+
+def _validate_base_version(dictionary_version: DictionaryVersion, base_version_id: int) -> None:
+    base_version = DictionaryVersion.objects.filter(pk=base_version_id).first()
+    if base_version is None or base_version.dictionary_id != dictionary_version.dictionary_id:
+        raise ValidationError('Base version should be a version of the same dictionary.')
+    if base_version.id == dictionary_version.id or base_version.base_version_id is not None:
+        raise ValidationError('Base version should be another full version.')
+    if dictionary_version.base_version_id is not None or dictionary_version.delta_versions.exists():
+        raise ValidationError('Version {0} should be a full version without delta versions.'.format(dictionary_version))
+
+
+def _compact_candidates(dictionary_id: int) -> list[tuple[int, bool]]:
+    """Return full versions of dictionary by date with flag that version is a base of delta versions."""
+    return list(
+        DictionaryVersion.objects.filter(
+            dictionary_id=dictionary_id,
+            base_version=None,
+        ).annotate(
+            is_base=Exists(DictionaryVersion.objects.filter(base_version_id=OuterRef('pk'))),
+        ).order_by('date').values_list('id', 'is_base'),
+    )
+
+
+def _is_small_delta(base_version_id: int, version_id: int, max_ratio: float) -> bool:
+    diff = selectors.dictionary_version_diff(from_version_id=base_version_id, to_version_id=version_id)
+    differences = sum(changes.count() for changes in diff.values())
+    return differences <= max_ratio * selectors.dictionary_version_element_list(version_id=version_id).count()
@@ -0,0 +1,65 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from server.apps.dictionaries import selectors, services
+from server.apps.dictionaries.models import Dictionary, DictionaryElement, DictionaryVersion
+from server.apps.dictionaries.snapshots import snapshot_registry
+
+
+@receiver([post_save, post_delete], sender=Dictionary)
+def publish_dictionary_changes(sender, instance: Dictionary, **kwargs) -> None:
+    """Change tokens of dictionary list and of versions of dictionary on dictionary changes.
+
+    Tokens are changed again after commit, so a list read by concurrent request before commit is not kept.
+    """
+    snapshot_registry.markers.publish(dictionary_ids=[instance.id])
+    transaction.on_commit(lambda: snapshot_registry.markers.publish(dictionary_ids=[instance.id]))
+
+
+@receiver([post_save, post_delete], sender=DictionaryVersion)
+def refresh_current_version(sender, instance: DictionaryVersion, **kwargs) -> None:
+    """Recompute current version of dictionary on dictionary version changes."""
+    services.dictionary_current_version_refresh(dictionary_ids=[instance.dictionary_id])
+
+
+@receiver([post_save, post_delete], sender=DictionaryVersion)
+def invalidate_version_caches(sender, instance: DictionaryVersion, **kwargs) -> None:
+    """Drop snapshot and resolved versions and change tokens of dictionary list on dictionary version changes.
+
+    Caches are dropped and tokens are changed again after commit, so a snapshot or list loaded by concurrent
+    request before commit is not kept, and the change is published to other processes.
+    """
+    def invalidate() -> None:  # noqa: WPS430
+        snapshot_registry.invalidate(version_id=instance.id, dictionary_id=instance.dictionary_id)
+
+    def publish() -> None:  # noqa: WPS430
+        invalidate()
+        snapshot_registry.markers.publish(dictionary_ids=[instance.dictionary_id], version_ids=[instance.id])
+
+    invalidate()
+    snapshot_registry.markers.publish(dictionary_ids=[instance.dictionary_id])
+    transaction.on_commit(publish)
+
+
+@receiver([pre_save, pre_delete], sender=DictionaryElement)
+def expand_delta_versions(sender, instance: DictionaryElement, **kwargs) -> None:
+    """Store all elements of delta versions before dictionary element changes, so delta versions are not changed."""
+    services.dictionary_delta_versions_expand(version_ids=[instance.version_id])
+
+
+@receiver([post_save, post_delete], sender=DictionaryElement)
+def touch_element_version(sender, instance: DictionaryElement, **kwargs) -> None:
+    """Change revision of dictionary version on dictionary element changes."""
+    services.dictionary_version_touch(version_ids=[instance.version_id])
+
+
+@receiver([post_save, post_delete], sender=DictionaryElement)
+def invalidate_element_caches(sender, instance: DictionaryElement, **kwargs) -> None:
+    """Drop snapshots of version and its delta versions on dictionary element changes.
+
+    Changes are published to other processes after commit.
+    """
+    version_ids = [instance.version_id, *selectors.dictionary_delta_version_ids(version_ids=[instance.version_id])]
+    services.version_caches_invalidate(version_ids=version_ids)
+    transaction.on_commit(lambda: services.version_changes_publish(version_ids=version_ids))
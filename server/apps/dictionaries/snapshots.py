@@ -0,0 +1,367 @@
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import structlog
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.timezone import now
+
+from server.apps.core import metrics, routers
+from server.apps.dictionaries import caches, selectors
+
+# Code and value are packed into one string, it takes less memory than a tuple.
+_PAIR_SEPARATOR = '\x00'
+_MAX_RESOLVED_VERSIONS = 100000
+
+# Names of caches in metrics.
+_VERSIONS_CACHE = 'versions'
+_SNAPSHOTS_CACHE = 'snapshots'
+
+_ResolvedKey = tuple[int, Optional[str]]
+# Identifier of version, expiration time and token of versions of dictionary at resolution.
+_ResolvedValue = tuple[Optional[int], float, str]
+# Identifier of version and token of versions of dictionary at resolution.
+_Resolution = tuple[Optional[int], str]
+
+
+def _seconds_to_midnight() -> float:
+    """Current version can change only when a new day starts."""
+    current = now()
+    midnight = datetime.datetime.combine(
+        current.date() + datetime.timedelta(days=1),
+        datetime.time.min,
+        tzinfo=current.tzinfo,
+    )
+    return (midnight - current).total_seconds()
+
+
+@dataclass(frozen=True)
+class VersionSnapshot(object):
+    """Immutable set of (code, value) pairs of one dictionary version."""
+
+    version_id: int
+    revision: Optional[str]
+    elements: frozenset[str]
+    expires_at: float
+
+    @classmethod
+    def pack(cls, code: str, value: str) -> str:  # noqa: WPS110
+        """Pack pair (code, value) to element of snapshot."""
+        return '{0}{1}{2}'.format(code, _PAIR_SEPARATOR, value)
+
+    def __contains__(self, pair: tuple[str, str]) -> bool:
+        """Check that pair (code, value) is present in version."""
+        return self.pack(*pair) in self.elements
+
+    def __len__(self) -> int:
+        """Return count of elements in version."""
+        return len(self.elements)
+
+
+class VersionResolver(object):
+    """Bounded LRU cache of resolved version identifiers.
+
+    Resolved versions are served while token of versions of dictionary is not changed.
+    Current version of dictionary is cached not longer than till midnight, because it can change only then.
+    """
+
+    def __init__(self, *, ttl: int, markers: caches.ChangeMarkers, max_size: int = _MAX_RESOLVED_VERSIONS) -> None:
+        """Create empty cache."""
+        self.ttl = ttl
+        self.markers = markers
+        self.max_size = max_size
+        self._resolved: OrderedDict[_ResolvedKey, _ResolvedValue] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, *, dictionary_id: int, version: Optional[str] = None) -> Optional[int]:
+        """Return identifier of version. With empty version returned identifier of current version."""
+        token = self.markers.versions_token(dictionary_id)
+        resolved = self.peek(dictionary_id=dictionary_id, version=version)
+        hit = resolved is not None and token == resolved[1]
+        metrics.record_cache_lookup(_VERSIONS_CACHE, hit=hit)
+        if resolved is not None and hit:
+            structlog.contextvars.bind_contextvars(version_id=resolved[0])
+            return resolved[0]
+
+        # Resolution is kept under the current token, so it is read where the token was changed.
+        with routers.use_primary():
+            version_id = selectors.dictionary_version_id(dictionary_id=dictionary_id, version=version)
+        ttl = self.ttl if version else min(self.ttl, _seconds_to_midnight())
+        self._store((dictionary_id, version), version_id=version_id, ttl=ttl, token=token)
+        return version_id
+
+    def peek(self, *, dictionary_id: int, version: Optional[str] = None) -> Optional[_Resolution]:
+        """Return version resolved earlier and token of versions of dictionary at resolution, None on miss.
+
+        Resolution is current, when the token is equal to the current token of versions of dictionary.
+        """
+        with self._lock:
+            resolved = self._resolved.get((dictionary_id, version))
+        if resolved is None or resolved[1] <= time.monotonic():
+            return None
+        return resolved[0], resolved[2]
+
+    def invalidate(self, *, dictionary_id: int) -> None:
+        """Drop resolved versions of dictionary."""
+        with self._lock:
+            stale_keys = [key for key in self._resolved if key[0] == dictionary_id]
+            for key in stale_keys:
+                self._resolved.pop(key)
+
+    def clear(self) -> None:
+        """Drop all resolved versions."""
+        with self._lock:
+            self._resolved.clear()
+
+    def _store(self, key: _ResolvedKey, *, version_id: Optional[int], ttl: float, token: str) -> None:
+        with self._lock:
+            self._resolved[key] = (version_id, time.monotonic() + ttl, token)
+            self._resolved.move_to_end(key)
+            if len(self._resolved) > self.max_size:
+                self._resolved.popitem(last=False)
+
+
+class SnapshotRegistry(object):
+    """Bounded LRU registry of version snapshots.
+
+    Registry is local for a process. Changes made in this process are applied immediately by signals,
+    snapshots and resolved versions are checked against markers of changes made by other processes.
+    """
+
+    def __init__(self, *, max_elements: int, ttl: int, alias: str) -> None:
+        """Create empty registry, markers of changes are stored in Django cache with alias."""
+        self.max_elements = max_elements
+        self.ttl = ttl
+        self.markers = caches.ChangeMarkers(alias=alias, ttl=ttl)
+        self.resolver = VersionResolver(ttl=ttl, markers=self.markers)
+        self._snapshots: OrderedDict[int, VersionSnapshot] = OrderedDict()
+        self._oversized: dict[int, float] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def peek(self, version_id: int) -> Optional[VersionSnapshot]:
+        """Return loaded snapshot of version without loading it from database."""
+        with self._lock:
+            snapshot = self._snapshots.get(version_id)
+            if snapshot is None:
+                return None
+            if snapshot.expires_at <= time.monotonic():
+                self._drop(version_id)
+                return None
+            self._snapshots.move_to_end(version_id)
+            return snapshot
+
+    def get(self, version_id: int) -> Optional[VersionSnapshot]:
+        """Return snapshot of current revision of version, load it on miss.
+
+        Versions greater than registry limit are not loaded.
+        """
+        revision = self.markers.revision(version_id)
+        snapshot = self.peek(version_id)
+        hit = snapshot is not None and snapshot.revision == revision
+        metrics.record_cache_lookup(_SNAPSHOTS_CACHE, hit=hit)
+        if snapshot is not None and hit:
+            return snapshot
+
+        with self._lock:
+            if self._oversized.get(version_id, 0) > time.monotonic():
+                return None
+
+        snapshot = self._load(version_id, revision)
+        with self._lock:
+            if snapshot is None:
+                self._oversized[version_id] = time.monotonic() + self.ttl
+                return None
+            self._drop(version_id)
+            self._snapshots[version_id] = snapshot
+            self._size += len(snapshot)
+            while self._size > self.max_elements:
+                self._drop(next(iter(self._snapshots)))
+        return snapshot
+
+    def invalidate(self, *, version_id: Optional[int] = None, dictionary_id: Optional[int] = None) -> None:
+        """Drop snapshot of version and resolved versions of dictionary."""
+        if dictionary_id is not None:
+            self.resolver.invalidate(dictionary_id=dictionary_id)
+        if version_id is not None:
+            with self._lock:
+                self._drop(version_id)
+
+    def clear(self) -> None:
+        """Drop all snapshots and resolved versions."""
+        self.resolver.clear()
+        with self._lock:
+            self._snapshots.clear()
+            self._oversized.clear()
+            self._size = 0
+
+    def _drop(self, version_id: int) -> None:
+        self._oversized.pop(version_id, None)
+        snapshot = self._snapshots.pop(version_id, None)
+        if snapshot is not None:
+            self._size -= len(snapshot)
+
+    def _load(self, version_id: int, revision: Optional[str]) -> Optional[VersionSnapshot]:
+        elements: list[str] = []
+        # Snapshot is kept under the published revision, replica could have elements of an older one.
+        with routers.use_primary():
+            pairs = selectors.dictionary_version_element_pairs(version_id=version_id)
+            for code, value in pairs.iterator():  # noqa: WPS110
+                if len(elements) >= self.max_elements:
+                    return None
+                elements.append(VersionSnapshot.pack(code, value))
+
+        return VersionSnapshot(
+            version_id=version_id,
+            revision=revision,
+            elements=frozenset(elements),
+            expires_at=time.monotonic() + self.ttl,
+        )
+
+
+snapshot_registry = SnapshotRegistry(
+    max_elements=settings.DICTIONARIES_SNAPSHOT_MAX_ELEMENTS,  # type: ignore[misc]
+    ttl=settings.DICTIONARIES_SNAPSHOT_TTL,  # type: ignore[misc]
+    alias=settings.DICTIONARIES_SNAPSHOT_CACHE_ALIAS,  # type: ignore[misc]
+)
+
+
+def element_exists(*, dictionary_id: int, code: str, value: str, version: Optional[str] = None) -> bool:  # noqa: WPS110
+    """Check that element with code and value is present in version of dictionary.
+
+    With empty version checked current version of dictionary.
+    """
+    return elements_exist(
+        dictionary_id=dictionary_id,
+        pairs=[(code, value)],
+        version=version,
+    )[0]
+
+
+async def aelement_exists(
+    *,
+    dictionary_id: int,
+    code: str,
+    value: str,  # noqa: WPS110
+    version: Optional[str] = None,
+) -> bool:
+    """Async version of element_exists."""
+    exists = await aelements_exist(
+        dictionary_id=dictionary_id,
+        pairs=[(code, value)],
+        version=version,
+    )
+    return exists[0]
+
+
+def elements_exist(
+    *,
+    dictionary_id: int,
+    pairs: list[tuple[str, str]],
+    version: Optional[str] = None,
+) -> list[bool]:
+    """Check that elements with code and value are present in version of dictionary.
+
+    Version is resolved once for all pairs. Pairs are checked by snapshot of version
+    or, when version is too large for snapshot, by one query.
+    """
+    version_id = snapshot_registry.resolver.resolve(dictionary_id=dictionary_id, version=version)
+    if version_id is None:
+        return [False for _ in pairs]
+
+    snapshot = snapshot_registry.get(version_id)
+    if snapshot is None:
+        existing_pairs = set(
+            selectors.dictionary_version_element_pairs(
+                version_id=version_id,
+            ).filter(code__in={code for code, _ in pairs}),
+        )
+        exists = [pair in existing_pairs for pair in pairs]
+    else:
+        exists = [pair in snapshot for pair in pairs]
+    metrics.record_checked_elements(exists)
+    return exists
+
+
+async def aelements_exist(
+    *,
+    dictionary_id: int,
+    pairs: list[tuple[str, str]],
+    version: Optional[str] = None,
+) -> list[bool]:
+    """Async version of elements_exist.
+
+    Pairs are checked in event loop when version is resolved and its snapshot is loaded and both are current,
+    otherwise database is queried in thread of request.
+    """
+    snapshot = await _apeek_snapshot(dictionary_id, version)
+    if snapshot is None:
+        return await sync_to_async(elements_exist)(dictionary_id=dictionary_id, pairs=pairs, version=version)
+
+    structlog.contextvars.bind_contextvars(version_id=snapshot.version_id)
+    metrics.record_cache_lookup(_VERSIONS_CACHE, hit=True)
+    metrics.record_cache_lookup(_SNAPSHOTS_CACHE, hit=True)
+    exists = [pair in snapshot for pair in pairs]
+    metrics.record_checked_elements(exists)
+    return exists
+
+
+def check_elements(
+    *,
+    dictionary_id: int,
+    elements: list[dict[str, str]],
+    version: Optional[str] = None,
+) -> list[dict[str, object]]:
+    """Return elements with result of check that element is present in version of dictionary."""
+    exists = elements_exist(
+        dictionary_id=dictionary_id,
+        pairs=[(element['code'], element['value']) for element in elements],
+        version=version,
+    )
+    return [
+        {**element, 'exists': element_exists}
+        for element, element_exists in zip(elements, exists)
+    ]
+
+
+async def acheck_elements(
+    *,
+    dictionary_id: int,
+    elements: list[dict[str, str]],
+    version: Optional[str] = None,
+) -> list[dict[str, object]]:
+    """Async version of check_elements."""
+    exists = await aelements_exist(
+        dictionary_id=dictionary_id,
+        pairs=[(element['code'], element['value']) for element in elements],
+        version=version,
+    )
+    return [
+        {**element, 'exists': element_exists}
+        for element, element_exists in zip(elements, exists)
+    ]
+
+
+def is_current_revision(*, version_id: int, revision: str) -> bool:
+    """Check that revision of version is the published one, it is read from replica possibly lagging behind."""
+    return snapshot_registry.markers.revision(version_id) == revision
+
+
+async def _apeek_snapshot(dictionary_id: int, version: Optional[str]) -> Optional[VersionSnapshot]:
+    """Return loaded snapshot of resolved version without database, when resolution and revision are current."""
+    resolved = snapshot_registry.resolver.peek(dictionary_id=dictionary_id, version=version)
+    version_id = None if resolved is None else resolved[0]
+    snapshot = None if version_id is None else snapshot_registry.peek(version_id)
+    if resolved is None or snapshot is None:
+        return None
+    is_current = await snapshot_registry.markers.ais_current(
+        dictionary_id=dictionary_id,
+        token=resolved[1],
+        version_id=snapshot.version_id,
+        revision=snapshot.revision,
+    )
+    return snapshot if is_current else None
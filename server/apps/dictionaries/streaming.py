@@ -0,0 +1,83 @@
+import json
+from itertools import islice
+from typing import Iterator, Mapping, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django_stubs_ext import ValuesQuerySet
+from rest_framework.renderers import BaseRenderer
+
+from server.apps.core.renderers import MessagePackRenderer, packb
+from server.apps.dictionaries.models import DictionaryElement
+
+# The same output as rest framework JSONRenderer gives.
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+_Row = Mapping[str, object]
+_ElementRows = ValuesQuerySet[DictionaryElement, _Row]
+
+
+def stream_elements(
+    elements: QuerySet[DictionaryElement],
+    *,
+    chunk_size: int = settings.DICTIONARIES_ELEMENTS_STREAM_CHUNK_SIZE,  # type: ignore[misc]
+) -> Iterator[str]:
+    """Yield elements list response by parts. Memory does not depend on count of elements."""
+    return stream_json({'elements': elements.values('code', 'value')}, chunk_size=chunk_size)
+
+
+def stream_elements_msgpack(
+    elements: QuerySet[DictionaryElement],
+    *,
+    chunk_size: int = settings.DICTIONARIES_ELEMENTS_STREAM_CHUNK_SIZE,  # type: ignore[misc]
+) -> Iterator[bytes]:
+    """Yield elements as a sequence of MessagePack maps by parts, count of elements is not known in advance."""
+    return (
+        b''.join(packb(row) for row in chunk)
+        for chunk in _row_chunks(elements.values('code', 'value'), chunk_size)
+    )
+
+
+def elements_streaming_response(elements: QuerySet[DictionaryElement], renderer: BaseRenderer) -> StreamingHttpResponse:
+    """Return streamed elements list in format of accepted renderer, MessagePack or JSON."""
+    if isinstance(renderer, MessagePackRenderer):
+        return StreamingHttpResponse(stream_elements_msgpack(elements), content_type=renderer.media_type)
+    return StreamingHttpResponse(stream_elements(elements), content_type='application/json')
+
+
+def stream_json(
+    arrays: Mapping[str, _ElementRows],
+    *,
+    fields: Optional[Mapping[str, object]] = None,
+    chunk_size: int = settings.DICTIONARIES_ELEMENTS_STREAM_CHUNK_SIZE,  # type: ignore[misc]
+) -> Iterator[str]:
+    """Yield JSON object of scalar fields and arrays of rows by parts. Memory does not depend on count of rows.
+
+    Rows are fetched without model instances, on PostgreSQL by server-side cursor.
+    Every part contains up to chunk_size rows.
+    """
+    opening = '{{{0}'.format(''.join(
+        '{0}:{1},'.format(_encoder.encode(key), _encoder.encode(field_value))
+        for key, field_value in (fields or {}).items()
+    ))
+    for key, rows in arrays.items():
+        yield '{0}{1}:['.format(opening, _encoder.encode(key))
+        yield from _json_array_parts(rows, chunk_size)
+        opening = '],'
+    yield ']}'
+
+
+def _json_array_parts(rows: _ElementRows, chunk_size: int) -> Iterator[str]:
+    separator = ''
+    for chunk in _row_chunks(rows, chunk_size):
+        yield separator + ','.join(_encoder.encode(row) for row in chunk)
+        separator = ','
+
+
+def _row_chunks(rows: _ElementRows, chunk_size: int) -> Iterator[list[_Row]]:
+    rows_iterator = rows.iterator(chunk_size=chunk_size)
+    chunk = list(islice(rows_iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(rows_iterator, chunk_size))
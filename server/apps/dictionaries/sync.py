@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django_stubs_ext import ValuesQuerySet
+
+from server.apps.dictionaries import selectors
+from server.apps.dictionaries.models import DictionaryElement
+
+_SIGNING_SALT = 'dictionaries.sync'
+
+_ElementValues = ValuesQuerySet[DictionaryElement, Mapping[str, object]]
+
+_DIFF_KEYS = (selectors.VERSION_DIFF_ADDED, selectors.VERSION_DIFF_REMOVED, selectors.VERSION_DIFF_CHANGED)
+
+
+@dataclass(frozen=True)
+class SyncChanges(object):
+    """Changes of elements to reach the current version of dictionary.
+
+    With full set arrays contain all elements of the current version, otherwise
+    elements added, removed and changed since the version of the client.
+    """
+
+    token: str
+    version: str
+    full: bool
+    arrays: Mapping[str, _ElementValues]
+
+    @property
+    def fields(self) -> dict[str, object]:
+        """Return scalar fields of response."""
+        return {'token': self.token, 'version': self.version, 'full': self.full}
+
+
+def sync_token(*, dictionary_id: int, version_id: int, revision: str) -> str:
+    """Return signed token of state of client, which has elements of version revision."""
+    return signing.dumps([dictionary_id, version_id, revision], salt=_SIGNING_SALT)
+
+
+def dictionary_sync(
+    *,
+    dictionary_id: int,
+    token: Optional[str] = None,
+    version: Optional[str] = None,
+    revision: Optional[str] = None,
+) -> Optional[SyncChanges]:
+    """Return changes from the state of client to the current version of dictionary.
+
+    State of client is a token of previous sync or a version with its revision. When the state
+    is unknown, the version is changed in place since the token (or has another revision)
+    or changes are too many, all elements of the current version are returned.
+    Returns None for dictionary without current version.
+    """
+    current_version_id = selectors.dictionary_version_id(dictionary_id=dictionary_id)
+    current_revision = selectors.dictionary_version_revision(version_id=current_version_id)
+    if current_version_id is None or current_revision is None:
+        return None
+
+    new_token = sync_token(dictionary_id=dictionary_id, version_id=current_version_id, revision=current_revision[1])
+    diff = _diff_since_client_version(_client_version_id(dictionary_id, token, version, revision), current_version_id)
+    if diff is not None:
+        return SyncChanges(token=new_token, version=current_revision[0], full=False, arrays=diff)
+
+    elements = selectors.dictionary_version_element_list(version_id=current_version_id)
+    return SyncChanges(
+        token=new_token,
+        version=current_revision[0],
+        full=True,
+        arrays={'elements': elements.values('code', 'value')},
+    )
+
+
+def _diff_since_client_version(
+    client_version_id: Optional[int],
+    current_version_id: int,
+) -> Optional[dict[str, _ElementValues]]:
+    if client_version_id is None:
+        return None
+
+    if client_version_id == current_version_id:
+        no_changes = DictionaryElement.objects.none().values('code', 'value')
+        return {key: no_changes for key in _DIFF_KEYS}
+
+    diff = selectors.dictionary_version_diff(from_version_id=client_version_id, to_version_id=current_version_id)
+    if _exceeds(diff, settings.DICTIONARIES_SYNC_MAX_CHANGES):  # type: ignore[misc]
+        return None
+    return diff
+
+
+def _client_version_id(
+    dictionary_id: int,
+    token: Optional[str],
+    version: Optional[str],
+    revision: Optional[str],
+) -> Optional[int]:
+    """Return version of client copy, when elements of the version still have revision of the copy."""
+    version_id: Optional[int]
+    if token:
+        version_id, revision = _token_state(dictionary_id, token)
+    elif version:
+        if not revision:
+            raise ValidationError({'revision': 'Revision of the version is required.'})
+        version_id = selectors.dictionary_version_id(dictionary_id=dictionary_id, version=version)
+    else:
+        return None
+
+    version_revision = selectors.dictionary_version_revision(version_id=version_id)
+    if version_revision is None or version_revision[1] != revision:
+        return None
+    return version_id
+
+
+def _exceeds(diff: dict[str, _ElementValues], max_changes: int) -> bool:
+    changes_count = 0
+    for changes in diff.values():
+        changes_count += changes[:max_changes + 1 - changes_count].count()
+        if changes_count > max_changes:
+            return True
+    return False
+
+
+def _token_state(dictionary_id: int, token: str) -> tuple[int, str]:
+    try:
+        token_dictionary_id, version_id, revision = signing.loads(token, salt=_SIGNING_SALT)
+    except (signing.BadSignature, ValueError):
+        raise ValidationError({'token': 'Invalid sync token.'})
+    if token_dictionary_id != dictionary_id:
+        raise ValidationError({'token': 'Sync token of another dictionary.'})
+    return version_id, revision
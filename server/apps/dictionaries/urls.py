@@ -1,18 +1,55 @@
-from django.urls import path
+from django.conf import settings
+from django.urls import URLPattern, path
 
-from server.apps.dictionaries import views
+from server.apps.core.views import APIView, AsyncAPIView
+from server.apps.dictionaries import async_views, views
 
-urlpatterns = [
-    path(
-        '',
-        views.DictionaryListAPI.as_view(),
-    ),
-    path(
-        '<int:dictionary_id>/elements',
-        views.DictionaryElementListAPI.as_view(),
-    ),
-    path(
-        '<int:dictionary_id>/check_element',
-        views.DictionaryCheckElementAPI.as_view(),
-    ),
-]
+
+def api_urlpatterns(*, asynchronous: bool) -> list[URLPattern]:
+    """Return api urls, lists and element check are served by async views under ASGI."""
+    return [
+        path(
+            '',
+            _view(views.DictionaryListAPI, async_views.AsyncDictionaryListAPI, asynchronous=asynchronous),
+        ),
+        path(
+            '<int:dictionary_id>/elements',
+            _view(views.DictionaryElementListAPI, async_views.AsyncDictionaryElementListAPI, asynchronous=asynchronous),
+        ),
+        path(
+            '<int:dictionary_id>/versions/<path:version>/elements@<str:revision>',
+            _view(
+                views.DictionaryVersionElementListAPI,
+                async_views.AsyncDictionaryVersionElementListAPI,
+                asynchronous=asynchronous,
+            ),
+            name='dictionary-version-elements',
+        ),
+        path(
+            '<int:dictionary_id>/export',
+            views.DictionaryElementExportAPI.as_view(),
+        ),
+        path(
+            '<int:dictionary_id>/diff',
+            views.DictionaryVersionDiffAPI.as_view(),
+        ),
+        path(
+            '<int:dictionary_id>/sync',
+            views.DictionarySyncAPI.as_view(),
+        ),
+        path(
+            '<int:dictionary_id>/check_element',
+            _view(
+                views.DictionaryCheckElementAPI,
+                async_views.AsyncDictionaryCheckElementAPI,
+                asynchronous=asynchronous,
+            ),
+        ),
+    ]
+
+
+def _view(sync_view: type[APIView], async_view: type[AsyncAPIView], *, asynchronous: bool):
+    return (async_view if asynchronous else sync_view).as_view()
+
+
+urlpatterns = api_urlpatterns(asynchronous=settings.ASYNC_VIEWS)  # type: ignore[misc]
@@ -1,15 +1,40 @@
+import functools
+from typing import Optional
+from urllib.parse import quote
+
+from django.http import Http404, HttpResponseBase, StreamingHttpResponse
 from django.utils.timezone import now
 from django.utils.translation import gettext as _
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, OpenApiResponse, extend_schema
-from rest_framework import serializers, status, views
+from rest_framework import serializers, status
 from rest_framework.response import Response
 
-from server.apps.dictionaries import misc, selectors
-from server.apps.dictionaries.serializers import DictionaryElementSerializer, DictionarySerializer
-
-
-class DictionaryListAPI(views.APIView):
+from server.apps.core import routers
+from server.apps.core.serializers import UnsavedSerializer
+from server.apps.core.views import APIView
+from server.apps.dictionaries import caches, conditional, exports, formats, misc, selectors, snapshots, streaming, sync
+from server.apps.dictionaries.pagination import (
+    ELEMENTS_ORDERING_FIELDS,
+    PAGINATION_CURSOR,
+    PAGINATION_STREAM,
+    DictionaryElementCursorPagination,
+)
+from server.apps.dictionaries.serializers import (
+    DictionaryElementCheckBatchInputSerializer,
+    DictionaryElementCheckBatchOutputSerializer,
+    DictionaryElementCheckSerializer,
+    DictionaryElementSerializer,
+    DictionarySerializer,
+    DictionarySyncOutputSerializer,
+    DictionaryVersionDiffOutputSerializer,
+)
+
+# Identifier and revision of resolved version, both are None for missing version.
+_ResolvedVersion = tuple[Optional[int], Optional[str]]
+
+
+class DictionaryListAPI(APIView):
     """Dictionary list apiview class."""
 
     class DictionaryListFilterSerializer(serializers.Serializer):  # noqa: WPS431
@@ -84,29 +109,52 @@ class DictionaryListAPI(views.APIView):
             ),
         ],
     )
-    def get(self, request) -> Response:
+    def get(self, request):
         """Obtaining a list of dictionaries."""
         filters_serializer = self.DictionaryListFilterSerializer(
             data=request.query_params,
         )
         filters_serializer.is_valid(raise_exception=True)
 
-        dictionaries = selectors.dictionary_list(
-            filters=filters_serializer.validated_data,
-        ).distinct()
-
-        output = {'refbooks': dictionaries}
-        output_serializer = self.DictionaryOutputSerializer(output)
-        return Response(output_serializer.data)
+        cache_headers = conditional.dictionary_list_headers(request)
+        not_modified = cache_headers.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        output = functools.partial(self._dictionary_list_output, filters_serializer.validated_data)
+        if caches.response_cache.is_cacheable(request):
+            return cache_headers.apply(caches.cached_response(
+                request,
+                key=caches.dictionary_list_key(etag=cache_headers.etag),
+                output=output,
+                renderer_context=self.get_renderer_context(),
+            ))
+        return cache_headers.apply(Response(output()))
+
+    def _dictionary_list_output(self, filters) -> dict[str, object]:
+        dictionaries = selectors.dictionary_list(filters=filters).values_list('id', 'code', 'name')
+        # ETag is published token of list, replica could lag behind it.
+        with routers.use_primary():
+            # The same output as DictionarySerializer gives, without model instances and serializer fields.
+            return {
+                'refbooks': [
+                    {'id': str(dictionary_id), 'code': code, 'name': name}
+                    for dictionary_id, code, name in dictionaries
+                ],
+            }
 
 
-class DictionaryElementListAPI(views.APIView):
+class DictionaryElementListAPI(APIView):
     """Dictionary elements list api."""
 
     class DictionaryElementListFilterSerializer(serializers.Serializer):  # noqa: WPS431
         """Dictionary elements filter serializer."""
 
         version = serializers.CharField(required=False)
+        pagination = serializers.ChoiceField(
+            choices=(PAGINATION_CURSOR, PAGINATION_STREAM),
+            required=False,
+        )
 
         def update(self, instance, validated_data):
             """Not in use."""
@@ -154,6 +202,32 @@ class DictionaryElementListAPI(views.APIView):
                     ),
                 ],
             ),
+            OpenApiParameter(
+                name='pagination',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.PAGINATION_QUERY_PARAM_DESCRIPTION,
+                enum=[PAGINATION_CURSOR, PAGINATION_STREAM],
+            ),
+            OpenApiParameter(
+                name='ordering',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.ORDERING_QUERY_PARAM_DESCRIPTION,
+                enum=ELEMENTS_ORDERING_FIELDS,
+            ),
+            OpenApiParameter(
+                name='page_size',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=misc.PAGE_SIZE_QUERY_PARAM_DESCRIPTION,
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.CURSOR_QUERY_PARAM_DESCRIPTION,
+            ),
         ],
         responses={
             status.HTTP_200_OK: DictionaryElementListOutputSerializer,
@@ -192,31 +266,369 @@ class DictionaryElementListAPI(views.APIView):
         )
         filters_serializer.is_valid(raise_exception=True)
 
-        elements = selectors.dictionary_element_list(
+        version, cache_headers = self._cache_headers(
+            request,
+            dictionary_id,
+            filters_serializer.validated_data.get('version'),
+        )
+        return self._cached_response(request, cache_headers, version, filters_serializer.validated_data)
+
+    def _cache_headers(
+        self,
+        request,
+        dictionary_id: int,
+        version: Optional[str],
+        expected_revision: Optional[str] = None,
+    ) -> tuple[_ResolvedVersion, conditional.CacheHeaders]:
+        # Short queries of version and its revision, async view makes them by one call in thread of request.
+        version_id = selectors.dictionary_version_id(dictionary_id=dictionary_id, version=version)
+        version_revision = selectors.dictionary_version_revision(version_id=version_id)
+        cache_headers = conditional.element_list_headers(
+            request,
             dictionary_id=dictionary_id,
-            filters=filters_serializer.validated_data,
+            version_revision=version_revision,
+            current=not version,
+            expected_revision=expected_revision,
+        )
+        return (version_id, version_revision and version_revision[1]), cache_headers
+
+    def _cached_response(self, request, cache_headers, version, filters) -> HttpResponseBase:
+        not_modified = cache_headers.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        return cache_headers.apply(self._response(request, version, filters.get('pagination')))
+
+    def _response(self, request, version: _ResolvedVersion, pagination) -> HttpResponseBase:
+        version_id, revision = version
+
+        if pagination == PAGINATION_STREAM:
+            return streaming.elements_streaming_response(
+                selectors.dictionary_version_element_list(version_id=version_id),
+                request.accepted_renderer,
+            )
+        if pagination == PAGINATION_CURSOR:
+            return self._paginated_response(request, version_id)
+        if version_id is not None and revision is not None and caches.response_cache.is_cacheable(request):
+            return caches.cached_response(
+                request,
+                key=self._element_list_key(request, version_id, revision),
+                output=functools.partial(self._element_list_output, version_id),
+                renderer_context=self.get_renderer_context(),
+                # Revision and elements are read from replica of request, it could apply a change between the reads.
+                is_current=functools.partial(snapshots.is_current_revision, version_id=version_id, revision=revision),
+            )
+
+        return Response(self._element_list_output(version_id))
+
+    def _element_list_key(self, request, version_id: int, revision: str) -> str:
+        return caches.element_list_key(
+            version_id=version_id,
+            revision=revision,
+            response_format=request.accepted_renderer.format,
         )
 
-        output = {'elements': elements}
-        output_serializer = self.DictionaryElementListOutputSerializer(output)
-        return Response(output_serializer.data)
+    def _element_list_output(self, version_id: Optional[int]) -> dict[str, object]:
+        elements = selectors.dictionary_version_element_list(version_id=version_id)
+        # The same output as DictionaryElementListOutputSerializer gives, without model instances and serializer fields.
+        return {'elements': list(elements.values('code', 'value'))}
 
+    def _paginated_response(self, request, version_id: Optional[int]) -> Response:
+        elements = selectors.dictionary_version_element_list(version_id=version_id)
+        paginator = DictionaryElementCursorPagination()
+        page = paginator.paginate_queryset(elements.values(*ELEMENTS_ORDERING_FIELDS, 'value'), request, view=self)
+        return paginator.get_paginated_response([
+            {'code': element['code'], 'value': element['value']}
+            for element in page or ()
+        ])
 
-class DictionaryCheckElementAPI(views.APIView):
-    """Check element api."""
 
-    class DictionaryCheckElementFilterSerializer(serializers.Serializer):  # noqa: WPS431
-        """Check element api filter."""
+class DictionaryVersionElementListAPI(DictionaryElementListAPI):
+    """Elements list api of a version by content-addressed url, responses are immutable."""
+
+    @extend_schema(
+        summary=misc.VERSION_ELEMENTS_LIST_API_SUMMARY,
+        description=misc.VERSION_ELEMENTS_LIST_API_DESCRIPTION,
+        parameters=[
+            OpenApiParameter(
+                name='version',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description=misc.VERSION_PATH_PARAM_DESCRIPTION,
+                required=True,
+            ),
+            OpenApiParameter(
+                name='revision',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description=misc.REVISION_PATH_PARAM_DESCRIPTION,
+                required=True,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: DictionaryElementListAPI.DictionaryElementListOutputSerializer,
+        },
+    )
+    def get(self, request, dictionary_id: int, version: str, revision: str):  # type: ignore[override]
+        """Retrieving items from a given revision of dictionary version."""
+        filters_serializer = self.DictionaryElementListFilterSerializer(
+            data=request.query_params,
+        )
+        filters_serializer.is_valid(raise_exception=True)
+
+        resolved_version, cache_headers = self._cache_headers(
+            request,
+            dictionary_id,
+            version,
+            expected_revision=revision,
+        )
+        return self._cached_response(request, cache_headers, resolved_version, filters_serializer.validated_data)
+
+
+class DictionaryElementExportAPI(APIView):
+    """Dictionary version export api."""
+
+    class DictionaryElementExportFilterSerializer(UnsavedSerializer):  # noqa: WPS431
+        """Dictionary elements export filter serializers."""
 
-        code = serializers.CharField()
-        value = serializers.CharField()  # noqa: WPS110
         version = serializers.CharField(required=False)
+        file_format = serializers.ChoiceField(choices=formats.FORMATS, default=formats.FORMAT_CSV)
 
-        def update(self, instance, validated_data):
-            """Not in use."""
+    @extend_schema(
+        summary=misc.ELEMENTS_EXPORT_API_SUMMARY,
+        description=misc.ELEMENTS_EXPORT_API_DESCRIPTION,
+        parameters=[
+            OpenApiParameter(
+                name='dictionary_id',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description=misc.DICTIONARY_ID_PATH_PARAM_DESCRIPTION,
+                required=True,
+            ),
+            OpenApiParameter(
+                name='version',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.VERSION_QUERY_PARAM_DESCRIPTION,
+            ),
+            OpenApiParameter(
+                name='file_format',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.FORMAT_QUERY_PARAM_DESCRIPTION,
+                enum=formats.FORMATS,
+            ),
+        ],
+        responses={
+            (status.HTTP_200_OK, 'application/gzip'): OpenApiTypes.BINARY,
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(description=_('Version not found.')),
+        },
+    )
+    def get(self, request, dictionary_id: int):
+        """Downloading all items of a given dictionary version."""
+        filters_serializer = self.DictionaryElementExportFilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
 
-        def create(self, validated_data):
-            """Not in use."""
+        version_id = selectors.dictionary_version_id(
+            dictionary_id=dictionary_id,
+            version=filters_serializer.validated_data.get('version'),
+        )
+        version_revision = selectors.dictionary_version_revision(version_id=version_id)
+        if version_id is None or version_revision is None:
+            raise Http404
+        cache_headers = conditional.CacheHeaders(
+            request.get_full_path(),
+            version_id,
+            version_revision[1],
+            # Current version could roll over to a version modified earlier, it is validated by ETag only.
+            last_modified=version_revision[2] if filters_serializer.validated_data.get('version') else None,
+        )
+        not_modified = cache_headers.not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        return cache_headers.apply(self._response(
+            version_id,
+            '{0}-{1}'.format(dictionary_id, version_revision[0]),
+            filters_serializer.validated_data['file_format'],
+        ))
+
+    def _response(self, version_id: int, file_name: str, file_format: str) -> StreamingHttpResponse:
+        response = StreamingHttpResponse(
+            exports.stream_version_export(version_id, file_format),
+            content_type='application/gzip',
+        )
+        response.headers['Content-Disposition'] = "attachment; filename*=UTF-8''{0}".format(
+            quote('{0}.{1}.gz'.format(file_name, file_format)),
+        )
+        return response
+
+
+class DictionaryVersionDiffAPI(APIView):
+    """Dictionary versions diff api."""
+
+    class DictionaryVersionDiffFilterSerializer(UnsavedSerializer):  # noqa: WPS431
+        """Dictionary versions diff filter serializers. Field names from and to are reserved words."""
+
+        stream = serializers.BooleanField(default=False)
+
+        def get_fields(self):
+            """Return fields with versions to compare, the current version by default."""
+            fields = super().get_fields()
+            fields['from'] = serializers.CharField()
+            fields['to'] = serializers.CharField(required=False)
+            return fields
+
+    @extend_schema(
+        summary=misc.VERSION_DIFF_API_SUMMARY,
+        description=misc.VERSION_DIFF_API_DESCRIPTION,
+        parameters=[
+            OpenApiParameter(
+                name='dictionary_id',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description=misc.DICTIONARY_ID_PATH_PARAM_DESCRIPTION,
+                required=True,
+            ),
+            OpenApiParameter(
+                name='from',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.FROM_QUERY_PARAM_DESCRIPTION,
+                required=True,
+            ),
+            OpenApiParameter(
+                name='to',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.TO_QUERY_PARAM_DESCRIPTION,
+            ),
+            OpenApiParameter(
+                name='stream',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description=misc.STREAM_QUERY_PARAM_DESCRIPTION,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: DictionaryVersionDiffOutputSerializer,
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(description=_('Version not found.')),
+        },
+        examples=[
+            OpenApiExample(
+                _('Example successful response'),
+                response_only=True,
+                status_codes=[status.HTTP_200_OK],
+                value="""
+                {
+                  "added": [{"code": "element_333", "value": "value_333"}],
+                  "removed": [{"code": "element_111", "value": "value_111"}],
+                  "changed": [{"code": "element_222", "value": "value_222", "previous_value": "value_2"}]
+                }
+                """),
+        ],
+    )
+    def get(self, request, dictionary_id: int):
+        """Comparing elements of given dictionary versions."""
+        filters_serializer = self.DictionaryVersionDiffFilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+
+        from_version_id = self._version_id(dictionary_id, filters_serializer.validated_data['from'])
+        to_version_id = self._version_id(dictionary_id, filters_serializer.validated_data.get('to'))
+        diff = selectors.dictionary_version_diff(from_version_id=from_version_id, to_version_id=to_version_id)
+
+        if filters_serializer.validated_data['stream']:
+            return StreamingHttpResponse(streaming.stream_json(diff), content_type='application/json')
+        return Response(DictionaryVersionDiffOutputSerializer(diff).data)
+
+    def _version_id(self, dictionary_id: int, version) -> int:
+        version_id = selectors.dictionary_version_id(dictionary_id=dictionary_id, version=version)
+        if version_id is None:
+            raise Http404
+        return version_id
+
+
+class DictionarySyncAPI(APIView):
+    """Dictionary copy sync api."""
+
+    class DictionarySyncFilterSerializer(UnsavedSerializer):  # noqa: WPS431
+        """Dictionary sync filter serializers."""
+
+        token = serializers.CharField(required=False)
+        version = serializers.CharField(required=False)
+        revision = serializers.CharField(required=False)
+        stream = serializers.BooleanField(default=False)
+
+    @extend_schema(
+        summary=misc.SYNC_API_SUMMARY,
+        description=misc.SYNC_API_DESCRIPTION,
+        parameters=[
+            OpenApiParameter(
+                name='dictionary_id',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description=misc.DICTIONARY_ID_PATH_PARAM_DESCRIPTION,
+                required=True,
+            ),
+            OpenApiParameter(
+                name='token',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.TOKEN_QUERY_PARAM_DESCRIPTION,
+            ),
+            OpenApiParameter(
+                name='version',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.SYNC_VERSION_QUERY_PARAM_DESCRIPTION,
+            ),
+            OpenApiParameter(
+                name='revision',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=misc.SYNC_REVISION_QUERY_PARAM_DESCRIPTION,
+            ),
+            OpenApiParameter(
+                name='stream',
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description=misc.STREAM_QUERY_PARAM_DESCRIPTION,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: DictionarySyncOutputSerializer,
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(description=_('Version not found.')),
+        },
+    )
+    def get(self, request, dictionary_id: int):
+        """Synchronizing a copy of the given dictionary."""
+        filters_serializer = self.DictionarySyncFilterSerializer(data=request.query_params)
+        filters_serializer.is_valid(raise_exception=True)
+
+        changes = sync.dictionary_sync(
+            dictionary_id=dictionary_id,
+            token=filters_serializer.validated_data.get('token'),
+            version=filters_serializer.validated_data.get('version'),
+            revision=filters_serializer.validated_data.get('revision'),
+        )
+        if changes is None:
+            raise Http404
+
+        if filters_serializer.validated_data['stream']:
+            return StreamingHttpResponse(
+                streaming.stream_json(changes.arrays, fields=changes.fields),
+                content_type='application/json',
+            )
+        return Response(DictionarySyncOutputSerializer({**changes.fields, **changes.arrays}).data)
+
+
+class DictionaryCheckElementAPI(APIView):
+    """Check element api."""
+
+    class DictionaryCheckElementFilterSerializer(DictionaryElementCheckSerializer):  # noqa: WPS431
+        """Check element api filter."""
+
+        version = serializers.CharField(required=False)
 
     @extend_schema(
         summary=misc.ELEMENTS_CHECK_API_SUMMARY,
@@ -312,12 +724,91 @@ class DictionaryCheckElementAPI(views.APIView):
         )
         filters_serializer.is_valid(raise_exception=True)
 
-        elements = selectors.dictionary_element_list(
+        element_exists = snapshots.element_exists(
             dictionary_id=dictionary_id,
-            filters=filters_serializer.validated_data,
+            **filters_serializer.validated_data,
         )
 
-        if not elements.exists():
+        if not element_exists:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @extend_schema(
+        summary=misc.ELEMENTS_BATCH_CHECK_API_SUMMARY,
+        description=misc.ELEMENTS_BATCH_CHECK_API_DESCRIPTION,
+        parameters=[
+            OpenApiParameter(
+                name='dictionary_id',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description=misc.DICTIONARY_ID_PATH_PARAM_DESCRIPTION,
+                required=True,
+                examples=[
+                    OpenApiExample(
+                        _('Example dictionary id'),
+                        value='1',
+                    ),
+                ],
+            ),
+        ],
+        request=DictionaryElementCheckBatchInputSerializer,
+        responses={
+            status.HTTP_200_OK: DictionaryElementCheckBatchOutputSerializer,
+        },
+        examples=[
+            OpenApiExample(
+                _('Example request'),
+                request_only=True,
+                value="""
+                {
+                  "version": "vers_2",
+                  "elements": [
+                    {
+                      "code": "element_111",
+                      "value": "value_111"
+                    },
+                    {
+                      "code": "element_222",
+                      "value": "value_000"
+                    }
+                  ]
+                }
+                """),
+            OpenApiExample(
+                _('Example successful response'),
+                response_only=True,
+                status_codes=[status.HTTP_200_OK],
+                value="""
+                {
+                  "elements": [
+                    {
+                      "code": "element_111",
+                      "value": "value_111",
+                      "exists": true
+                    },
+                    {
+                      "code": "element_222",
+                      "value": "value_000",
+                      "exists": false
+                    }
+                  ]
+                }
+                """),
+        ],
+    )
+    def post(self, request, dictionary_id: int):
+        """Validation of elements batch."""
+        input_serializer = DictionaryElementCheckBatchInputSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        validated_data = input_serializer.validated_data
+
+        output = {
+            'elements': snapshots.check_elements(
+                dictionary_id=dictionary_id,
+                elements=validated_data['elements'],
+                version=validated_data.get('version'),
+            ),
+        }
+        output_serializer = DictionaryElementCheckBatchOutputSerializer(output)
+        return Response(output_serializer.data)
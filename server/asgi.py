@@ -0,0 +1,11 @@
+import os
+
+import django
+
+from server.apps.core.handlers import ASGIHandler
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
+# Async views are registered by urls under ASGI only.
+os.environ.setdefault('SERVER_INTERFACE', 'asgi')
+django.setup(set_prefix=False)
+application = ASGIHandler()
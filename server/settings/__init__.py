@@ -27,6 +27,7 @@ _base_settings = (
     'components/logging.py',
     'components/spectacular.py',
     'components/rest_framework.py',
+    'components/dictionaries.py',
 
     # Select the right env:
     'environments/{0}.py'.format(_ENV),
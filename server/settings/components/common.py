@@ -1,7 +1,9 @@
 import os
+import tempfile
 from typing import Tuple
 
 import dj_database_url
+from decouple import Csv
 
 from server.settings.components import BASE_DIR, config
 
@@ -29,7 +31,11 @@ INSTALLED_APPS: Tuple[str, ...] = (
 )
 
 MIDDLEWARE: Tuple[str, ...] = (
+    'server.apps.core.middleware.LoggingContextVarsMiddleware',
+    'server.apps.core.middleware.ProfilingMiddleware',
+    'server.apps.core.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'server.apps.core.middleware.PrimaryDatabaseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -37,7 +43,7 @@ MIDDLEWARE: Tuple[str, ...] = (
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'django.contrib.admindocs.middleware.XViewMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'server.apps.core.middleware.WhiteNoiseMiddleware',
 )
 
 ROOT_URLCONF = 'server.urls'
@@ -52,8 +58,62 @@ DATABASES = {
     ),
 }
 
+# Read-only replicas of the primary database, comma separated urls.
+# Reads are routed to replicas by server.apps.core.routers.ReplicaRouter, tests use the primary database.
+_replica_urls = config('DATABASE_REPLICA_URLS', cast=Csv(), default='')
+DATABASES.update({
+    'replica_{0}'.format(index): {**dj_database_url.parse(url), 'TEST': {'MIRROR': 'default'}}
+    for index, url in enumerate(_replica_urls, start=1)
+})
+DATABASE_REPLICAS = tuple(alias for alias in DATABASES if alias != 'default')
+DATABASE_ROUTERS = ('server.apps.core.routers.ReplicaRouter',)
+# Reads of a process go to the primary database for this amount of seconds after its writes,
+# so changes are read back before replicas catch up.
+DATABASE_REPLICA_PIN_SECONDS = config('DJANGO_DATABASE_REPLICA_PIN_SECONDS', cast=int, default=5)
+
 DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'
 
+# Caching
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+CACHES = {
+    'default': {
+        'BACKEND': config('DJANGO_CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('DJANGO_CACHE_LOCATION', default=''),
+    },
+}
+
+# Worker processes serving the application, set by config/gunicorn.py; caches checked to be shared by them
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', cast=int, default=1)
+
+# Async views of lists and element check are registered under ASGI, which server.asgi selects by default,
+# sync views are served under WSGI without event loop
+ASYNC_VIEWS = config('SERVER_INTERFACE', default='wsgi') == 'asgi'
+
+# Scraper of /metrics sends the token in "Authorization: Bearer <token>" header, staff users see metrics
+# without it, empty token allows staff users only
+METRICS_TOKEN = config('DJANGO_METRICS_TOKEN', default='')
+
+# Budgets of database queries of one request, checked by QueryBudgetMiddleware in development
+QUERY_BUDGET_MAX_QUERIES = config('DJANGO_QUERY_BUDGET_MAX_QUERIES', cast=int, default=20)
+# Max executions of similar statements (differing only by parameters), more usually are N+1 queries
+QUERY_BUDGET_MAX_REPEATS = config('DJANGO_QUERY_BUDGET_MAX_REPEATS', cast=int, default=2)
+
+# Profiling of requests by ProfilingMiddleware, it is not used when sample rate is 0 and token is empty
+PROFILING_SAMPLE_RATE = config('DJANGO_PROFILING_SAMPLE_RATE', cast=float, default=0)
+# Requests with X-Profile header equal to the token are profiled
+PROFILING_TOKEN = config('DJANGO_PROFILING_TOKEN', default='')
+PROFILING_SAMPLE_INTERVAL = config('DJANGO_PROFILING_SAMPLE_INTERVAL', cast=float, default=0.005)
+PROFILING_DIRECTORY = config(
+    'DJANGO_PROFILING_DIRECTORY',
+    default=os.path.join(tempfile.gettempdir(), 'dictionary_service_profiles'),
+)
+# Profiles kept in the directory, the oldest ones are removed
+PROFILING_MAX_FILES = config('DJANGO_PROFILING_MAX_FILES', cast=int, default=100)
+
+# Requests logged by LoggingContextVarsMiddleware slower than these seconds are logged as warnings with SQL and errors
+REQUEST_LOGGING_SLOW_SECONDS = config('DJANGO_REQUEST_LOGGING_SLOW_SECONDS', cast=float, default=1)
+REQUEST_LOGGING_VERY_SLOW_SECONDS = config('DJANGO_REQUEST_LOGGING_VERY_SLOW_SECONDS', cast=float, default=5)
+
 # General
 APPEND_SLASH = False
 TIME_ZONE = 'UTC'
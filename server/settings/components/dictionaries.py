@@ -0,0 +1,72 @@
+from server.settings.components import config
+
+# Dictionaries application
+# In-process snapshots of dictionary versions used by check element api.
+# Memory is bounded by total amount of elements in all loaded snapshots.
+DICTIONARIES_SNAPSHOT_MAX_ELEMENTS = config(
+    'DJANGO_DICTIONARIES_SNAPSHOT_MAX_ELEMENTS', cast=int, default=2000000,
+)
+# Snapshots are dropped after this amount of seconds.
+DICTIONARIES_SNAPSHOT_TTL = config(
+    'DJANGO_DICTIONARIES_SNAPSHOT_TTL', cast=int, default=300,
+)
+# Revisions of versions and changes of versions of dictionaries are published in Django cache
+# with this alias, snapshots and resolved versions of every worker process are checked against them.
+DICTIONARIES_SNAPSHOT_CACHE_ALIAS = 'default'
+
+# Max amount of elements validated by one request of batch check element api.
+DICTIONARIES_CHECK_BATCH_MAX_SIZE = config(
+    'DJANGO_DICTIONARIES_CHECK_BATCH_MAX_SIZE', cast=int, default=1000,
+)
+
+# Max page size of elements list api with cursor pagination.
+DICTIONARIES_ELEMENTS_MAX_PAGE_SIZE = config(
+    'DJANGO_DICTIONARIES_ELEMENTS_MAX_PAGE_SIZE', cast=int, default=10000,
+)
+# Amount of rows fetched from database at once by streamed elements list api.
+DICTIONARIES_ELEMENTS_STREAM_CHUNK_SIZE = config(
+    'DJANGO_DICTIONARIES_ELEMENTS_STREAM_CHUNK_SIZE', cast=int, default=2000,
+)
+
+# Max age in seconds of elements list responses, which can change.
+# Responses of current version are not cached after start of the next version.
+DICTIONARIES_ELEMENTS_MAX_AGE = config(
+    'DJANGO_DICTIONARIES_ELEMENTS_MAX_AGE', cast=int, default=60,
+)
+# Max age in seconds of elements list responses by content-addressed urls.
+DICTIONARIES_ELEMENTS_IMMUTABLE_MAX_AGE = config(
+    'DJANGO_DICTIONARIES_ELEMENTS_IMMUTABLE_MAX_AGE', cast=int, default=31536000,
+)
+
+# Elements written by one query (COPY on PostgreSQL) by import_version command,
+# also elements changed by one query by bulk actions of admin.
+DICTIONARIES_IMPORT_BATCH_SIZE = config(
+    'DJANGO_DICTIONARIES_IMPORT_BATCH_SIZE', cast=int, default=10000,
+)
+
+# Elements counted by admin list of elements, pages after this amount are not shown (use search).
+DICTIONARIES_ADMIN_ELEMENTS_MAX_COUNT = config(
+    'DJANGO_DICTIONARIES_ADMIN_ELEMENTS_MAX_COUNT', cast=int, default=10000,
+)
+
+# Changes returned by sync api, with more changes all elements are returned.
+DICTIONARIES_SYNC_MAX_CHANGES = config(
+    'DJANGO_DICTIONARIES_SYNC_MAX_CHANGES', cast=int, default=10000,
+)
+
+# Encoded elements list responses are cached in Django cache with this alias,
+# use a cache shared by worker processes (memcached, redis) in production.
+DICTIONARIES_RESPONSE_CACHE_ALIAS = 'default'
+# Cached responses are dropped after this amount of seconds or on changes of elements.
+DICTIONARIES_RESPONSE_CACHE_TTL = config(
+    'DJANGO_DICTIONARIES_RESPONSE_CACHE_TTL', cast=int, default=300,
+)
+# Requests wait for response rendered by concurrent request not longer than this amount of seconds.
+DICTIONARIES_RESPONSE_CACHE_FILL_TIMEOUT = config(
+    'DJANGO_DICTIONARIES_RESPONSE_CACHE_FILL_TIMEOUT', cast=int, default=30,
+)
+# Responses greater than this amount of bytes are not cached (memcached limits items to 1 MB).
+DICTIONARIES_RESPONSE_CACHE_MAX_SIZE = config(
+    'DJANGO_DICTIONARIES_RESPONSE_CACHE_MAX_SIZE', cast=int, default=1024 * 1024,
+)
+DICTIONARIES_RESPONSE_CACHE_FORMATS = ('json', 'msgpack')
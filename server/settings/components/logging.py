@@ -5,13 +5,8 @@
 # 'Do not log' by Nikita Sobolev (@sobolevn)
 # https://sobolevn.me/2020/03/do-not-log
 
-from typing import TYPE_CHECKING, Callable
-
 import structlog
 
-if TYPE_CHECKING:
-    from django.http import HttpRequest, HttpResponse
-
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -48,6 +43,7 @@ LOGGING = {
     # These loggers are required by our app:
     # - django is required when using `logger.getLogger('django')`
     # - security is required by `axes`
+    # - server is used by our apps
     'loggers': {
         'django': {
             'handlers': ['console'],
@@ -59,32 +55,15 @@ LOGGING = {
             'level': 'ERROR',
             'propagate': False,
         },
+        'server': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
 
-class LoggingContextVarsMiddleware(object):
-    """Used to reset ContextVars in structlog on each request."""
-
-    def __init__(
-        self,
-        get_response: 'Callable[[HttpRequest], HttpResponse]',
-    ) -> None:
-        """Django's API-compatible constructor."""
-        self.get_response = get_response
-
-    def __call__(self, request: 'HttpRequest') -> 'HttpResponse':
-        """
-        Handle requests.
-
-        Add your logging metadata here.
-        Example: https://github.com/jrobichaud/django-structlog
-        """
-        response = self.get_response(request)
-        structlog.contextvars.clear_contextvars()
-        return response
-
-
 if not structlog.is_configured():
     structlog.configure(
         processors=[
@@ -18,7 +18,10 @@ INSTALLED_APPS += (
     'django_nose',
 )
 
-MIDDLEWARE += ('debug_toolbar.middleware.DebugToolbarMiddleware',)
+MIDDLEWARE += (
+    'debug_toolbar.middleware.DebugToolbarMiddleware',
+    'server.apps.core.middleware.QueryBudgetMiddleware',
+)
 
 TEST_RUNNER = 'django_nose.NoseTestSuiteRunner'
 
@@ -34,6 +37,7 @@ INTERNAL_IPS += ['127.0.0.1']
 
 DEFAULT_RENDERER_CLASSES = (
     'rest_framework.renderers.JSONRenderer',
+    'server.apps.core.renderers.MessagePackRenderer',
     'rest_framework.renderers.BrowsableAPIRenderer',
 )
 REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = DEFAULT_RENDERER_CLASSES
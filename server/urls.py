@@ -3,6 +3,7 @@ from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from server.apps.core.views import metrics_view
 from server.apps.dictionaries import urls as dict_urls
 
 urlpatterns = [
@@ -15,6 +16,7 @@ urlpatterns = [
         name='swagger-ui',
     ),
     path('refbooks/', include(dict_urls)),
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 if settings.DEBUG:  # pragma: no cover
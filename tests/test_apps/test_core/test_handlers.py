@@ -0,0 +1,65 @@
+import json
+
+from asgiref.sync import async_to_sync
+from django.test import TransactionTestCase
+
+from server.apps.core.handlers import ASGIHandler
+from tests.test_apps.test_dictionaries import factories
+
+_Message = dict[str, object]
+
+
+def _request(path: str, query_string: bytes = b'') -> list[_Message]:
+    """Make GET request to ASGI application and return sent messages."""
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'root_path': '',
+        'query_string': query_string,
+        'headers': [(b'host', b'testserver')],
+        'server': ('testserver', 80),
+    }
+    messages: list[_Message] = []
+
+    async def receive() -> _Message:  # noqa: WPS430
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: _Message) -> None:  # noqa: WPS430
+        messages.append(message)
+
+    async_to_sync(ASGIHandler())(scope, receive, send)  # type: ignore[no-untyped-call]
+    return messages
+
+
+def _body(messages: list[_Message]) -> bytes:
+    parts = [message.get('body', b'') for message in messages[1:]]
+    return b''.join(parts)  # type: ignore[arg-type]
+
+
+class TestASGIHandler(TransactionTestCase):
+    """This is test of ASGI handler with streaming responses fetched from database."""
+
+    def setUp(self) -> None:
+        """Setup version with elements."""
+        self.version = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory.create_batch(3, version=self.version)
+        self.uri = '/refbooks/{0}/elements'.format(self.version.dictionary.id)
+
+    def test_stream(self) -> None:
+        """Tests streamed elements are fetched and sent by parts."""
+        messages = _request(self.uri, b'pagination=stream')
+
+        assert messages[0]['status'] == 200
+        assert len(json.loads(_body(messages))['elements']) == 3
+        assert messages[-1] == {'type': 'http.response.body'}
+
+    def test_response(self) -> None:
+        """Tests not streaming response is sent as is."""
+        messages = _request(self.uri)
+
+        assert messages[0]['status'] == 200
+        assert len(json.loads(_body(messages))['elements']) == 3
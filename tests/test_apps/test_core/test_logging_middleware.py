@@ -0,0 +1,117 @@
+import functools
+from typing import TypedDict, cast
+from unittest import mock
+
+import structlog
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from server.apps.core.middleware import LoggingContextVarsMiddleware
+from server.apps.dictionaries.models import Dictionary
+from tests.test_apps.test_dictionaries import factories
+
+
+class _Record(TypedDict, total=False):
+    dictionary_id: int
+    version_id: int
+    db_queries: int
+    duration: float
+    serialization_duration: float
+    response_bytes: int
+    sql: list[str]
+
+
+_Records = list[tuple[str, _Record]]
+
+
+def _record(records: _Records, level: str, event: str, **fields: object) -> None:
+    record = {**structlog.contextvars.get_contextvars(), **fields}
+    records.append((level, cast(_Record, record)))
+
+
+def _count_dictionaries(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(str(Dictionary.objects.count()))
+
+
+async def _acount_dictionaries(request: HttpRequest) -> HttpResponse:
+    return await sync_to_async(_count_dictionaries)(request)
+
+
+class TestLoggingContextVarsMiddleware(TestCase):
+    """This is test of logs of requests with their timings."""
+
+    def setUp(self) -> None:
+        """Setup test data and records of logs for test case."""
+        cache.clear()
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory.create_batch(3, version=self.version)
+        self.uri = '/refbooks/{0}/elements'.format(self.version.dictionary.id)
+        self.records: _Records = []
+        patcher = mock.patch('server.apps.core.middleware.logger')
+        logger = patcher.start()
+        self.addCleanup(patcher.stop)
+        for level in ('info', 'warning', 'error'):
+            getattr(logger, level).side_effect = functools.partial(_record, self.records, level)
+
+    def test_request_log(self) -> None:
+        """Tests request is logged with resolved dictionary, version and timings, context is reset after request."""
+        response = self.client.get(self.uri)
+
+        level, record = self.records[-1]
+        assert (level, record['dictionary_id'], record['version_id']) == (
+            'info', self.version.dictionary.id, self.version.id,
+        )
+        assert record['db_queries'] > 0
+        assert record['response_bytes'] == len(response.content)
+        assert 0 < record['serialization_duration'] < record['duration']
+        assert not structlog.contextvars.get_contextvars()
+
+    @override_settings(REQUEST_LOGGING_SLOW_SECONDS=0)
+    def test_slow_request_log(self) -> None:
+        """Tests slow requests are logged as warnings with their SQL."""
+        self.client.get(self.uri)
+
+        level, record = self.records[-1]
+        assert level == 'warning'
+        assert len(record['sql']) == record['db_queries']
+
+    @override_settings(REQUEST_LOGGING_SLOW_SECONDS=0, REQUEST_LOGGING_VERY_SLOW_SECONDS=0)
+    def test_very_slow_request_log(self) -> None:
+        """Tests very slow requests are logged as errors."""
+        self.client.get(self.uri)
+
+        assert self.records[-1][0] == 'error'
+
+    def test_async(self) -> None:
+        """Tests queries in threads of async request are counted."""
+        middleware = async_to_sync(LoggingContextVarsMiddleware(_acount_dictionaries))  # type: ignore[no-untyped-call]
+
+        middleware(RequestFactory().get('/'))
+
+        level, record = self.records[-1]
+        assert (level, record['db_queries'], record['response_bytes']) == ('info', 1, 1)
+
+    def test_context_is_reset_before_request(self) -> None:
+        """Tests values left by a failed request are not logged, time of serialization is omitted for non-api views."""
+        structlog.contextvars.bind_contextvars(dictionary_id=0, version_id=0)
+        middleware = LoggingContextVarsMiddleware(_count_dictionaries)
+
+        middleware(RequestFactory().get('/'))
+
+        record = self.records[-1][1]
+        assert 'version_id' not in record
+        assert 'serialization_duration' not in record
+
+    def test_check_element_from_snapshot(self) -> None:
+        """Tests check of elements by loaded snapshot without database logs resolved version."""
+        uri = '/refbooks/{0}/check_element'.format(self.version.dictionary.id)
+        self.client.get(uri, data={'code': 'code', 'value': 'value'})
+
+        with self.assertNumQueries(0):
+            self.client.get(uri, data={'code': 'code', 'value': 'value'})
+
+        assert self.records[-1][1]['version_id'] == self.version.id
@@ -0,0 +1,113 @@
+import os
+import tempfile
+from unittest import mock
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from server.apps.core.middleware import MetricsMiddleware
+from server.apps.dictionaries.models import Dictionary
+from tests.test_apps.test_dictionaries import factories
+
+_LIST_VIEW = 'server.apps.dictionaries.views.DictionaryListAPI'
+_UNMATCHED_VIEW = '<unmatched>'
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def _count_dictionaries(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(str(Dictionary.objects.count()))
+
+
+def _stream_dictionaries(request: HttpRequest) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(iter([b'1', b'2']))
+    response['Content-Length'] = '2'
+    return response
+
+
+async def _acount_dictionaries(request: HttpRequest) -> HttpResponse:
+    return await sync_to_async(_count_dictionaries)(request)
+
+
+class TestMetrics(TestCase):
+    """This is test of Prometheus metrics of requests, database queries and caches."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+
+    def test_request_metrics(self) -> None:
+        """Tests duration, database queries and size of responses are observed by view."""
+        requests = _sample('http_request_duration_seconds_count', view=_LIST_VIEW, method='GET')
+        queries = _sample('http_request_db_queries_sum', view=_LIST_VIEW)
+        size = _sample('http_response_size_bytes_sum', view=_LIST_VIEW)
+
+        response = self.client.get('/refbooks/')
+
+        assert _sample('http_request_duration_seconds_count', view=_LIST_VIEW, method='GET') == requests + 1
+        assert _sample('http_request_db_queries_sum', view=_LIST_VIEW) > queries
+        assert _sample('http_response_size_bytes_sum', view=_LIST_VIEW) == size + len(response.content)
+
+    def test_async_request_metrics(self) -> None:
+        """Tests queries made in threads of async request are counted."""
+        queries = _sample('http_request_db_queries_sum', view=_UNMATCHED_VIEW)
+        middleware = async_to_sync(MetricsMiddleware(_acount_dictionaries))  # type: ignore[no-untyped-call]
+
+        response = middleware(RequestFactory().get('/'))
+
+        assert response.content == b'1'
+        assert _sample('http_request_db_queries_sum', view=_UNMATCHED_VIEW) == queries + 1
+
+    def test_streaming_response_size(self) -> None:
+        """Tests size of streaming responses is taken from Content-Length without reading their content."""
+        size = _sample('http_response_size_bytes_sum', view=_UNMATCHED_VIEW)
+
+        response = MetricsMiddleware(_stream_dictionaries)(RequestFactory().get('/'))
+
+        assert _sample('http_response_size_bytes_sum', view=_UNMATCHED_VIEW) == size + 2
+        assert isinstance(response, StreamingHttpResponse)
+        assert b''.join(response.streaming_content) == b'12'
+
+    def test_check_element_metrics(self) -> None:
+        """Tests checked elements and lookups of caches are counted."""
+        element = factories.DictionaryElementFactory(version=self.version)
+        uri = '/refbooks/{0}/check_element'.format(self.version.dictionary.id)
+        hits = _sample('dictionaries_checked_elements_total', result='hit')
+        misses = _sample('dictionaries_checked_elements_total', result='miss')
+        snapshot_lookups = _sample('cache_requests_total', cache='snapshots', result='miss')
+
+        self.client.get(uri, data={'code': element.code, 'value': element.value})
+        self.client.get(uri, data={'code': element.code, 'value': 'missing'})
+
+        assert _sample('dictionaries_checked_elements_total', result='hit') == hits + 1
+        assert _sample('dictionaries_checked_elements_total', result='miss') == misses + 1
+        assert _sample('cache_requests_total', cache='snapshots', result='miss') > snapshot_lookups
+
+    def test_metrics_view(self) -> None:
+        """Tests metrics are exposed to staff users in Prometheus text format, also merged from files of workers."""
+        self.client.get('/refbooks/')
+        self.client.force_login(get_user_model().objects.create_user('staff', is_staff=True))
+
+        response = self.client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/plain')
+        assert b'http_request_duration_seconds_bucket{' in response.content
+
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(os.environ, {'PROMETHEUS_MULTIPROC_DIR': directory}):
+                assert self.client.get('/metrics').status_code == 200
+
+    @override_settings(METRICS_TOKEN='secret')  # noqa: S106
+    def test_metrics_view_is_restricted(self) -> None:
+        """Tests metrics are forbidden to anonymous users and scrapers with wrong token."""
+        assert self.client.get('/metrics').status_code == 403
+        assert self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code == 403
+        assert self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret').status_code == 200
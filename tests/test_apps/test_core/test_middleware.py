@@ -0,0 +1,41 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from server.apps.core.middleware import WhiteNoiseMiddleware
+
+_STATIC_FILE = '/static/admin/css/base.css'
+
+
+def _get_response(request: HttpRequest) -> HttpResponse:
+    return HttpResponse('view')
+
+
+async def _aget_response(request: HttpRequest) -> HttpResponse:
+    return _get_response(request)
+
+
+@override_settings(WHITENOISE_AUTOREFRESH=True, WHITENOISE_USE_FINDERS=True)
+class TestWhiteNoiseMiddleware(TestCase):
+    """This is test of static files middleware in synchronous and asynchronous modes."""
+
+    def setUp(self) -> None:
+        """Setup request factory for test case."""
+        self.factory = RequestFactory()
+
+    def test_async(self) -> None:
+        """Tests middleware is async with async handler, serves static files and passes other requests."""
+        middleware = WhiteNoiseMiddleware(_aget_response)
+        call = async_to_sync(middleware)  # type: ignore[no-untyped-call]
+
+        assert iscoroutinefunction(middleware)
+        assert call(self.factory.get('/refbooks/')).content == b'view'
+        assert call(self.factory.get(_STATIC_FILE))['Content-Type'].startswith('text/css')
+
+    def test_sync(self) -> None:
+        """Tests middleware is sync with sync handler."""
+        middleware = WhiteNoiseMiddleware(_get_response)
+
+        assert not iscoroutinefunction(middleware)
+        assert middleware(self.factory.get('/refbooks/')).content == b'view'
+        assert middleware(self.factory.get(_STATIC_FILE))['Content-Type'].startswith('text/css')
@@ -0,0 +1,62 @@
+import json
+import os
+import tempfile
+import time
+
+from django.test import TestCase
+
+from server.apps.core import profiling
+
+_SERIALIZATION_SECONDS = 0.02
+_QUERY_SECONDS = 0.05
+
+
+class TestProfile(TestCase):
+    """This is test of time of phases and sampled stacks of profiles."""
+
+    def test_phases(self) -> None:
+        """Tests time of nested phases is excluded from the enclosing phase."""
+        profile = profiling.Profile(sample_interval=0.001)
+        with profiling.timed(profile):
+            with profiling.phase(profiling.SERIALIZATION):
+                time.sleep(_SERIALIZATION_SECONDS)
+                with profiling.phase(profiling.QUERY):
+                    time.sleep(_QUERY_SECONDS)
+
+        query = profile.phases[profiling.QUERY]
+        serialization = profile.phases[profiling.SERIALIZATION]
+        assert query.count == serialization.count == 1
+        assert query.wall >= _QUERY_SECONDS
+        assert _SERIALIZATION_SECONDS <= serialization.wall < _QUERY_SECONDS
+        assert profile.total.wall >= query.wall + serialization.wall
+        assert any(stack.endswith('test_profiling:test_phases') for stack in profile.sampler.stacks)
+
+    def test_nested_timings(self) -> None:
+        """Tests phases are timed by all timed blocks, phases out of timed blocks are not timed."""
+        timings = profiling.Timings()
+        profile = profiling.Profile(sample_interval=1)
+        with profiling.timed(timings):
+            with profiling.timed(profile):
+                with profiling.phase(profiling.QUERY):
+                    time.sleep(_QUERY_SECONDS)
+            with profiling.phase(profiling.QUERY):
+                time.sleep(_QUERY_SECONDS)
+        with profiling.phase(profiling.QUERY):
+            time.sleep(_QUERY_SECONDS)
+
+        assert timings.phases[profiling.QUERY].count == 2
+        assert profile.phases[profiling.QUERY].count == 1
+        assert profile.phases[profiling.QUERY].wall < timings.phases[profiling.QUERY].wall
+
+    def test_save(self) -> None:
+        """Tests summaries and stacks of the last profiles are kept."""
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [
+                profiling.Profile(sample_interval=1).save(directory, max_files=2, details={'path': '/'})
+                for _ in range(3)
+            ]
+
+            assert len(os.listdir(directory)) == 4
+            assert not os.path.exists(paths[0])
+            with open(paths[-1]) as summary_file:
+                assert json.load(summary_file)['path'] == '/'
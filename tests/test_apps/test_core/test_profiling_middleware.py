@@ -0,0 +1,88 @@
+import os
+import tempfile
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from server.apps.core.middleware import ProfilingMiddleware
+from server.apps.dictionaries.models import Dictionary
+
+
+async def _acount_dictionaries(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(str(await Dictionary.objects.acount()))
+
+
+@override_settings(PROFILING_TOKEN='secret', PROFILING_SAMPLE_RATE=0)  # noqa: S106
+class TestProfilingMiddleware(TestCase):
+    """This is test of profiling of requests by header and sampling."""
+
+    def setUp(self) -> None:
+        """Setup empty directory of profiles for test case."""
+        cache.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        directory_settings = override_settings(PROFILING_DIRECTORY=self.directory)
+        directory_settings.enable()
+        self.addCleanup(directory_settings.disable)
+        self.client = APIClient()
+
+    def test_profiled_request(self) -> None:
+        """Tests phases of request with token are profiled, rendering of cached response too."""
+        with mock.patch('server.apps.core.middleware.logger') as logger:
+            self.client.get('/refbooks/', HTTP_X_PROFILE='secret')
+            # Summary is logged before request_finished.
+            summary = logger.info.call_args_list[-2].kwargs
+
+        assert summary['path'] == '/refbooks/'
+        assert summary['status'] == 200
+        phases = summary['phases']
+        assert phases['query']['count'] > 0
+        assert phases['serialization']['count'] == phases['rendering']['count'] == 1
+        assert sorted(os.listdir(self.directory)) == [
+            os.path.basename(summary['profile']).replace('.json', '.folded'),
+            os.path.basename(summary['profile']),
+        ]
+
+    def test_template_response_rendering(self) -> None:
+        """Tests rendering of template responses of rest framework is profiled."""
+        with mock.patch('server.apps.core.middleware.logger') as logger:
+            self.client.get('/refbooks/', HTTP_X_PROFILE='secret', HTTP_ACCEPT='application/json; indent=2')
+            summary = logger.info.call_args_list[-2].kwargs
+
+        assert summary['phases']['rendering']['count'] == 1
+
+    def test_not_profiled_request(self) -> None:
+        """Tests requests without header or with wrong token are not profiled."""
+        self.client.get('/refbooks/')
+        self.client.get('/refbooks/', HTTP_X_PROFILE='wrong')
+
+        assert not os.listdir(self.directory)
+
+    def test_sampled_request(self) -> None:
+        """Tests sampled requests are profiled without header."""
+        with override_settings(PROFILING_TOKEN='', PROFILING_SAMPLE_RATE=1):  # noqa: S106
+            APIClient().get('/refbooks/')
+
+        assert len(os.listdir(self.directory)) == 2
+
+    def test_async(self) -> None:
+        """Tests queries in threads of async request are profiled."""
+        request = RequestFactory().get('/', HTTP_X_PROFILE='secret')
+        with mock.patch('server.apps.core.middleware.logger') as logger:
+            async_to_sync(ProfilingMiddleware(_acount_dictionaries))(request)  # type: ignore[no-untyped-call]
+            phases = logger.info.call_args.kwargs['phases']
+
+        assert phases['query']['count'] == 1
+
+    def test_disabled(self) -> None:
+        """Tests middleware is not used without sampling and token."""
+        with override_settings(PROFILING_TOKEN=''):  # noqa: S106
+            with pytest.raises(MiddlewareNotUsed):
+                ProfilingMiddleware(_acount_dictionaries)
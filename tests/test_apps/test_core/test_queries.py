@@ -0,0 +1,92 @@
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from server.apps.core import queries
+from server.apps.core.middleware import QueryBudgetMiddleware
+from server.apps.dictionaries.models import Dictionary
+from tests.test_apps.test_dictionaries import factories
+
+
+def _get_dictionaries(request: HttpRequest) -> HttpResponse:
+    dictionaries = Dictionary.objects.all()
+    codes = [Dictionary.objects.get(pk=dictionary.pk).code for dictionary in dictionaries]
+    return HttpResponse(','.join(codes))
+
+
+async def _aget_dictionaries(request: HttpRequest) -> HttpResponse:
+    return await sync_to_async(_get_dictionaries)(request)
+
+
+def _get_dictionaries_within_budget(**budget: int) -> None:
+    with queries.query_budget(**budget):
+        _get_dictionaries(HttpRequest())
+
+
+class TestQueryBudget(TestCase):
+    """This is test of recording of database queries and checks of query budgets."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        factories.DictionaryFactory.create_batch(3)
+
+    def test_similar_statement(self) -> None:
+        """Tests statements differing by parameters and literals are similar."""
+        first = queries.similar_statement('SELECT "code" FROM "t" WHERE "id" IN (%s, %s) LIMIT 21')  # noqa: WPS323
+        second = queries.similar_statement('SELECT "code" FROM "t" WHERE "id" IN (%s) LIMIT 1')  # noqa: WPS323
+
+        assert first == second == 'SELECT "code" FROM "t" WHERE "id" IN (...) LIMIT ?'
+        assert queries.similar_statement("WHERE \"code\" = 'it''s'") == 'WHERE "code" = ?'
+
+    def test_within_budget(self) -> None:
+        """Tests queries within budget are recorded by nested blocks."""
+        with queries.query_budget(max_queries=2, max_repeats=1) as outer_stats:
+            Dictionary.objects.count()
+            with queries.recorded_queries() as inner_stats:
+                list(Dictionary.objects.all())
+                assert inner_stats.count == 1
+            assert inner_stats.statements == outer_stats.statements[1:]  # noqa: WPS441
+
+    def test_request_queries(self) -> None:
+        """Tests queries of request are recorded once, nested blocks share the same stats."""
+        with queries.request_queries() as outer_stats:
+            with queries.request_queries() as inner_stats:
+                Dictionary.objects.count()
+                assert inner_stats is outer_stats
+            assert outer_stats.count == 1
+
+    def test_exceeded_budget(self) -> None:
+        """Tests exceeded budget and repeated similar queries are reported."""
+        with pytest.raises(queries.QueryBudgetExceeded, match='4 queries, budget is 3'):
+            _get_dictionaries_within_budget(max_queries=3)
+
+        with pytest.raises(queries.QueryBudgetExceeded, match='3 similar queries, budget is 1'):
+            _get_dictionaries_within_budget(max_repeats=1)
+
+
+@override_settings(QUERY_BUDGET_MAX_QUERIES=10, QUERY_BUDGET_MAX_REPEATS=1)
+class TestQueryBudgetMiddleware(TestCase):
+    """This is test of logging of requests exceeding query budgets."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        factories.DictionaryFactory.create_batch(2)
+        self.request = RequestFactory().get('/refbooks/')
+
+    def test_sync(self) -> None:
+        """Tests N+1 queries of request are logged."""
+        with mock.patch('server.apps.core.middleware.logger') as logger:
+            QueryBudgetMiddleware(_get_dictionaries)(self.request)
+            logger.warning.assert_called_once()
+            assert logger.warning.call_args.kwargs['queries'] == 3
+
+    def test_async(self) -> None:
+        """Tests queries in threads of async request are checked, requests within budgets are not logged."""
+        with mock.patch('server.apps.core.middleware.logger') as logger:
+            async_to_sync(QueryBudgetMiddleware(_aget_dictionaries))(self.request)  # type: ignore[no-untyped-call]
+            with override_settings(QUERY_BUDGET_MAX_REPEATS=2):
+                async_to_sync(QueryBudgetMiddleware(_aget_dictionaries))(self.request)  # type: ignore[no-untyped-call]
+            logger.warning.assert_called_once()
@@ -0,0 +1,36 @@
+import datetime
+import struct
+
+import pytest
+
+from server.apps.core.renderers import MessagePackRenderer, packb
+
+
+@pytest.mark.parametrize(('instance', 'expected'), [
+    (None, b'\xc0'),
+    (False, b'\xc2'),
+    (True, b'\xc3'),
+    (1, b'\x01'),
+    (-1, b'\xff'),
+    (300, b'\xcd\x01\x2c'),
+    (-300, b'\xd1\xfe\xd4'),
+    (2 ** 64 - 1, b''.join((b'\xcf', b'\xff' * 8))),
+    (-2 ** 63, b''.join((b'\xd3\x80', b'\x00' * 7))),
+    (1.5, struct.pack('>Bd', 0xCB, 1.5)),
+    ('code', b'\xa4code'),
+    ('й' * 20, b''.join((b'\xd9\x28', 'й'.encode() * 20))),
+    ('x' * 300, b''.join((b'\xda\x01\x2c', b'x' * 300))),
+    (b'ab', b'\xc4\x02ab'),
+    ([1, 2], b'\x92\x01\x02'),
+    ((True,) * 20, b''.join((b'\xdc\x00\x14', b'\xc3' * 20))),
+    ({'a': None}, b'\x81\xa1a\xc0'),
+    (datetime.date(2020, 1, 2), b'\xaa2020-01-02'),
+])
+def test_packb(instance: object, expected: bytes) -> None:
+    """Tests objects are packed according to MessagePack specification."""
+    assert packb(instance) == expected
+
+
+def test_render_empty() -> None:
+    """Tests empty data is rendered to empty body."""
+    assert MessagePackRenderer().render(None) == b''
@@ -0,0 +1,124 @@
+import time
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from server.apps.core import routers
+from server.apps.core.middleware import PrimaryDatabaseMiddleware
+from server.apps.dictionaries.models import DictionaryElement, DictionaryVersion
+
+_REPLICA = 'replica_1'
+
+
+def _read_database(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(routers.ReplicaRouter().db_for_read(DictionaryElement))
+
+
+async def _aread_database(request: HttpRequest) -> HttpResponse:
+    return _read_database(request)
+
+
+def _read_database_later(request: HttpRequest) -> HttpResponse:
+    with mock.patch('time.time', return_value=time.time() + 90):
+        return _read_database(request)
+
+
+def _write_database(request: HttpRequest) -> HttpResponse:
+    routers.ReplicaRouter().db_for_write(DictionaryVersion)
+    return _read_database(request)
+
+
+@override_settings(DATABASE_REPLICAS=(_REPLICA,), DATABASE_REPLICA_PIN_SECONDS=60)
+class TestReplicaRouter(SimpleTestCase):
+    """This is test of routing of reads to replicas and writes to the primary database."""
+
+    def setUp(self) -> None:
+        """Setup router for test case."""
+        self.router = routers.ReplicaRouter()
+
+    def test_read(self) -> None:
+        """Tests reads go to replica, writes go to the primary database."""
+        assert self.router.db_for_read(DictionaryElement) == _REPLICA
+        assert self.router.db_for_write(DictionaryElement) == 'default'
+
+    def test_read_your_writes(self) -> None:
+        """Tests reads go to the primary database after write."""
+        self.router.db_for_write(DictionaryVersion)
+
+        assert self.router.db_for_read(DictionaryElement) == 'default'
+
+    def test_use_primary(self) -> None:
+        """Tests reads go to the primary database inside use_primary block."""
+        with routers.use_primary():
+            assert self.router.db_for_read(DictionaryElement) == 'default'
+        assert self.router.db_for_read(DictionaryElement) == _REPLICA
+
+    def test_users(self) -> None:
+        """Tests users and sessions are read from the primary database."""
+        from django.contrib.auth.models import User  # noqa: WPS433
+
+        assert self.router.db_for_read(User) == 'default'
+
+    @override_settings(DATABASE_REPLICAS=())
+    def test_without_replicas(self) -> None:
+        """Tests all reads go to the primary database without replicas."""
+        assert self.router.db_for_read(DictionaryElement) == 'default'
+
+    def test_admin_requests(self) -> None:
+        """Tests reads of admin requests go to the primary database."""
+        factory = RequestFactory()
+        middleware = PrimaryDatabaseMiddleware(_read_database)
+        amiddleware = async_to_sync(PrimaryDatabaseMiddleware(_aread_database))  # type: ignore[no-untyped-call]
+
+        assert middleware(factory.get('/admin/')).content == b'default'
+        assert middleware(factory.get('/refbooks/')).content == _REPLICA.encode()
+        assert amiddleware(factory.get('/admin/')).content == b'default'
+        assert amiddleware(factory.get('/refbooks/')).content == _REPLICA.encode()
+
+
+@override_settings(DATABASE_REPLICAS=(_REPLICA,), DATABASE_REPLICA_PIN_SECONDS=60)
+class TestClientPin(SimpleTestCase):
+    """This is test of pins of clients to the primary database after their writes."""
+
+    def test_clients_are_pinned_separately(self) -> None:
+        """Tests reads of client go to the primary database after its write, reads of other client go to replica."""
+        factory = RequestFactory()
+        write = PrimaryDatabaseMiddleware(_write_database)
+        read = PrimaryDatabaseMiddleware(_read_database)
+
+        written = write(factory.get('/refbooks/'))
+        factory.cookies.load({'primary_pinned_until': written.cookies['primary_pinned_until'].value})
+
+        assert written.content == b'default'
+        assert read(factory.get('/refbooks/')).content == b'default'
+        assert read(RequestFactory().get('/refbooks/')).content == _REPLICA.encode()
+        assert routers.ReplicaRouter().db_for_read(DictionaryElement) == _REPLICA
+
+    def test_pin_is_limited(self) -> None:
+        """Tests client cannot pin itself for longer time than pin after write."""
+        factory = RequestFactory()
+        factory.cookies.load({'primary_pinned_until': str(time.time() + 120)})
+        read_later = PrimaryDatabaseMiddleware(_read_database_later)
+
+        assert read_later(factory.get('/refbooks/')).content == _REPLICA.encode()
+
+    @override_settings(DATABASE_REPLICAS=(_REPLICA, 'replica_2'))
+    def test_one_replica_per_client(self) -> None:
+        """Tests all reads of client in pin block, such as reads of one request, go to one replica."""
+        router = routers.ReplicaRouter()
+
+        with routers.client_pin(0):
+            replicas = {router.db_for_read(DictionaryElement) for _ in range(20)}
+
+        assert len(replicas) == 1
+
+
+@override_settings(DATABASE_REPLICAS=(_REPLICA,))
+class TestReplicaRouterTransactions(TestCase):
+    """This is test of routing of reads inside transactions."""
+
+    def test_read_in_transaction(self) -> None:
+        """Tests reads inside transaction go to the primary database."""
+        assert routers.ReplicaRouter().db_for_read(DictionaryElement) == 'default'
@@ -0,0 +1,23 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+
+@override_settings(ROOT_URLCONF='tests.test_apps.test_dictionaries.async_urls')
+class TestAsyncAPIView(TestCase):
+    """This is test of dispatch of api views with coroutine handlers."""
+
+    def setUp(self) -> None:
+        """Setup client for test case."""
+        self.client = APIClient()
+
+    def test_options(self) -> None:
+        """Tests synchronous handler of metadata is called too."""
+        response = self.client.options('/refbooks/')
+
+        assert response.status_code == 200
+        assert response.json()['name']
+
+    def test_method_not_allowed(self) -> None:
+        """Tests methods without handlers are not allowed."""
+        assert self.client.put('/refbooks/').status_code == 405
+        assert self.client.generic('PROPFIND', '/refbooks/').status_code == 405
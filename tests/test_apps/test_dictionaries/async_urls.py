@@ -0,0 +1,10 @@
+from django.urls import include, path
+
+from server.apps.dictionaries.urls import api_urlpatterns
+from server.urls import urlpatterns as server_urlpatterns
+
+# Urls of ASGI server, async views are registered in place of sync ones.
+urlpatterns = [
+    path('refbooks/', include(api_urlpatterns(asynchronous=True))),
+    *server_urlpatterns,
+]
@@ -4,6 +4,10 @@ from django.utils.timezone import now
 from server.apps.dictionaries import models
 from tests.utils.base import faker
 
+# Wide ranges of dates, so unique dates of versions are not exhausted by tests.
+_DATES_RANGE_START = '-10y'
+_DATES_RANGE_END = '+10y'
+
 
 class DictionaryFactory(factory.django.DjangoModelFactory):
     """This is factory for generate Dictionary model."""
@@ -39,7 +43,7 @@ class DictionaryVersionFactory(factory.django.DjangoModelFactory):
             max_chars=models.DICTIONARY_VERSION_VERSION_MAX_LENGTH,
         ),
     )
-    date = factory.LazyAttribute(lambda _: faker.unique.past_date())
+    date = factory.LazyAttribute(lambda _: faker.unique.past_date(start_date=_DATES_RANGE_START))
 
 
 class DictionaryVersionWithCurrentDateFactory(DictionaryVersionFactory):
@@ -51,7 +55,7 @@ class DictionaryVersionWithCurrentDateFactory(DictionaryVersionFactory):
 class DictionaryVersionWithFutureDateFactory(DictionaryVersionFactory):
     """This is factory for generate DictionaryVersion model with date at future."""
 
-    date = factory.LazyAttribute(lambda _: faker.unique.future_date())
+    date = factory.LazyAttribute(lambda _: faker.unique.future_date(end_date=_DATES_RANGE_END))
 
 
 class DictionaryElementFactory(factory.django.DjangoModelFactory):
@@ -0,0 +1,163 @@
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from server.apps.dictionaries import models, selectors, services
+from tests.test_apps.test_dictionaries import factories
+
+_ELEMENTS_URI = '/admin/dictionaries/dictionaryelement/'
+_VERSIONS_URI = '/admin/dictionaries/dictionaryversion/'
+_ELEMENTS = (('1', 'first'), ('2', 'second'), ('3', 'third'))
+_UPLOADED_ELEMENTS = (('2', 'changed'), ('4', 'fourth'))
+_ELEMENTS_AFTER_UPLOAD = (
+    ('1', 'first'),
+    ('2', 'changed'),
+    ('3', 'third'),
+    ('4', 'fourth'),
+)
+
+
+def _pairs(version: models.DictionaryVersion) -> list[tuple[str, str]]:
+    return list(selectors.dictionary_version_element_pairs(version_id=version.id).order_by('code'))
+
+
+def _revision(version: models.DictionaryVersion) -> str:
+    return models.DictionaryVersion.objects.get(pk=version.id).revision
+
+
+class TestElementServices(TestCase):
+    """This is test of bulk changes of dictionary elements by batches."""
+
+    def setUp(self) -> None:
+        """Setup version with elements."""
+        self.version = factories.DictionaryVersionFactory()
+        services.dictionary_version_import(
+            version_id=self.version.id,
+            elements=_ELEMENTS,
+        )
+        self.other = factories.DictionaryElementFactory(code='1', value='other')
+        self.revision = _revision(self.version)
+
+    def test_update(self) -> None:
+        """Tests elements selected by value are updated by batches and versions are touched."""
+        elements = models.DictionaryElement.objects.filter(code__in=['1', '2'])
+
+        updated = services.dictionary_elements_update(elements=elements, element_value='new', batch_size=1)
+
+        assert updated == 3
+        assert self._element_values() == ['new', 'new', 'third']
+        assert _pairs(self.other.version) == [('1', 'new')]
+        assert _revision(self.version) != self.revision
+
+    def test_delete(self) -> None:
+        """Tests elements are deleted by batches and versions are touched."""
+        elements = models.DictionaryElement.objects.filter(version=self.version).exclude(code='2')
+
+        deleted = services.dictionary_elements_delete(elements=elements, batch_size=1)
+
+        assert deleted == 2
+        assert self._element_values() == ['second']
+        assert _pairs(self.other.version) == [('1', 'other')]
+        assert _revision(self.version) != self.revision
+
+    def test_upload(self) -> None:
+        """Tests uploaded elements are added or changed, with replace the other elements are deleted."""
+        uploaded = services.dictionary_version_upload(
+            version_id=self.version.id,
+            elements=_UPLOADED_ELEMENTS,
+            batch_size=1,
+        )
+
+        assert uploaded == 2
+        assert _pairs(self.version) == list(_ELEMENTS_AFTER_UPLOAD)
+        assert _revision(self.version) != self.revision
+
+        replaced_elements = [('5', 'fifth')]
+        services.dictionary_version_upload(version_id=self.version.id, elements=replaced_elements, replace=True)
+
+        assert self._element_values() == ['fifth']
+
+    def _element_values(self) -> list[str]:
+        return [element_value for _, element_value in _pairs(self.version)]
+
+
+class TestElementAdmin(TestCase):
+    """This is test of admin pages and bulk actions of dictionary elements."""
+
+    def setUp(self) -> None:
+        """Setup version with elements and logged in superuser."""
+        self.version = factories.DictionaryVersionFactory()
+        services.dictionary_version_import(
+            version_id=self.version.id,
+            elements=_ELEMENTS,
+        )
+        self.other = factories.DictionaryElementFactory(code='1', value='other')
+        self.version_uri = '{0}?version__id__exact={1}'.format(_ELEMENTS_URI, self.version.id)
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+
+    def test_version_change_page(self) -> None:
+        """Tests version page links to elements of version instead of forms of all elements."""
+        response = self.client.get('{0}{1}/change/'.format(_VERSIONS_URI, self.version.id))
+
+        assert response.status_code == 200
+        assert self.version_uri in response.content.decode()
+        assert not response.context['inline_admin_formsets']
+
+    @override_settings(DICTIONARIES_ADMIN_ELEMENTS_MAX_COUNT=2)
+    def test_list_of_version(self) -> None:
+        """Tests elements are filtered by version and searched, count is bounded."""
+        response = self.client.get(self.version_uri)
+        searched = self.client.get(self.version_uri, {'q': 'sec'})
+
+        assert response.context['cl'].result_count == 2
+        assert [element.code for element in searched.context['cl'].result_list] == ['2']
+
+    def test_version_autocomplete(self) -> None:
+        """Tests versions are picked by search instead of select of all versions."""
+        response = self.client.get('/admin/autocomplete/', {
+            'app_label': 'dictionaries',
+            'model_name': 'dictionaryelement',
+            'field_name': 'version',
+            'term': self.version.version,
+        })
+
+        found = response.json()['results']
+        assert [version['id'] for version in found] == [str(self.version.id)]
+
+    def test_set_value(self) -> None:
+        """Tests value is set to all elements of filtered list selected across pages."""
+        action = {'action': 'set_value', 'select_across': '1', '_selected_action': ['0']}
+        form_response = self.client.post(self.version_uri, action)
+        action.update(apply='Apply', element_value='new')
+        response = self.client.post(self.version_uri, action)
+
+        assert form_response.status_code == 200
+        assert response.status_code == 302
+        assert {element_value for _, element_value in _pairs(self.version)} == {'new'}
+        assert _pairs(self.other.version) == [('1', 'other')]
+
+    def test_delete_selected(self) -> None:
+        """Tests selected elements are deleted after confirmation."""
+        selected = models.DictionaryElement.objects.filter(version=self.version, code__in=['1', '2'])
+        action = {'action': 'delete_selected', '_selected_action': list(selected.values_list('id', flat=True))}
+        confirm_response = self.client.post(_ELEMENTS_URI, action)
+        assert _pairs(self.version) == list(_ELEMENTS)
+
+        action.update(apply='Apply')
+        self.client.post(_ELEMENTS_URI, action)
+
+        assert 'Delete 2 selected elements' in confirm_response.content.decode()
+        assert _pairs(self.version) == [('3', 'third')]
+
+    def test_upload_elements(self) -> None:
+        """Tests elements uploaded to version are added or changed."""
+        response = self.client.post(_VERSIONS_URI, {
+            'action': 'upload_elements',
+            '_selected_action': [self.version.id],
+            'apply': 'Apply',
+            'elements': SimpleUploadedFile('elements.csv', b'code,value\n2,changed\n4,fourth\n'),
+        })
+
+        assert response.status_code == 302
+        assert _pairs(self.version) == list(_ELEMENTS_AFTER_UPLOAD)
@@ -0,0 +1,65 @@
+from django.http import StreamingHttpResponse
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from tests.test_apps.test_dictionaries import factories
+
+_ASYNC_URLCONF = 'tests.test_apps.test_dictionaries.async_urls'
+
+
+class TestAsyncViews(TestCase):
+    """This is test of async views registered under ASGI, responses are the same as of sync views."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        self.element = factories.DictionaryElementFactory(version=self.version)
+        factories.DictionaryElementFactory.create_batch(2, version=self.version)
+        self.uri = '/refbooks/{0}/'.format(self.version.dictionary.id)
+
+    def test_dictionaries(self) -> None:
+        """Tests dictionary list."""
+        self._assert_same_responses('/refbooks/')
+
+    def test_elements(self) -> None:
+        """Tests elements list, its page and versioned url."""
+        self._assert_same_responses('{0}elements'.format(self.uri))
+        self._assert_same_responses('{0}elements?pagination=cursor&page_size=2'.format(self.uri))
+        content_location = self.client.get('{0}elements'.format(self.uri))['Content-Location']
+        self._assert_same_responses(content_location)
+
+    def test_stream(self) -> None:
+        """Tests streamed elements."""
+        uri = '{0}elements?pagination=stream'.format(self.uri)
+        sync_response = self.client.get(uri)
+        with override_settings(ROOT_URLCONF=_ASYNC_URLCONF):
+            async_response = self.client.get(uri)
+
+        assert isinstance(sync_response, StreamingHttpResponse)
+        assert isinstance(async_response, StreamingHttpResponse)
+        assert b''.join(async_response.streaming_content) == b''.join(sync_response.streaming_content)
+
+    def test_check_element(self) -> None:
+        """Tests check of one element and of elements batch."""
+        self._assert_same_responses('{0}check_element?code={1}&value={2}'.format(
+            self.uri,
+            self.element.code,
+            self.element.value,
+        ))
+        self._assert_same_responses('{0}check_element?code={1}&value=missing'.format(self.uri, self.element.code))
+
+        batch = {'elements': [{'code': self.element.code, 'value': self.element.value}]}
+        sync_response = self.client.post('{0}check_element'.format(self.uri), batch, format='json')
+        with override_settings(ROOT_URLCONF=_ASYNC_URLCONF):
+            async_response = self.client.post('{0}check_element'.format(self.uri), batch, format='json')
+        assert async_response.json() == sync_response.json()
+
+    def _assert_same_responses(self, uri: str) -> None:
+        sync_response = self.client.get(uri)
+        with override_settings(ROOT_URLCONF=_ASYNC_URLCONF):
+            async_response = self.client.get(uri)
+
+        assert async_response.status_code == sync_response.status_code
+        assert async_response.content == sync_response.content
+        assert async_response.get('ETag') == sync_response.get('ETag')
@@ -0,0 +1,73 @@
+import datetime
+
+from django.test import TestCase
+from django.utils.timezone import localdate
+from rest_framework.test import APIClient
+
+from server.apps.dictionaries import services
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestElementsCacheHeadersApi(TestCase):
+    """This is test of Cache-Control and content-addressed urls of /refbooks/<int:dictionary_id>/elements."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        self.elements = factories.DictionaryElementFactory.create_batch(2, version=self.version)
+        self.uri = '/refbooks/{0}/elements'.format(self.version.dictionary.id)
+
+    def test_content_location(self) -> None:
+        """Tests content-addressed url returns the same elements and is immutable."""
+        response = self.client.get(self.uri)
+        assert response.headers['Cache-Control'] == 'public, max-age=60'
+
+        immutable_response = self.client.get(response.headers['Content-Location'])
+
+        assert immutable_response.status_code == 200
+        assert immutable_response.json() == response.json()
+        assert immutable_response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+
+    def test_last_modified(self) -> None:
+        """Tests only response of a given version has Last-Modified, current version is validated by ETag."""
+        response = self.client.get(self.uri)
+        assert 'Last-Modified' not in response.headers
+
+        response = self.client.get(response.headers['Content-Location'])
+
+        assert response.headers['Last-Modified']
+
+    def test_outdated_revision(self) -> None:
+        """Tests content-addressed url is not found after elements changes."""
+        content_location = self.client.get(self.uri).headers['Content-Location']
+
+        self.elements[0].delete()
+
+        assert self.client.get(content_location).status_code == 404
+        assert self.client.get(self.uri).headers['Content-Location'] != content_location
+
+    def test_unknown_version(self) -> None:
+        """Tests content-addressed url of unknown version is not found."""
+        uri = '/refbooks/{0}/versions/unknown/elements@{1}'.format(
+            self.version.dictionary.id,
+            self.version.revision,
+        )
+
+        assert self.client.get(uri).status_code == 404
+
+    def test_max_age_before_next_version(self) -> None:
+        """Tests current version is not cached after start of the next version."""
+        factories.DictionaryVersionFactory(
+            dictionary=self.version.dictionary,
+            date=localdate() + datetime.timedelta(days=1),
+        )
+        services.dictionary_current_version_refresh(dictionary_ids=[self.version.dictionary.id])
+
+        response = self.client.get(self.uri)
+        max_age = int(response.headers['Cache-Control'].rpartition('=')[2])
+        assert 0 <= max_age <= 60
+
+        response = self.client.get(self.uri, {'version': self.version.version})
+
+        assert response.headers['Cache-Control'] == 'public, max-age=60'
@@ -0,0 +1,67 @@
+import json
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from server.apps.dictionaries.snapshots import snapshot_registry
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestCheckElementBatchApi(TestCase):
+    """This is api test of batch validation /refbooks/<int:dictionary_id>/check_element."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.uri = '/refbooks/{0}/check_element'
+        snapshot_registry.clear()
+
+    def test_check_elements_batch_api(self) -> None:  # noqa: WPS210
+        """Tests each element has result in the order of request."""
+        version = factories.DictionaryVersionFactory()
+        first, second = factories.DictionaryElementFactory.create_batch(2, version=version)
+        request_data = {
+            'elements': [
+                {'code': first.code, 'value': first.value},
+                {'code': second.code, 'value': first.value},
+                {'code': second.code, 'value': second.value},
+            ],
+        }
+
+        uri = self.uri.format(version.dictionary.id)
+
+        response = self.client.post(uri, request_data, format='json')
+        assert response.status_code == 200
+
+        response_elements = json.loads(response.content)['elements']
+        assert [element['exists'] for element in response_elements] == [True, False, True]
+        assert response_elements[1]['code'] == second.code
+
+    def test_check_elements_batch_with_version(self) -> None:
+        """Tests elements are checked in passed version."""
+        future_version = factories.DictionaryVersionWithFutureDateFactory()
+        element = factories.DictionaryElementFactory(version=future_version)
+        request_data = {'elements': [{'code': element.code, 'value': element.value}]}
+        uri = self.uri.format(future_version.dictionary.id)
+
+        response = self.client.post(uri, request_data, format='json')
+        assert not response.json()['elements'][0]['exists']
+
+        request_data['version'] = future_version.version
+        response = self.client.post(uri, request_data, format='json')
+        assert response.json()['elements'][0]['exists']
+
+    def test_check_elements_batch_with_exception(self) -> None:
+        """Tests elements are validated by check element api rules."""
+        version = factories.DictionaryVersionFactory()
+        uri = self.uri.format(version.dictionary.id)
+
+        response = self.client.post(uri, {'elements': []}, format='json')
+        assert response.status_code == 400
+
+        request_data = {'elements': [{'code': 'code'}]}
+        response = self.client.post(uri, request_data, format='json')
+        assert response.status_code == 400
+
+        errors = response.json()['extra']['fields']
+        assert 'value' in errors['elements'][0]
@@ -0,0 +1,29 @@
+from django.test import SimpleTestCase, override_settings
+
+from server.apps.dictionaries.checks import check_markers_cache
+
+_LOCAL_MEMORY_CACHE = 'django.core.cache.backends.locmem.LocMemCache'
+_SHARED_CACHE = 'django.core.cache.backends.db.DatabaseCache'
+
+
+def _caches(backend: str) -> dict[str, dict[str, str]]:
+    return {'default': {'BACKEND': backend, 'LOCATION': 'cache'}}
+
+
+class TestMarkersCacheCheck(SimpleTestCase):
+    """This is test of check that markers of changes are shared by worker processes."""
+
+    @override_settings(CACHES=_caches(_LOCAL_MEMORY_CACHE), WEB_CONCURRENCY=1)
+    def test_one_worker(self) -> None:
+        """Tests local memory cache is allowed for one worker."""
+        assert not check_markers_cache(None)
+
+    @override_settings(CACHES=_caches(_LOCAL_MEMORY_CACHE), WEB_CONCURRENCY=4)
+    def test_local_memory_cache(self) -> None:
+        """Tests local memory cache is an error for many workers."""
+        assert [error.id for error in check_markers_cache(None)] == ['dictionaries.E001']
+
+    @override_settings(CACHES=_caches(_SHARED_CACHE), WEB_CONCURRENCY=4)
+    def test_shared_cache(self) -> None:
+        """Tests shared cache is allowed for many workers."""
+        assert not check_markers_cache(None)
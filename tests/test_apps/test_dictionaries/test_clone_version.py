@@ -0,0 +1,156 @@
+import datetime
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from server.apps.dictionaries import models, selectors, services
+from tests.test_apps.test_dictionaries import factories
+
+_CHANGELIST_URI = '/admin/dictionaries/dictionaryversion/'
+
+
+def _pairs(version_id: int) -> list[tuple[str, str]]:
+    return list(selectors.dictionary_version_element_pairs(version_id=version_id).order_by('code'))
+
+
+class TestCloneVersion(TestCase):
+    """This is test of clone of dictionary version with changes of elements."""
+
+    def setUp(self) -> None:
+        """Setup version with elements."""
+        self.version = factories.DictionaryVersionFactory()
+        services.dictionary_version_import(
+            version_id=self.version.id,
+            elements=[('1', 'first'), ('2', 'second'), ('3', 'third')],
+        )
+
+    def test_clone(self) -> None:
+        """Tests clone has all elements in the same order and source is not changed."""
+        clone = services.dictionary_version_clone(
+            version_id=self.version.id,
+            version='clone',
+            date=datetime.date(2020, 1, 1),
+        )
+
+        elements = selectors.dictionary_version_element_list(version_id=clone.id)
+        assert [element.code for element in elements] == ['1', '2', '3']
+        assert clone.dictionary_id == self.version.dictionary_id
+        assert _pairs(clone.id) == _pairs(self.version.id)
+
+    def test_clone_with_changes(self) -> None:
+        """Tests removed codes are deleted, added and changed elements are written."""
+        clone = services.dictionary_version_clone(
+            version_id=self.version.id,
+            version='clone',
+            date=datetime.date(2020, 1, 1),
+            elements=[('2', 'changed'), ('4', 'fourth')],
+            removed_codes=['3'],
+        )
+
+        assert _pairs(clone.id) == [
+            ('1', 'first'),
+            ('2', 'changed'),
+            ('4', 'fourth'),
+        ]
+        assert _pairs(self.version.id) == [
+            ('1', 'first'),
+            ('2', 'second'),
+            ('3', 'third'),
+        ]
+
+    def test_clone_existing_version(self) -> None:
+        """Tests version of dictionary should be unique."""
+        with pytest.raises(ValidationError):
+            services.dictionary_version_clone(
+                version_id=self.version.id,
+                version=self.version.version,
+                date=datetime.date(2020, 1, 1),
+            )
+
+        assert models.DictionaryVersion.objects.count() == 1
+
+
+class TestCloneVersionAdmin(TestCase):
+    """This is test of clone version action of dictionary version admin."""
+
+    def setUp(self) -> None:
+        """Setup version with elements and logged in superuser."""
+        self.version = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory(version=self.version, code='1', value='first')
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+
+    def test_form_is_shown(self) -> None:
+        """Tests the form of new version is shown on action."""
+        response = self.client.post(_CHANGELIST_URI, {
+            'action': 'clone_version',
+            '_selected_action': [self.version.id],
+        })
+
+        assert response.status_code == 200
+        assert 'form' in response.context
+
+    def test_clone(self) -> None:
+        """Tests version is cloned with uploaded changes of elements."""
+        response = self.client.post(_CHANGELIST_URI, {
+            'action': 'clone_version',
+            '_selected_action': [self.version.id],
+            'apply': 'Clone',
+            'version': 'clone',
+            'date': '2020-01-01',
+            'elements': SimpleUploadedFile('elements.csv', b'code,value\n2,second\n'),
+            'removed_codes': '1\n',
+        })
+
+        clone = models.DictionaryVersion.objects.get(version='clone')
+        assert response.status_code == 302
+        assert response['Location'].endswith('/{0}/change/'.format(clone.id))
+        assert _pairs(clone.id) == [('2', 'second')]
+
+    def test_invalid_elements(self) -> None:
+        """Tests errors of uploaded elements are shown on the form."""
+        response = self.client.post(_CHANGELIST_URI, {
+            'action': 'clone_version',
+            '_selected_action': [self.version.id],
+            'apply': 'Clone',
+            'version': 'clone',
+            'date': '2020-01-01',
+            'elements': SimpleUploadedFile('elements.csv', b'code,value\n2,\n'),
+        })
+
+        assert response.status_code == 200
+        assert response.context['form'].errors['elements']
+        assert not models.DictionaryVersion.objects.filter(version='clone').exists()
+
+    @override_settings(DICTIONARIES_IMPORT_BATCH_SIZE=1)
+    def test_invalid_elements_after_written_batch(self) -> None:
+        """Tests rows are written while they are read, version is not created by invalid row after written batch."""
+        response = self.client.post(_CHANGELIST_URI, {
+            'action': 'clone_version',
+            '_selected_action': [self.version.id],
+            'apply': 'Clone',
+            'version': 'clone',
+            'date': '2020-01-01',
+            'elements': SimpleUploadedFile('elements.csv', b'code,value\n2,second\n3,\n'),
+        })
+
+        assert response.context['form'].errors['elements']
+        assert not models.DictionaryVersion.objects.filter(version='clone').exists()
+
+    def test_action_requires_add_permission(self) -> None:
+        """Tests user allowed to change but not to add versions does not see the action."""
+        user = get_user_model().objects.create_user('editor', 'editor@example.com', 'password', is_staff=True)
+        permissions = Permission.objects.filter(codename__in=['view_dictionaryversion', 'change_dictionaryversion'])
+        user.user_permissions.add(*permissions)
+        self.client.force_login(user)
+
+        response = self.client.get(_CHANGELIST_URI)
+
+        action_field = response.context['action_form'].fields['action']
+        actions = [choice[0] for choice in action_field.choices]
+        assert 'upload_elements' in actions
+        assert 'clone_version' not in actions
@@ -0,0 +1,171 @@
+import datetime
+from io import StringIO
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db.models import RestrictedError
+from django.test import TestCase
+
+from server.apps.dictionaries import models, selectors, services, snapshots
+from tests.test_apps.test_dictionaries import factories
+
+_BASE_ELEMENTS = {'1': 'first', '2': 'second', '3': 'third', '4': 'fourth'}.items()
+_DELTA_ELEMENTS = {'1': 'first', '2': 'changed', '4': 'fourth', '5': 'fifth'}.items()
+
+
+def _pairs(version: models.DictionaryVersion) -> list[tuple[str, str]]:
+    return list(selectors.dictionary_version_element_pairs(version_id=version.id).order_by('code'))
+
+
+class _VersionsTestCase(TestCase):
+    def setUp(self) -> None:
+        """Setup two versions with mostly the same elements."""
+        snapshots.snapshot_registry.clear()
+        self.dictionary = factories.DictionaryFactory()
+        self.base = self._version('base', 1, _BASE_ELEMENTS)
+        self.version = self._version('delta', 2, _DELTA_ELEMENTS)
+        self.pairs = _pairs(self.version)
+
+    def _version(self, version: str, day: int, elements) -> models.DictionaryVersion:
+        dictionary_version = factories.DictionaryVersionFactory(
+            dictionary=self.dictionary,
+            version=version,
+            date=datetime.date(2020, 1, day),
+        )
+        services.dictionary_version_import(version_id=dictionary_version.id, elements=elements)
+        dictionary_version.refresh_from_db()
+        return dictionary_version
+
+    def _compact(self) -> int:
+        return services.dictionary_version_compact(version_id=self.version.id, base_version_id=self.base.id)
+
+    def _changes(self) -> dict[str, list[object]]:
+        diff = selectors.dictionary_version_diff(from_version_id=self.base.id, to_version_id=self.version.id)
+        return {name: list(elements) for name, elements in diff.items()}
+
+    def _exists(self, code: str, value: str) -> bool:  # noqa: WPS110
+        return snapshots.element_exists(dictionary_id=self.dictionary.id, code=code, value=value, version='delta')
+
+
+class TestCompactVersions(_VersionsTestCase):
+    """This is test of versions stored as differences from base version."""
+
+    def test_compact(self) -> None:
+        """Tests only differences are stored and elements of version are not changed."""
+        revision = self.version.revision
+        changes = self._changes()
+
+        stored = self._compact()
+
+        assert stored == 3
+        self.version.refresh_from_db()
+        assert self.version.base_version == self.base
+        assert self.version.revision == revision
+        assert _pairs(self.version) == self.pairs
+        assert self._changes() == changes
+
+    def test_compacted_version_api(self) -> None:
+        """Tests elements and check of compacted version are the same."""
+        self._compact()
+        uri = '/refbooks/{0}/elements'.format(self.dictionary.id)
+
+        response = self.client.get(uri, {'version': 'delta'})
+
+        codes = sorted(element['code'] for element in response.json()['elements'])
+        assert codes == ['1', '2', '4', '5']
+        assert self._exists('1', 'first')
+        assert not self._exists('3', 'third')
+
+    def test_base_changes_expand_delta_versions(self) -> None:
+        """Tests changes of base version elements do not change elements and revision of delta version."""
+        self._compact()
+        assert self._exists('1', 'first')
+        revision = models.DictionaryVersion.objects.get(pk=self.version.id).revision
+
+        element = models.DictionaryElement.objects.get(version=self.base, code='1')
+        element.value = 'changed'
+        element.save()
+
+        self.version.refresh_from_db()
+        assert self.version.base_version is None
+        assert self.version.revision == revision
+        assert _pairs(self.version) == self.pairs
+        assert self._exists('1', 'first')
+
+    def test_compact_validation(self) -> None:
+        """Tests chains of delta versions are not allowed."""
+        self._compact()
+        other = self._version('other', 3, _BASE_ELEMENTS)
+
+        with pytest.raises(ValidationError):
+            services.dictionary_version_compact(version_id=other.id, base_version_id=self.version.id)
+        with pytest.raises(ValidationError):
+            services.dictionary_version_compact(version_id=self.base.id, base_version_id=other.id)
+
+
+class TestExpandVersions(_VersionsTestCase):
+    """This is test of compact_versions command and expand of delta versions."""
+
+    def test_expand(self) -> None:
+        """Tests expanded version stores all elements and base version can be deleted then."""
+        self._compact()
+        with pytest.raises(RestrictedError):
+            self.base.delete()
+
+        assert services.dictionary_version_expand(version_id=self.version.id) == 4
+
+        self.version.refresh_from_db()
+        assert self.version.base_version is None
+        self.base.delete()
+        assert _pairs(self.version) == self.pairs
+
+    def test_command(self) -> None:
+        """Tests versions are compacted against last full version unless they differ too much."""
+        different = self._version('different', 3, [('6', 'sixth'), ('7', 'seventh')])
+        stdout = StringIO()
+
+        call_command('compact_versions', self.dictionary.code, max_ratio=0.75, stdout=stdout)
+
+        assert 'Compacted 1 versions.' in stdout.getvalue()
+        assert models.DictionaryVersion.objects.get(pk=self.version.id).base_version == self.base
+        assert models.DictionaryVersion.objects.get(pk=different.id).base_version is None
+
+    def test_command_expand(self) -> None:
+        """Tests all delta versions are expanded by command."""
+        self._compact()
+        stdout = StringIO()
+
+        call_command('compact_versions', self.dictionary.code, expand=True, stdout=stdout)
+
+        assert 'Expanded 1 versions.' in stdout.getvalue()
+        assert not models.DictionaryVersion.objects.filter(base_version__isnull=False).exists()
+        assert _pairs(self.version) == self.pairs
+
+    def test_upload_delta_version(self) -> None:
+        """Tests uploaded elements override elements of base version and restore removed ones."""
+        self._compact()
+
+        uploaded_elements = [('1', 'new'), ('3', 'back')]
+        services.dictionary_version_upload(version_id=self.version.id, elements=uploaded_elements)
+
+        assert _pairs(self.version) == [
+            ('1', 'new'),
+            ('2', 'changed'),
+            ('3', 'back'),
+            ('4', 'fourth'),
+            ('5', 'fifth'),
+        ]
+        assert _pairs(self.base) == sorted(_BASE_ELEMENTS)
+        assert self._exists('3', 'back')
+
+    def test_import_replace_delta_version(self) -> None:
+        """Tests replaced elements of delta version are stored in full."""
+        self._compact()
+        with pytest.raises(ValidationError):
+            services.dictionary_version_import_prepare(dictionary=self.dictionary, version='delta')
+
+        services.dictionary_version_import_prepare(dictionary=self.dictionary, version='delta', replace=True)
+        services.dictionary_version_import(version_id=self.version.id, elements=[('9', 'ninth')])
+
+        assert _pairs(self.version) == [('9', 'ninth')]
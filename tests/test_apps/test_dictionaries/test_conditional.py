@@ -0,0 +1,90 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from server.apps.dictionaries import selectors
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestElementsConditionalApi(TestCase):
+    """This is test of conditional requests /refbooks/<int:dictionary_id>/elements."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        self.elements = factories.DictionaryElementFactory.create_batch(2, version=self.version)
+        self.uri = '/refbooks/{0}/elements'.format(self.version.dictionary.id)
+
+    def test_not_modified(self) -> None:
+        """Tests response with the same ETag is not modified and elements are not queried."""
+        response = self.client.get(self.uri)
+        assert response.status_code == 200
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.uri, HTTP_IF_NONE_MATCH=response.headers['ETag'])
+
+        assert response.status_code == 304
+        assert response.headers['ETag']
+
+    def test_modified_by_element_changes(self) -> None:
+        """Tests ETag is changed on elements changes."""
+        etag = self.client.get(self.uri).headers['ETag']
+
+        self.elements[0].delete()
+        response = self.client.get(self.uri, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert len(response.json()['elements']) == 1
+
+    def test_etag_depends_on_query(self) -> None:
+        """Tests different representations have different ETag."""
+        etag = self.client.get(self.uri).headers['ETag']
+
+        response = self.client.get(self.uri, {'pagination': 'stream'}, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+
+    def test_elements_without_version(self) -> None:
+        """Tests dictionary without current version has ETag."""
+        dictionary = factories.DictionaryFactory()
+
+        response = self.client.get('/refbooks/{0}/elements'.format(dictionary.id))
+
+        assert response.headers['ETag']
+        assert selectors.dictionary_element_list(dictionary_id=dictionary.id).count() == 0
+
+
+class TestRefbooksConditionalApi(TestCase):
+    """This is test of conditional requests /refbooks/."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.uri = '/refbooks/'
+
+    def test_not_modified(self) -> None:
+        """Tests response with the same ETag is not modified without queries until dictionaries are changed."""
+        factories.DictionaryVersionFactory()
+        etag = self.client.get(self.uri).headers['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.uri, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+        factories.DictionaryFactory()
+        response = self.client.get(self.uri, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    def test_modified_by_dictionary_changes(self) -> None:
+        """Tests ETag is changed on changes of dictionaries and their versions."""
+        version = factories.DictionaryVersionFactory()
+        etag = self.client.get(self.uri).headers['ETag']
+
+        version.dictionary.name = 'renamed'
+        version.dictionary.save()
+        renamed_etag = self.client.get(self.uri).headers['ETag']
+        version.delete()
+        deleted_etag = self.client.get(self.uri).headers['ETag']
+
+        assert len({etag, renamed_etag, deleted_etag}) == 3
@@ -0,0 +1,91 @@
+import datetime
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.timezone import localdate
+
+from server.apps.dictionaries import models, selectors, services
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestCurrentVersion(TestCase):
+    """This is test of materialized current version of dictionary."""
+
+    def test_current_version_on_versions_changes(self) -> None:
+        """Tests current version follows saves and deletes of versions."""
+        past_version = factories.DictionaryVersionFactory()
+        dictionary = past_version.dictionary
+        future_version = factories.DictionaryVersionWithFutureDateFactory(dictionary=dictionary)
+        current_version = factories.DictionaryVersionWithCurrentDateFactory(dictionary=dictionary)
+
+        dictionary.refresh_from_db()
+        assert dictionary.current_version == current_version
+        assert dictionary.next_version_date == future_version.date
+
+        current_version.delete()
+
+        dictionary.refresh_from_db()
+        assert dictionary.current_version == past_version
+
+    def test_first_version_date_on_versions_changes(self) -> None:
+        """Tests start date of the first version follows saves and deletes of versions."""
+        current_version = factories.DictionaryVersionWithCurrentDateFactory()
+        dictionary = current_version.dictionary
+        past_version = factories.DictionaryVersionFactory(dictionary=dictionary)
+
+        dictionary.refresh_from_db()
+        assert dictionary.first_version_date == past_version.date
+
+        past_version.delete()
+
+        dictionary.refresh_from_db()
+        assert dictionary.first_version_date == localdate()
+
+    def test_stale_current_version(self) -> None:
+        """Tests version started after last refresh is current before and after scheduled refresh."""
+        version = factories.DictionaryVersionFactory()
+        dictionary = version.dictionary
+        models.Dictionary.objects.filter(pk=dictionary.id).update(
+            current_version=None,
+            next_version_date=localdate() - datetime.timedelta(days=1),
+        )
+
+        assert selectors.dictionary_current_version_id(dictionary_id=dictionary.id) == version.id
+
+        stdout = StringIO()
+        call_command('refresh_current_versions', stdout=stdout)
+
+        dictionary.refresh_from_db()
+        assert dictionary.current_version == version
+        assert dictionary.next_version_date is None
+        assert 'of 1 dictionaries' in stdout.getvalue()
+
+    def test_stale_current_version_in_admin(self) -> None:
+        """Tests list of dictionaries in admin shows version started after last refresh."""
+        version = factories.DictionaryVersionFactory(version='started')
+        models.Dictionary.objects.filter(pk=version.dictionary.id).update(
+            current_version=None,
+            next_version_date=localdate(),
+        )
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+
+        response = self.client.get('/admin/dictionaries/dictionary/')
+
+        assert '<td class="field-active_version">started</td>' in response.content.decode()
+
+    def test_refresh_by_date(self) -> None:
+        """Tests future version becomes current at its start date."""
+        version = factories.DictionaryVersionWithFutureDateFactory()
+        dictionary = version.dictionary
+
+        services.dictionary_current_version_refresh(date=version.date)
+
+        dictionary.refresh_from_db()
+        assert dictionary.current_version == version
+
+    def test_current_version_of_unknown_dictionary(self) -> None:
+        """Tests unknown dictionary has no current version."""
+        assert selectors.dictionary_current_version_id(dictionary_id=0) is None
@@ -0,0 +1,86 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from server.apps.dictionaries import models, selectors, services, snapshots
+from tests.test_apps.test_dictionaries import factories
+
+_BASE_ELEMENTS = (('1', 'first'), ('2', 'second'), ('3', 'third'))
+_DELTA_ELEMENTS = (('1', 'first'), ('2', 'changed'), ('4', 'fourth'))
+
+
+def _pairs(version: models.DictionaryVersion) -> list[tuple[str, str]]:
+    return list(selectors.dictionary_version_element_pairs(version_id=version.id).order_by('code'))
+
+
+def _version(dictionary: models.Dictionary, day: int, elements) -> models.DictionaryVersion:
+    dictionary_version = factories.DictionaryVersionFactory(dictionary=dictionary, date=datetime.date(2020, 1, day))
+    services.dictionary_version_import(version_id=dictionary_version.id, elements=elements)
+    return dictionary_version
+
+
+class TestDeltaVersionWrites(TestCase):
+    """This is test of bulk changes of elements of base and delta versions."""
+
+    def setUp(self) -> None:
+        """Setup base version and delta version stored as differences from it."""
+        snapshots.snapshot_registry.clear()
+        dictionary = factories.DictionaryFactory()
+        self.base = _version(dictionary, 1, _BASE_ELEMENTS)
+        self.delta = _version(dictionary, 2, _DELTA_ELEMENTS)
+        services.dictionary_version_compact(version_id=self.delta.id, base_version_id=self.base.id)
+        self.elements = models.DictionaryElement.objects.filter(version=self.delta)
+
+    def test_base_writes(self) -> None:
+        """Tests bulk changes of base version expand delta version before."""
+        base_elements = models.DictionaryElement.objects.filter(version=self.base)
+
+        services.dictionary_elements_update(elements=base_elements.filter(code='1'), element_value='new')
+        services.dictionary_elements_delete(elements=base_elements.filter(code='2'))
+        services.dictionary_version_upload(version_id=self.base.id, elements=[('3', 'new')])
+
+        self.delta.refresh_from_db()
+        assert self.delta.base_version is None
+        assert _pairs(self.delta) == sorted(_DELTA_ELEMENTS)
+
+    def test_delete(self) -> None:
+        """Tests deleted element of delta version does not restore element of base version."""
+        deleted = services.dictionary_elements_delete(elements=self.elements.filter(code__in=['2', '4']))
+
+        assert deleted == 2
+        assert _pairs(self.delta) == [('1', 'first')]
+        assert self.elements.get(code='2').is_removed
+        assert not self.elements.filter(code='4').exists()
+
+    def test_update(self) -> None:
+        """Tests elements marked removed are not changed by update of all elements of delta version."""
+        updated = services.dictionary_elements_update(elements=self.elements, element_value='same')
+
+        assert updated == 2
+        assert _pairs(self.delta) == [
+            ('1', 'first'),
+            ('2', 'same'),
+            ('4', 'same'),
+        ]
+
+    def test_admin_delete(self) -> None:
+        """Tests element of delta version deleted in admin is marked removed."""
+        element = self.elements.get(code='2')
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+
+        self.client.post('/admin/dictionaries/dictionaryelement/{0}/delete/'.format(element.id), {'post': 'yes'})
+
+        assert _pairs(self.delta) == [('1', 'first'), ('4', 'fourth')]
+
+    def test_admin_labels(self) -> None:
+        """Tests admin tells that delta version and its elements list have only changes from base version."""
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+
+        change_page = self.client.get('/admin/dictionaries/dictionaryversion/{0}/change/'.format(self.delta.id))
+        elements_page = self.client.get('/admin/dictionaries/dictionaryelement/', {'version__id__exact': self.delta.id})
+
+        assert 'Changes of version {0} from base version'.format(self.delta) in change_page.content.decode()
+        assert 'is stored as changes from base version' in elements_page.content.decode()
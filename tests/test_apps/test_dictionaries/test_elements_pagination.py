@@ -0,0 +1,86 @@
+import json
+from unittest import skipUnless
+
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from server.apps.dictionaries import models, selectors, streaming
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestElementsPaginationApi(TestCase):
+    """This is api test of cursor pagination and streaming /refbooks/<int:dictionary_id>/elements."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        self.elements = factories.DictionaryElementFactory.create_batch(5, version=self.version)
+        self.uri = '/refbooks/{0}/elements'.format(self.version.dictionary.id)
+
+    def test_cursor_pagination_by_id(self) -> None:
+        """Tests pages contain all elements in order of creation."""
+        codes = self._fetch_pages({'pagination': 'cursor', 'page_size': 2})
+
+        assert codes == [element.code for element in self.elements]
+
+    def test_cursor_pagination_by_code(self) -> None:
+        """Tests pages contain all elements ordered by code."""
+        codes = self._fetch_pages({'pagination': 'cursor', 'page_size': 2, 'ordering': 'code'})
+
+        assert codes == sorted(element.code for element in self.elements)
+
+    def test_stream(self) -> None:
+        """Tests streamed response is the same as regular one."""
+        response = self.client.get(self.uri, {'pagination': 'stream'})
+        assert response.status_code == 200
+        assert isinstance(response, StreamingHttpResponse)
+
+        streamed_body = json.loads(b''.join(response.streaming_content))
+
+        assert streamed_body == json.loads(self.client.get(self.uri).content)
+
+    def test_stream_by_chunks(self) -> None:
+        """Tests each part of streamed response contains up to chunk size elements."""
+        elements = models.DictionaryElement.objects.filter(version=self.version)
+
+        parts = list(streaming.stream_elements(elements, chunk_size=2))
+
+        response_body = json.loads(''.join(parts))
+
+        assert len(parts) == 5
+        assert len(response_body['elements']) == len(self.elements)
+
+    def test_with_exception(self) -> None:
+        """Tests unknown pagination is not allowed."""
+        response = self.client.get(self.uri, {'pagination': 'unknown'})
+
+        assert response.status_code == 400
+
+    def _fetch_pages(self, request_data) -> list[str]:
+        codes: list[str] = []
+        response_body = self.client.get(self.uri, request_data).json()
+        codes.extend(element['code'] for element in response_body['elements'])
+        while response_body['next']:
+            response_body = self.client.get(response_body['next']).json()
+            codes.extend(element['code'] for element in response_body['elements'])
+        return codes
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Query plan is checked for SQLite.')
+class TestElementsPagePlan(TestCase):
+    """This is test of query plan of page of elements of full version."""
+
+    def test_full_version_page(self) -> None:
+        """Tests page is read by index of (version, id) without union of base elements and sorting."""
+        version = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory.create_batch(3, version=version)
+        elements = selectors.dictionary_version_element_list(version_id=version.id)
+
+        plan = elements.filter(id__gt=0)[:2].explain().upper()
+
+        assert 'ELEMENT_VERSION_ID_IDX' in plan
+        assert 'TEMP B-TREE' not in plan
+        assert 'MULTI-INDEX OR' not in plan
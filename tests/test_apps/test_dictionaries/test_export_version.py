@@ -0,0 +1,82 @@
+import csv
+import gzip
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from server.apps.dictionaries import exports, files, formats
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestExportVersion(TestCase):
+    """This is test of export of dictionary versions by command and /refbooks/<int:dictionary_id>/export."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        self.elements = factories.DictionaryElementFactory.create_batch(3, version=self.version)
+        self.pairs = [[element.code, element.value] for element in self.elements]
+        self.uri = '/refbooks/{0}/export'.format(self.version.dictionary.id)
+
+    def test_download_csv(self) -> None:
+        """Tests current version is downloaded as gzip-compressed CSV."""
+        response = self.client.get(self.uri)
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'] == 'application/gzip'
+        assert response.headers['Content-Disposition'].endswith('.csv.gz')
+        rows = csv.reader(io.StringIO(self._decompress(response)))
+        assert list(rows) == [['code', 'value'], *self.pairs]
+
+        not_modified = self.client.get(self.uri, HTTP_IF_NONE_MATCH=response.headers['ETag'])
+        assert not_modified.status_code == 304
+
+    def test_download_jsonl(self) -> None:  # noqa: WPS210
+        """Tests version is downloaded as gzip-compressed JSON lines, only a given version has Last-Modified."""
+        query = {'version': self.version.version, 'file_format': 'jsonl'}
+        response = self.client.get(self.uri, query)
+
+        lines = self._decompress(response).splitlines()
+        elements = [json.loads(line) for line in lines]
+        assert elements == [{'code': code, 'value': element_value} for code, element_value in self.pairs]
+        assert response.headers['Last-Modified']
+        assert 'Last-Modified' not in self.client.get(self.uri).headers
+
+    def test_download_unknown_version(self) -> None:
+        """Tests unknown version is not found."""
+        response = self.client.get(self.uri, {'version': 'unknown'})
+
+        assert response.status_code == 404
+
+    def test_export_command(self) -> None:
+        """Tests exported file is imported back."""
+        directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        path = directory / 'elements.jsonl.gz'
+
+        call_command('export_version', self.version.dictionary.code, str(path))
+
+        with files.open_elements_file(str(path)) as stream:
+            pairs = list(formats.read_elements(stream, formats.FORMAT_JSONL))
+        assert pairs == [tuple(pair) for pair in self.pairs]
+        with pytest.raises(CommandError, match='Unknown format'):
+            call_command('export_version', self.version.dictionary.code, str(directory / 'elements.txt'))
+
+    def test_export_by_chunks(self) -> None:
+        """Tests uncompressed export is written by parts of chunk size."""
+        parts = list(
+            exports.stream_version_export(self.version.id, formats.FORMAT_CSV, compress=False, chunk_size=2),
+        )
+        lines = b''.join(parts).decode().splitlines()
+
+        assert len(parts) == 3
+        assert lines[1:] == [','.join(pair) for pair in self.pairs]
+
+    def _decompress(self, response) -> str:
+        return gzip.decompress(b''.join(response.streaming_content)).decode()
@@ -0,0 +1,83 @@
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from server.apps.dictionaries import models, selectors
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestImportVersionCommand(TestCase):
+    """This is test of import_version management command."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.dictionary = factories.DictionaryFactory()
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+    def test_import_csv(self) -> None:
+        """Tests new version is created with all elements by several batches."""
+        path = self.directory / 'elements.csv'
+        path.write_text('value,code\nfirst,1\n"sec,ond",2\nthird,3\n', encoding='utf-8')
+        stdout = StringIO()
+
+        self._import_version('v1', path, date='2020-01-01', batch_size=2, stdout=stdout)
+
+        version = models.DictionaryVersion.objects.get(dictionary=self.dictionary, version='v1')
+        pairs = list(selectors.dictionary_version_element_pairs(version_id=version.id).order_by('code'))
+        assert pairs == [('1', 'first'), ('2', 'sec,ond'), ('3', 'third')]
+        assert stdout.getvalue().count('elements/s') == 2
+        self.dictionary.refresh_from_db()
+        assert self.dictionary.current_version == version
+
+    def test_import_gzip_jsonl_replace(self) -> None:
+        """Tests elements of existing version are replaced and revision is changed."""
+        version = factories.DictionaryVersionFactory(dictionary=self.dictionary)
+        factories.DictionaryElementFactory.create_batch(3, version=version)
+        path = self.directory / 'elements.jsonl.gz'
+        with gzip.open(path, 'wt', encoding='utf-8') as stream:
+            stream.write(json.dumps({'code': 'код', 'value': 'значение'}))
+
+        call_command('import_version', self.dictionary.code, version.version, str(path), replace=True)
+
+        assert list(selectors.dictionary_version_element_pairs(version_id=version.id)) == [('код', 'значение')]
+        assert models.DictionaryVersion.objects.get(pk=version.id).revision != version.revision
+
+    def test_invalid_file_changes_nothing(self) -> None:
+        """Tests invalid row rolls back whole import."""
+        path = self.directory / 'elements.jsonl'
+        long_value = 'b' * 301
+        path.write_text('{{"code": "a", "value": "a"}}\n{{"code": "b", "value": "{0}"}}'.format(long_value))
+
+        with pytest.raises(CommandError, match='Line 2: value'):
+            self._import_version('v1', path, date='2020-01-01', batch_size=1)
+
+        assert not models.DictionaryVersion.objects.filter(dictionary=self.dictionary).exists()
+
+    def test_duplicate_code(self) -> None:
+        """Tests duplicate codes are rejected."""
+        path = self.directory / 'elements.csv'
+        path.write_text('code,value\n1,a\n1,b\n', encoding='utf-8')
+
+        with pytest.raises(CommandError, match='Line 3: duplicate code'):
+            call_command('import_version', self.dictionary.code, 'v1', str(path), date='2020-01-01')
+
+    def test_invalid_target(self) -> None:
+        """Tests elements are not appended to version with elements and unknown dictionary is reported."""
+        element = factories.DictionaryElementFactory(version__dictionary=self.dictionary)
+        path = self.directory / 'elements.csv'
+        path.write_text('code,value\n1,a\n', encoding='utf-8')
+
+        with pytest.raises(CommandError, match='already has elements'):
+            call_command('import_version', self.dictionary.code, element.version.version, str(path))
+
+        with pytest.raises(CommandError, match='does not exist'):
+            call_command('import_version', 'unknown', 'v1', 'elements.csv')
+
+    def _import_version(self, version: str, path: Path, **options) -> None:
+        call_command('import_version', self.dictionary.code, version, str(path), **options)
@@ -0,0 +1,27 @@
+import datetime
+
+from django_test_migrations.contrib.unittest_case import MigratorTestCase
+
+
+class TestVersionRevisionMigration(MigratorTestCase):
+    """This is test of revisions of versions existing before migration."""
+
+    migrate_from = ('dictionaries', '0004_dictionary_current_version')
+    migrate_to = ('dictionaries', '0005_version_revision')
+
+    def prepare(self) -> None:
+        """Create versions before migration."""
+        dictionary_model = self.old_state.apps.get_model('dictionaries', 'Dictionary')
+        version_model = self.old_state.apps.get_model('dictionaries', 'DictionaryVersion')
+        dictionary = dictionary_model.objects.create(code='code', name='name')
+        for day in (1, 2):
+            date = datetime.date(2020, 1, day)
+            version_model.objects.create(dictionary=dictionary, version=str(day), date=date)
+
+    def test_revisions_are_unique(self) -> None:
+        """Tests every existing version gets its own revision."""
+        version_model = self.new_state.apps.get_model('dictionaries', 'DictionaryVersion')
+
+        revisions = set(version_model.objects.values_list('revision', flat=True))
+
+        assert len(revisions) == 2
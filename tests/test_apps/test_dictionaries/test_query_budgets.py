@@ -0,0 +1,103 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from server.apps.core import queries
+from server.apps.dictionaries import snapshots
+from tests.test_apps.test_dictionaries import factories
+
+# Rows added between requests, queries of pages must not depend on amount of rows.
+_ADDED_ROWS = 5
+# Similar statements of one request, such as savepoints of session and version lookups.
+_MAX_REPEATS = 2
+
+
+class QueryBudgetTestCase(TestCase):
+    """Base test case, which checks that queries of pages do not grow with amount of rows."""
+
+    def assert_constant_queries(self, uri: str, add_rows) -> None:
+        """Check that page makes the same queries after rows are added and has no N+1 queries."""
+        with queries.recorded_queries() as query_stats:
+            self._get(uri)
+            max_queries = query_stats.count
+
+        add_rows()
+        with queries.query_budget(max_queries=max_queries, max_repeats=_MAX_REPEATS):
+            self._get(uri)
+
+    def _get(self, uri: str) -> None:
+        # Cold caches, so pages read rows from database.
+        cache.clear()
+        snapshots.snapshot_registry.clear()
+        assert status.is_success(self.client.get(uri).status_code)
+
+
+class TestApiQueryBudgets(QueryBudgetTestCase):
+    """This is test of constant amount of queries of api views."""
+
+    def setUp(self) -> None:
+        """Setup dictionary with current version for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        self.element = factories.DictionaryElementFactory(version=self.version)
+        self.uri = '/refbooks/{0}/'.format(self.version.dictionary.id)
+
+    def test_dictionary_list(self) -> None:
+        """Tests list of dictionaries."""
+        self.assert_constant_queries('/refbooks/', self._add_dictionaries)
+        self.assert_constant_queries('/refbooks/?date={0}'.format(self.version.date), self._add_dictionaries)
+
+    def test_element_list(self) -> None:
+        """Tests list of elements."""
+        self.assert_constant_queries('{0}elements'.format(self.uri), self._add_elements)
+
+    def test_check_element(self) -> None:
+        """Tests check of element."""
+        uri = '{0}check_element?code={1}&value={2}'.format(self.uri, self.element.code, self.element.value)
+        self.assert_constant_queries(uri, self._add_elements)
+
+    def _add_dictionaries(self) -> None:
+        factories.DictionaryVersionFactory.create_batch(_ADDED_ROWS, date=self.version.date)
+
+    def _add_elements(self) -> None:
+        factories.DictionaryElementFactory.create_batch(_ADDED_ROWS, version=self.version)
+
+
+class TestAdminQueryBudgets(QueryBudgetTestCase):
+    """This is test of constant amount of queries of admin pages."""
+
+    def setUp(self) -> None:
+        """Setup version with element and logged in superuser."""
+        self.version = factories.DictionaryVersionFactory()
+        self.element = factories.DictionaryElementFactory(version=self.version)
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+
+    def test_changelists(self) -> None:
+        """Tests lists of dictionaries, versions and elements."""
+        for model in ('dictionary', 'dictionaryversion', 'dictionaryelement'):
+            with self.subTest(model=model):
+                self.assert_constant_queries('/admin/dictionaries/{0}/'.format(model), self._add_rows)
+
+    def test_dictionary_change(self) -> None:
+        """Tests change form of dictionary with list of versions."""
+        uri = '/admin/dictionaries/dictionary/{0}/change/'.format(self.version.dictionary.id)
+        self.assert_constant_queries(uri, self._add_versions)
+
+    def test_version_change(self) -> None:
+        """Tests change form of version and list of its elements."""
+        uri = '/admin/dictionaries/dictionaryversion/{0}/change/'.format(self.version.id)
+        self.assert_constant_queries(uri, self._add_elements)
+        uri = '/admin/dictionaries/dictionaryelement/?version__id__exact={0}'.format(self.version.id)
+        self.assert_constant_queries(uri, self._add_elements)
+
+    def _add_rows(self) -> None:
+        factories.DictionaryElementFactory.create_batch(_ADDED_ROWS)
+
+    def _add_elements(self) -> None:
+        factories.DictionaryElementFactory.create_batch(_ADDED_ROWS, version=self.version)
+
+    def _add_versions(self) -> None:
+        factories.DictionaryVersionWithFutureDateFactory.create_batch(_ADDED_ROWS, dictionary=self.version.dictionary)
@@ -0,0 +1,153 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import TestCase
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from server.apps.dictionaries import caches, services
+from server.apps.dictionaries.models import DictionaryElement, DictionaryVersion, new_revision
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestResponseCache(TestCase):
+    """This is test of shared cache of encoded elements list responses."""
+
+    def setUp(self) -> None:
+        """Setup empty cache for test case."""
+        cache.clear()
+        self.response_cache = caches.ResponseCache(
+            alias='default',
+            ttl=60,
+            fill_timeout=5,
+            max_size=10,
+            formats=('json',),
+        )
+        self.key = caches.element_list_key(version_id=1, revision='revision', response_format='json')
+        self.fills = 0
+
+    def test_single_flight_fill(self) -> None:
+        """Tests cold entry is filled once by concurrent requests."""
+        async def requests() -> list[bytes]:  # noqa: WPS430
+            return await asyncio.gather(*(
+                self.response_cache.aget_or_fill(self.key, self._fill)
+                for _ in range(5)
+            ))
+
+        assert set(async_to_sync(requests)()) == {b'content'}  # type: ignore[no-untyped-call]
+        assert self.fills == 1
+
+    def test_oversized_content(self) -> None:
+        """Tests content greater than max size is not stored and its lookups are misses, but requests do not wait."""
+        self.response_cache.max_size = 1
+        labels = {'cache': 'responses', 'result': 'hit'}
+        hits = REGISTRY.get_sample_value('cache_requests_total', labels)
+
+        for _ in range(2):
+            async_to_sync(self.response_cache.aget_or_fill)(self.key, self._fill)  # type: ignore[no-untyped-call]
+
+        assert self.fills == 2
+        assert REGISTRY.get_sample_value('cache_requests_total', labels) == hits
+
+    def test_lagging_content(self) -> None:
+        """Tests content, which is not current for the key after fill, is not stored."""
+        for _ in range(2):
+            async_to_sync(self.response_cache.aget_or_fill)(  # type: ignore[no-untyped-call]
+                self.key,
+                self._fill,
+                self._is_current,
+            )
+
+        assert self.fills == 2
+
+    async def _fill(self) -> bytes:
+        self.fills += 1
+        await asyncio.sleep(0.01)
+        return b'content'
+
+    def _is_current(self) -> bool:
+        # Replica applied a change after key was made.
+        return False
+
+
+class TestElementsResponseCacheApi(TestCase):
+    """This is test of cached responses of /refbooks/<int:dictionary_id>/elements."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        cache.clear()
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        self.element = factories.DictionaryElementFactory(version=self.version)
+        self.uri = '/refbooks/{0}/elements'.format(self.version.dictionary.id)
+
+    def test_cached_response(self) -> None:
+        """Tests response is served from cache until elements are saved."""
+        response = self.client.get(self.uri)
+        # Update by query does not send signals, cache is not invalidated.
+        DictionaryElement.objects.filter(pk=self.element.id).update(value='changed')
+
+        assert self.client.get(self.uri).content == response.content
+        assert response.headers['Content-Type'] == 'application/json'
+
+        self.element.refresh_from_db()
+        self.element.save()
+
+        elements = self.client.get(self.uri).json()['elements']
+        assert elements == [{'code': self.element.code, 'value': 'changed'}]
+
+    def test_stale_entry_is_not_reachable(self) -> None:
+        """Tests entry of version filled before change of revision is not served, though it is not dropped."""
+        uri = '{0}?version={1}'.format(self.uri, self.version.version)
+        self.client.get(uri)
+        DictionaryElement.objects.filter(pk=self.element.id).update(value='changed')
+        DictionaryVersion.objects.filter(pk=self.version.id).update(revision=new_revision())
+
+        elements = self.client.get(uri).json()['elements']
+        assert elements == [{'code': self.element.code, 'value': 'changed'}]
+
+    def test_formats(self) -> None:
+        """Tests responses in different formats and media type parameters are cached separately."""
+        msgpack_response = self.client.get(self.uri, HTTP_ACCEPT='application/msgpack')
+        indented_response = self.client.get(self.uri, HTTP_ACCEPT='application/json; indent=2')
+
+        assert msgpack_response.headers['Content-Type'] == 'application/msgpack'
+        assert indented_response.content.startswith(b'{\n  "elements"')
+        assert self.client.get(self.uri).json() == indented_response.json()
+
+    def test_import_invalidates_cache(self) -> None:
+        """Tests elements loaded by import are returned after commit."""
+        version = factories.DictionaryVersionWithFutureDateFactory(dictionary=self.version.dictionary)
+        uri = '{0}?version={1}'.format(self.uri, version.version)
+        assert self.client.get(uri).json() == {'elements': []}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            services.dictionary_version_import(version_id=version.id, elements=[('code', 'value')])
+
+        elements = self.client.get(uri).json()['elements']
+        assert elements == [{'code': 'code', 'value': 'value'}]
+
+
+class TestDictionaryListResponseCacheApi(TestCase):
+    """This is test of cached responses of /refbooks/."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        cache.clear()
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        self.uri = '/refbooks/?date={0}'.format(self.version.date)
+
+    def test_cached_response(self) -> None:
+        """Tests list by date is served from cache without queries until dictionaries or versions are changed."""
+        response = self.client.get(self.uri)
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(self.uri)
+        assert cached_response.content == response.content
+
+        factories.DictionaryVersionFactory(date=self.version.date)
+
+        dictionaries = self.client.get(self.uri).json()['refbooks']
+        assert len(dictionaries) == 2
@@ -0,0 +1,78 @@
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from server.apps.core.renderers import MessagePackRenderer, packb
+from server.apps.dictionaries import models
+from server.apps.dictionaries.serializers import DictionaryElementSerializer, DictionarySerializer
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestResponsesWithoutSerializers(TestCase):
+    """This is test of responses rendered from rows without model serializers."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory.create_batch(3, version=self.version)
+        self.elements = models.DictionaryElement.objects.filter(version=self.version).order_by('id')
+        self.uri = '/refbooks/{0}/elements'.format(self.version.dictionary.id)
+
+    def test_dictionaries(self) -> None:
+        """Tests dictionary list is the same as given by serializer."""
+        response = self.client.get('/refbooks/')
+
+        serializer = DictionarySerializer(models.Dictionary.objects.all(), many=True)
+        assert response.json() == {'refbooks': serializer.data}
+
+    def test_elements(self) -> None:
+        """Tests elements are the same as given by serializer."""
+        response = self.client.get(self.uri)
+
+        serializer = DictionaryElementSerializer(self.elements, many=True)
+        assert response.json() == {'elements': serializer.data}
+
+    def test_elements_page(self) -> None:
+        """Tests page of elements is the same as given by serializer."""
+        response = self.client.get(self.uri, {'pagination': 'cursor', 'page_size': '2'})
+
+        serializer = DictionaryElementSerializer(self.elements[:2], many=True)
+        assert response.json()['elements'] == serializer.data
+
+
+class TestMessagePackResponses(TestCase):
+    """This is test of elements list rendered to MessagePack by Accept header."""
+
+    def setUp(self) -> None:
+        """Setup test data for test case."""
+        self.client = APIClient()
+        self.version = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory.create_batch(3, version=self.version)
+        self.uri = '/refbooks/{0}/elements'.format(self.version.dictionary.id)
+        self.output = self.client.get(self.uri).json()
+
+    def test_elements(self) -> None:
+        """Tests elements are rendered to MessagePack with its own ETag."""
+        response = self.client.get(self.uri, HTTP_ACCEPT=MessagePackRenderer.media_type)
+
+        assert response['Content-Type'] == MessagePackRenderer.media_type
+        assert response.content == packb(self.output)
+        assert 'Accept' in response['Vary']
+        assert response['ETag'] != self.client.get(self.uri)['ETag']
+
+    def test_stream(self) -> None:
+        """Tests streamed elements are a sequence of MessagePack maps."""
+        response = self.client.get(self.uri, {'pagination': 'stream'}, HTTP_ACCEPT=MessagePackRenderer.media_type)
+
+        assert response['Content-Type'] == MessagePackRenderer.media_type
+        assert isinstance(response, StreamingHttpResponse)
+        assert b''.join(response.streaming_content) == b''.join(
+            packb(element) for element in self.output['elements']
+        )
+
+    def test_json_by_default(self) -> None:
+        """Tests JSON is rendered for any accepted media type."""
+        response = self.client.get(self.uri, HTTP_ACCEPT='*/*')
+
+        assert response['Content-Type'] == 'application/json'
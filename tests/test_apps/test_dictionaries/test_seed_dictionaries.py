@@ -0,0 +1,87 @@
+import dataclasses
+import datetime
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db.models import Count
+from django.test import TestCase
+from django.utils.timezone import localdate
+
+from server.apps.dictionaries import models, seeding
+
+_CONFIG = seeding.SeedConfig(
+    dictionaries=20,
+    versions=3,
+    elements=2000,
+    skew=1.2,
+    future_share=0.5,
+    seed=1,
+)
+_TODAY = datetime.date(2020, 1, 1)
+
+
+class TestSeedPlan(TestCase):
+    """This is test of generated cardinalities and distributions of synthetic dictionaries."""
+
+    def test_deterministic(self) -> None:
+        """Tests the same seed gives the same data and another seed gives other data."""
+        plan = seeding.seed_plan(_CONFIG, today=_TODAY)
+        other_config = dataclasses.replace(_CONFIG, seed=2)
+
+        assert seeding.seed_plan(_CONFIG, today=_TODAY) == plan
+        assert seeding.seed_plan(other_config, today=_TODAY) != plan
+
+    def test_distributions(self) -> None:
+        """Tests sizes are skewed, versions are limited, a part of dictionaries has future versions."""
+        plan = seeding.seed_plan(_CONFIG, today=_TODAY)
+
+        sizes = [dictionary.size for dictionary in plan]
+        assert sizes == sorted(sizes, reverse=True)
+        assert sizes[0] > sizes[-1] * 10
+        future = 0
+        for dictionary in plan:
+            assert list(dictionary.dates) == sorted(set(dictionary.dates))
+            past_dates = [date for date in dictionary.dates if date <= _TODAY]
+            assert len(past_dates) <= _CONFIG.versions
+            future += len(dictionary.dates) - len(past_dates)
+        assert 0 < future < len(plan)
+
+
+class TestSeedDictionariesCommand(TestCase):
+    """This is test of seed_dictionaries management command."""
+
+    def test_seed(self) -> None:
+        """Tests dictionaries are created with versions and elements of planned sizes by batches."""
+        stdout = StringIO()
+
+        self._seed(batch_size=500, verbosity=2, stdout=stdout)
+
+        plan = {dictionary.code: dictionary for dictionary in seeding.seed_plan(_CONFIG)}
+        versions = models.DictionaryVersion.objects.annotate(elements=Count('dictionaryelement'))
+        for version in versions.select_related('dictionary'):
+            assert version.elements == plan[version.dictionary.code].size
+        planned_versions = sum(len(dictionary.dates) for dictionary in plan.values())
+        assert models.DictionaryVersion.objects.count() == planned_versions
+        assert not models.Dictionary.objects.filter(current_version__isnull=True).exists()
+        assert models.Dictionary.objects.filter(next_version_date__gt=localdate()).exists()
+        assert 'elements/s' in stdout.getvalue()
+
+    def test_existing_prefix(self) -> None:
+        """Tests dictionaries are not seeded twice with the same prefix."""
+        self._seed()
+
+        with pytest.raises(CommandError, match='already exist'):
+            self._seed()
+
+    def _seed(self, **options) -> None:
+        call_command(
+            'seed_dictionaries',
+            dictionaries=_CONFIG.dictionaries,
+            versions=_CONFIG.versions,
+            elements=_CONFIG.elements,
+            skew=_CONFIG.skew,
+            future_share=_CONFIG.future_share,
+            seed=_CONFIG.seed,
+            **options,
+        )
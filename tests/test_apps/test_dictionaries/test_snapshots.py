@@ -0,0 +1,171 @@
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import TestCase
+
+from server.apps.dictionaries import services, snapshots
+from server.apps.dictionaries.models import DictionaryElement
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestSnapshotRegistry(TestCase):
+    """This is test of in-process snapshots of dictionary versions."""
+
+    def setUp(self) -> None:
+        """Setup empty registry for test case."""
+        cache.clear()
+        self.registry = snapshots.SnapshotRegistry(max_elements=5, ttl=60, alias='default')
+        snapshots.snapshot_registry.clear()
+
+    def test_snapshot_contains_elements(self) -> None:
+        """Tests snapshot contains all pairs of version and nothing else."""
+        version = factories.DictionaryVersionFactory()
+        elements = factories.DictionaryElementFactory.create_batch(3, version=version)
+
+        snapshot = self.registry.get(version.id)
+
+        assert snapshot is not None
+        assert len(snapshot) == len(elements)
+        for element in elements:
+            assert (element.code, element.value) in snapshot
+        assert (elements[0].code, elements[1].value) not in snapshot
+
+    def test_snapshot_loaded_once(self) -> None:
+        """Tests second lookup does not query database."""
+        version = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory.create_batch(3, version=version)
+        self.registry.get(version.id)
+
+        with self.assertNumQueries(0):
+            snapshot = self.registry.get(version.id)
+
+        assert snapshot is self.registry.peek(version.id)
+
+    def test_memory_is_bounded(self) -> None:
+        """Tests least recently used snapshots are dropped and too large versions are not loaded."""
+        first, second = factories.DictionaryVersionFactory.create_batch(2)
+        factories.DictionaryElementFactory.create_batch(3, version=first)
+        factories.DictionaryElementFactory.create_batch(3, version=second)
+        large = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory.create_batch(6, version=large)
+
+        self.registry.get(first.id)
+        self.registry.get(second.id)
+
+        assert self.registry.peek(first.id) is None
+        assert self.registry.peek(second.id) is not None
+        assert self.registry.get(large.id) is None
+
+    def test_resolve_current_version(self) -> None:
+        """Tests current version is resolved without future versions."""
+        version = factories.DictionaryVersionFactory()
+        factories.DictionaryVersionWithFutureDateFactory(dictionary=version.dictionary)
+
+        version_id = self.registry.resolver.resolve(dictionary_id=version.dictionary.id)
+
+        assert version_id == version.id
+        with self.assertNumQueries(0):
+            self.registry.resolver.resolve(dictionary_id=version.dictionary.id)
+
+    def test_element_changes_invalidate_snapshot(self) -> None:
+        """Tests element saves and deletes are visible for check."""
+        element = factories.DictionaryElementFactory()
+        dictionary_id = element.version.dictionary.id
+
+        assert snapshots.element_exists(dictionary_id=dictionary_id, code=element.code, value=element.value)
+
+        element.value = 'changed'
+        element.save()
+        assert snapshots.element_exists(dictionary_id=dictionary_id, code=element.code, value='changed')
+
+        element.delete()
+        assert not snapshots.element_exists(dictionary_id=dictionary_id, code=element.code, value='changed')
+
+    def test_version_changes_invalidate_resolved(self) -> None:
+        """Tests new current version is visible for check."""
+        element = factories.DictionaryElementFactory()
+        dictionary = element.version.dictionary
+        assert snapshots.element_exists(dictionary_id=dictionary.id, code=element.code, value=element.value)
+
+        current_version = factories.DictionaryVersionWithCurrentDateFactory(dictionary=dictionary)
+
+        assert not snapshots.element_exists(dictionary_id=dictionary.id, code=element.code, value=element.value)
+        assert snapshots.snapshot_registry.resolver.resolve(dictionary_id=dictionary.id) == current_version.id
+
+
+class TestElementsExist(TestCase):
+    """This is test of elements check by snapshots."""
+
+    def setUp(self) -> None:
+        """Setup empty registry for test case."""
+        cache.clear()
+        snapshots.snapshot_registry.clear()
+        self.addCleanup(setattr, snapshots.snapshot_registry, 'max_elements', snapshots.snapshot_registry.max_elements)
+
+    def test_elements_exist_for_large_version(self) -> None:
+        """Tests version greater than snapshot limit is checked by one query after lookup of its base version."""
+        version = factories.DictionaryVersionFactory()
+        elements = factories.DictionaryElementFactory.create_batch(3, version=version)
+        snapshots.snapshot_registry.max_elements = 2
+        pairs = [(element.code, element.value) for element in elements]
+        dictionary_id = version.dictionary.id
+
+        assert snapshots.elements_exist(dictionary_id=dictionary_id, pairs=pairs) == [True, True, True]
+        with self.assertNumQueries(2):
+            exists = snapshots.elements_exist(dictionary_id=dictionary_id, pairs=[('missing', 'missing')])
+
+        assert exists == [False]
+
+    def test_aelements_exist(self) -> None:
+        """Tests async check loads snapshot once, then is answered without database."""
+        version = factories.DictionaryVersionFactory()
+        element = factories.DictionaryElementFactory(version=version)
+        pairs = [(element.code, element.value), ('missing', 'missing')]
+        aelements_exist = async_to_sync(snapshots.aelements_exist)  # type: ignore[no-untyped-call]
+
+        assert aelements_exist(dictionary_id=version.dictionary.id, pairs=pairs) == [True, False]
+        with self.assertNumQueries(0):
+            exists = aelements_exist(dictionary_id=version.dictionary.id, pairs=pairs)
+
+        assert exists == [True, False]
+
+
+class TestChangeMarkers(TestCase):
+    """This is test of changes published to snapshots of other processes."""
+
+    def setUp(self) -> None:
+        """Setup registry of other process for test case."""
+        cache.clear()
+        self.registry = snapshots.SnapshotRegistry(max_elements=5, ttl=60, alias='default')
+        snapshots.snapshot_registry.clear()
+
+    def test_changes_of_other_processes(self) -> None:
+        """Tests snapshots and resolved versions of other process are reloaded after commit of changes."""
+        element = factories.DictionaryElementFactory()
+        dictionary_id = element.version.dictionary.id
+        assert self.registry.resolver.resolve(dictionary_id=dictionary_id) == element.version.id
+        assert self.registry.get(element.version.id) is not None
+
+        with self.captureOnCommitCallbacks(execute=True):
+            element.value = 'changed'
+            element.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            current_version = factories.DictionaryVersionWithCurrentDateFactory(dictionary=element.version.dictionary)
+
+        snapshot = self.registry.get(element.version.id)
+        assert snapshot is not None
+        assert (element.code, 'changed') in snapshot
+        assert self.registry.resolver.resolve(dictionary_id=dictionary_id) == current_version.id
+
+    def test_aelements_exist_after_other_process(self) -> None:
+        """Tests async check does not answer by snapshot of revision changed by other process."""
+        element = factories.DictionaryElementFactory()
+        dictionary_id = element.version.dictionary.id
+        pairs = [(element.code, 'changed')]
+        aelements_exist = async_to_sync(snapshots.aelements_exist)  # type: ignore[no-untyped-call]
+        assert aelements_exist(dictionary_id=dictionary_id, pairs=pairs) == [False]
+
+        DictionaryElement.objects.filter(pk=element.pk).update(value='changed')
+        services.dictionary_version_touch(version_ids=[element.version.id])
+        snapshots.snapshot_registry.markers.publish(version_ids=[element.version.id])
+
+        assert aelements_exist(dictionary_id=dictionary_id, pairs=pairs) == [True]
@@ -0,0 +1,104 @@
+import json
+from typing import TypedDict
+
+from django.http import StreamingHttpResponse
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from tests.test_apps.test_dictionaries import factories
+
+
+class _SyncBody(TypedDict, total=False):
+    token: str
+    version: str
+    full: bool
+    elements: list[dict[str, str]]
+    added: list[dict[str, str]]
+    removed: list[dict[str, str]]
+    changed: list[dict[str, str]]
+
+
+class TestSyncApi(TestCase):
+    """This is api test of /refbooks/<int:dictionary_id>/sync."""
+
+    def setUp(self) -> None:
+        """Setup version of client copy and the current version."""
+        self.client = APIClient()
+        self.old_version = factories.DictionaryVersionFactory()
+        factories.DictionaryElementFactory(version=self.old_version, code='kept', value='same')
+        factories.DictionaryElementFactory(version=self.old_version, code='removed', value='gone')
+        self.uri = '/refbooks/{0}/sync'.format(self.old_version.dictionary.id)
+
+    def test_full_then_changes(self) -> None:
+        """Tests first sync returns all elements and next one returns changes since the token."""
+        response_body = self._sync()
+        assert response_body['full']
+        assert len(response_body['elements']) == 2
+
+        current_version = factories.DictionaryVersionWithCurrentDateFactory(dictionary=self.old_version.dictionary)
+        factories.DictionaryElementFactory(version=current_version, code='kept', value='same')
+        factories.DictionaryElementFactory(version=current_version, code='added', value='fresh')
+        token = response_body['token']
+        response_body = self._sync(token=token)
+
+        assert response_body == {
+            'token': response_body['token'],
+            'version': current_version.version,
+            'full': False,
+            'added': [{'code': 'added', 'value': 'fresh'}],
+            'removed': [{'code': 'removed', 'value': 'gone'}],
+            'changed': [],
+        }
+
+    def test_up_to_date(self) -> None:
+        """Tests sync of actual copy returns no changes without comparing elements."""
+        token = self._sync()['token']
+
+        with self.assertNumQueries(3):
+            response_body = self._sync(token=token)
+
+        assert not response_body['full']
+        assert not response_body['added'] + response_body['removed'] + response_body['changed']
+
+    def test_version_changed_in_place(self) -> None:
+        """Tests all elements are returned when version of the token or of the passed revision is changed."""
+        token = self._sync()['token']
+        self.old_version.refresh_from_db()
+        revision = self.old_version.revision
+        assert not self._sync(version=self.old_version.version, revision=revision)['full']
+
+        factories.DictionaryElementFactory(version=self.old_version)
+        assert self._sync(version=self.old_version.version, revision=revision)['full']
+
+        response = self.client.get(self.uri, {'token': token, 'stream': 'true'})
+        assert isinstance(response, StreamingHttpResponse)
+
+        streamed_body = json.loads(b''.join(response.streaming_content))
+        assert streamed_body['full']
+        assert len(streamed_body['elements']) == 3
+
+    @override_settings(DICTIONARIES_SYNC_MAX_CHANGES=1)
+    def test_too_many_changes(self) -> None:
+        """Tests all elements are returned when changes are too many."""
+        current_version = factories.DictionaryVersionWithCurrentDateFactory(dictionary=self.old_version.dictionary)
+        factories.DictionaryElementFactory(version=current_version)
+        self.old_version.refresh_from_db()
+
+        response_body = self._sync(version=self.old_version.version, revision=self.old_version.revision)
+
+        assert response_body['full']
+        assert len(response_body['elements']) == 1
+
+    def test_invalid_token(self) -> None:
+        """Tests forged token, token of another dictionary and version without revision are rejected."""
+        other_uri = '/refbooks/{0}/sync'.format(factories.DictionaryVersionFactory().dictionary.id)
+        other_token = self.client.get(other_uri).json()['token']
+        version = self.old_version.version
+
+        assert self.client.get(self.uri, {'token': other_token}).status_code == 400
+        assert self.client.get(self.uri, {'token': 'forged'}).status_code == 400
+        assert self.client.get(self.uri, {'version': version}).status_code == 400
+        assert self.client.get('/refbooks/0/sync').status_code == 404
+
+    def _sync(self, **query: str) -> _SyncBody:
+        return self.client.get(self.uri, query).json()
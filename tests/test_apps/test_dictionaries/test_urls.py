@@ -5,6 +5,7 @@ from django.test import TestCase
 from django.utils.timezone import now
 from rest_framework.test import APIClient, APIRequestFactory
 
+from server.apps.dictionaries.snapshots import snapshot_registry
 from tests.test_apps.test_dictionaries import factories
 
 
@@ -162,6 +163,7 @@ class TestCheckElementApi(TestCase):
         self.client = APIClient()
         self.factory = APIRequestFactory()
         self.uri = '/refbooks/{0}/check_element'
+        snapshot_registry.clear()
 
     def test_check_element_api(self) -> None:
         """Tests elements api work correctly."""
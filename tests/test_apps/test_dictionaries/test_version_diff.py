@@ -0,0 +1,49 @@
+import json
+
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from tests.test_apps.test_dictionaries import factories
+
+
+class TestVersionDiffApi(TestCase):
+    """This is api test of /refbooks/<int:dictionary_id>/diff."""
+
+    def setUp(self) -> None:
+        """Setup two versions with kept, changed, removed and added elements."""
+        self.client = APIClient()
+        self.from_version = factories.DictionaryVersionFactory()
+        self.to_version = factories.DictionaryVersionWithCurrentDateFactory(dictionary=self.from_version.dictionary)
+        for from_code, from_value in (('kept', 'same'), ('changed', 'old'), ('removed', 'gone')):
+            factories.DictionaryElementFactory(version=self.from_version, code=from_code, value=from_value)
+        for to_code, to_value in (('kept', 'same'), ('changed', 'new'), ('added', 'fresh')):
+            factories.DictionaryElementFactory(version=self.to_version, code=to_code, value=to_value)
+        self.uri = '/refbooks/{0}/diff'.format(self.from_version.dictionary.id)
+
+    def test_diff(self) -> None:
+        """Tests diff with the current version by default."""
+        response = self.client.get(self.uri, {'from': self.from_version.version})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            'added': [{'code': 'added', 'value': 'fresh'}],
+            'removed': [{'code': 'removed', 'value': 'gone'}],
+            'changed': [{'code': 'changed', 'value': 'new', 'previous_value': 'old'}],
+        }
+
+    def test_reversed_diff_stream(self) -> None:
+        """Tests streamed diff is the same as regular one."""
+        query = {'from': self.to_version.version, 'to': self.from_version.version}
+        response = self.client.get(self.uri, {**query, 'stream': 'true'})
+        assert isinstance(response, StreamingHttpResponse)
+
+        streamed_body = json.loads(b''.join(response.streaming_content))
+
+        assert streamed_body == self.client.get(self.uri, query).json()
+        assert streamed_body['removed'] == [{'code': 'added', 'value': 'fresh'}]
+
+    def test_unknown_version(self) -> None:
+        """Tests unknown version is not found and from version is required."""
+        assert self.client.get(self.uri, {'from': 'unknown'}).status_code == 404
+        assert self.client.get(self.uri).status_code == 400